@@ -0,0 +1,90 @@
+# stdlib
+from collections.abc import Callable
+import json
+from pathlib import Path
+from secrets import token_hex
+import tracemalloc
+from typing import Any
+
+# third party
+import pytest
+
+# syft absolute
+import syft as sy
+from syft.node.worker import Worker
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("syft benchmarks")
+    group.addoption(
+        "--memory-baseline",
+        default=None,
+        help="pytest-benchmark JSON file to compare the peak memory against",
+    )
+    group.addoption(
+        "--memory-regression",
+        type=float,
+        default=10.0,
+        help="allowed peak memory increase over the baseline in percent",
+    )
+
+
+@pytest.fixture(scope="session")
+def memory_baseline(request: pytest.FixtureRequest) -> dict[str, int]:
+    path = request.config.getoption("--memory-baseline")
+    if path is None:
+        return {}
+
+    benchmarks = json.loads(Path(path).read_text())["benchmarks"]
+    return {
+        bench["fullname"]: bench["extra_info"]["peak_memory"]
+        for bench in benchmarks
+        if "peak_memory" in bench["extra_info"]
+    }
+
+
+@pytest.fixture
+def measure(
+    benchmark: Any, request: pytest.FixtureRequest, memory_baseline: dict[str, int]
+) -> Callable[[Callable], Any]:
+    """Benchmarks `func` and records its peak memory in the benchmark JSON.
+
+    Peak memory covers allocations visible to tracemalloc, which includes
+    python objects and numpy buffers but not memory allocated inside capnp.
+    """
+    allowed_increase = request.config.getoption("--memory-regression") / 100
+
+    def _measure(func: Callable) -> Any:
+        if hasattr(request.node, "callspec"):
+            benchmark.group = request.node.callspec.id
+
+        tracemalloc.start()
+        try:
+            func()
+            _, peak_memory = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        benchmark.extra_info["peak_memory"] = peak_memory
+
+        if request.node.get_closest_marker("slow") is not None:
+            # large payloads, a single round is enough and keeps the run short
+            result = benchmark.pedantic(func, rounds=1, iterations=1)
+        else:
+            result = benchmark(func)
+
+        baseline = memory_baseline.get(benchmark.fullname)
+        if baseline is not None and peak_memory > baseline * (1 + allowed_increase):
+            pytest.fail(
+                f"Peak memory regressed from {baseline} to {peak_memory} bytes, "
+                f"more than the allowed {allowed_increase:.0%}."
+            )
+        return result
+
+    return _measure
+
+
+@pytest.fixture(scope="session")
+def worker() -> Worker:
+    worker = sy.Worker.named(name=token_hex(8))
+    yield worker
+    worker.cleanup()
@@ -0,0 +1,140 @@
+# stdlib
+from pathlib import Path
+from secrets import token_hex
+import statistics
+from threading import Barrier
+from threading import Thread
+import time
+from typing import Any
+
+# third party
+import pytest
+
+# syft absolute
+from syft.store.locks import FileLockingConfig
+from syft.store.locks import SyftLock
+from syft.store.locks import ThreadingLockingConfig
+
+WRITERS = 16
+WRITES_PER_WRITER = 20
+# time a writer holds the lock, roughly a small store write
+HOLD_TIME = 0.001
+# readers per writer in the read-heavy benchmark
+READ_RATIO = 9
+
+
+class PollingLock(SyftLock):
+    """The lock as it was before the blocking locks, for comparison."""
+
+    def acquire(self, blocking: bool = True) -> bool:
+        start_time = time.time()
+        while time.time() - start_time <= self.timeout:
+            if self._acquire():
+                return True
+            time.sleep(self.retry_interval)
+        return False
+
+
+def threading_lock(tmp_path: Path) -> SyftLock:
+    return SyftLock(ThreadingLockingConfig(lock_name=token_hex(8)))
+
+
+def file_lock(tmp_path: Path) -> SyftLock:
+    return SyftLock(FileLockingConfig(lock_name=token_hex(8), client_path=tmp_path))
+
+
+def polling_lock(tmp_path: Path) -> SyftLock:
+    return PollingLock(ThreadingLockingConfig(lock_name=token_hex(8)))
+
+
+LOCKS = {
+    "threading": threading_lock,
+    "file": file_lock,
+    "polling": polling_lock,
+}
+
+
+def percentile(latencies: list[float], percent: int) -> float:
+    return statistics.quantiles(latencies, n=100, method="inclusive")[percent - 1]
+
+
+def contend(lock: SyftLock) -> list[float]:
+    """Latencies of acquiring the lock while all writers write at once."""
+    latencies: list[float] = []
+    barrier = Barrier(WRITERS)
+
+    def write() -> None:
+        barrier.wait()
+        for _ in range(WRITES_PER_WRITER):
+            start = time.perf_counter()
+            assert lock.acquire(blocking=True)
+            latencies.append(time.perf_counter() - start)
+            time.sleep(HOLD_TIME)
+            lock.release()
+
+    threads = [Thread(target=write) for _ in range(WRITERS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return latencies
+
+
+@pytest.mark.parametrize("lock_type", list(LOCKS))
+def test_lock_contention(lock_type: str, tmp_path: Path, benchmark: Any) -> None:
+    lock = LOCKS[lock_type](tmp_path)
+    benchmark.group = "lock_contention"
+
+    latencies: list[float] = []
+
+    def run() -> None:
+        latencies.extend(contend(lock))
+
+    benchmark.pedantic(run, rounds=3, iterations=1)
+
+    for percent in [50, 95, 99]:
+        benchmark.extra_info[f"p{percent}_ms"] = percentile(latencies, percent) * 1000
+    benchmark.extra_info["max_ms"] = max(latencies) * 1000
+
+
+def contend_reads(lock: SyftLock, shared: bool) -> list[float]:
+    """Latencies of acquiring the lock with READ_RATIO readers per writer, the
+    readers take the lock shared or, as before, exclusively."""
+    latencies: list[float] = []
+    barrier = Barrier(WRITERS)
+
+    def work(thread_index: int) -> None:
+        is_reader = thread_index % (READ_RATIO + 1) != 0
+        acquire = lock.acquire_shared if is_reader and shared else lock.acquire
+        release = lock.release_shared if is_reader and shared else lock.release
+        barrier.wait()
+        for _ in range(WRITES_PER_WRITER):
+            start = time.perf_counter()
+            assert acquire(blocking=True)
+            latencies.append(time.perf_counter() - start)
+            time.sleep(HOLD_TIME)
+            release()
+
+    threads = [Thread(target=work, args=(index,)) for index in range(WRITERS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return latencies
+
+
+@pytest.mark.parametrize("shared", [True, False], ids=["shared", "exclusive"])
+def test_lock_read_contention(shared: bool, tmp_path: Path, benchmark: Any) -> None:
+    lock = threading_lock(tmp_path)
+    benchmark.group = "lock_read_contention"
+
+    latencies: list[float] = []
+
+    def run() -> None:
+        latencies.extend(contend_reads(lock, shared))
+
+    benchmark.pedantic(run, rounds=3, iterations=1)
+
+    for percent in [50, 95, 99]:
+        benchmark.extra_info[f"p{percent}_ms"] = percentile(latencies, percent) * 1000
+    benchmark.extra_info["max_ms"] = max(latencies) * 1000
@@ -0,0 +1,146 @@
+# stdlib
+from collections.abc import Callable
+from functools import partial
+from typing import Any
+
+# third party
+import numpy as np
+import pandas as pd
+import pytest
+
+# syft absolute
+import syft as sy
+from syft.abstract_node import NodeSideType
+from syft.client.api import SyftAPICall
+from syft.node.credentials import SyftSigningKey
+from syft.service.job.job_stash import Job
+from syft.service.sync.sync_state import SyncState
+from syft.types.uid import UID
+
+
+@sy.syft_function(
+    input_policy=sy.ExactMatch(), output_policy=sy.SingleExecutionExactOutput()
+)
+def benchmark_function():
+    return 1
+
+
+def make_jobs(n: int) -> list[Job]:
+    node_uid = UID()
+    requested_by = UID()
+    return [
+        Job(
+            node_uid=node_uid,
+            requested_by=requested_by,
+            result=None,
+            log_id=UID(),
+            parent_job_id=None,
+            user_code_id=UID(),
+            action=None,
+        )
+        for _ in range(n)
+    ]
+
+
+def signed_api_call(request: pytest.FixtureRequest) -> Any:
+    api_call = SyftAPICall(
+        node_uid=UID(),
+        path="action.execute",
+        args=[list(range(100))],
+        kwargs={"name": "benchmark", "data": np.random.rand(1000)},
+    )
+    return api_call.sign(SyftSigningKey.generate())
+
+
+def job_list(request: pytest.FixtureRequest) -> Any:
+    return make_jobs(500)
+
+
+def sync_state(request: pytest.FixtureRequest) -> Any:
+    jobs = make_jobs(200)
+    return SyncState(
+        node_uid=UID(),
+        node_name="benchmark",
+        node_side_type=NodeSideType.HIGH_SIDE,
+        objects={job.id: job for job in jobs},
+        dependencies={job.id: [job.log_id] for job in jobs},
+        permissions={job.id: {f"READ_{job.requested_by}"} for job in jobs},
+        storage_permissions={job.id: {job.node_uid} for job in jobs},
+    )
+
+
+def user_code(request: pytest.FixtureRequest) -> Any:
+    worker = request.getfixturevalue("worker")
+    client = worker.root_client
+    client.code.submit(benchmark_function)
+    return client.code.get_all()[0]
+
+
+def nested_primitives(request: pytest.FixtureRequest) -> Any:
+    return {
+        "ints": list(range(10_000)),
+        "records": [
+            {"id": i, "name": f"name {i}", "score": i * 0.5, "tags": ["a", "b"]}
+            for i in range(1_000)
+        ],
+    }
+
+
+def string_array(request: pytest.FixtureRequest) -> Any:
+    return np.array([f"string {i}" for i in range(100_000)])
+
+
+def dataframe(request: pytest.FixtureRequest) -> Any:
+    n = 100_000
+    return pd.DataFrame(
+        {
+            "int": np.arange(n),
+            "float": np.random.rand(n),
+            "str": [f"row {i}" for i in range(n)],
+        }
+    )
+
+
+def series(request: pytest.FixtureRequest) -> Any:
+    return pd.Series(np.random.rand(100_000), name="series")
+
+
+def numpy_array(nbytes: int) -> Callable[[pytest.FixtureRequest], Any]:
+    return lambda request: np.random.rand(nbytes // 8)
+
+
+PAYLOADS: dict[str, Callable[[pytest.FixtureRequest], Any]] = {
+    "signed_api_call": signed_api_call,
+    "job_list": job_list,
+    "sync_state": sync_state,
+    "user_code": user_code,
+    "nested_primitives": nested_primitives,
+    "string_array": string_array,
+    "dataframe": dataframe,
+    "series": series,
+    "numpy_1KB": numpy_array(1024),
+    "numpy_1MB": numpy_array(1024**2),
+    "numpy_100MB": numpy_array(100 * 1024**2),
+    "numpy_1GB": numpy_array(1024**3),
+}
+
+
+@pytest.fixture(
+    scope="module",
+    params=[
+        pytest.param(name, marks=pytest.mark.slow) if name == "numpy_1GB" else name
+        for name in PAYLOADS
+    ],
+)
+def payload(request: pytest.FixtureRequest) -> Any:
+    return PAYLOADS[request.param](request)
+
+
+def test_serialize(payload: Any, measure: Callable) -> None:
+    measure(partial(sy.serialize, payload, to_bytes=True))
+
+
+def test_deserialize(payload: Any, measure: Callable, benchmark: Any) -> None:
+    blob = sy.serialize(payload, to_bytes=True)
+    benchmark.extra_info["size"] = len(blob)
+    measure(partial(sy.deserialize, blob, from_bytes=True))
@@ -1124,6 +1124,8 @@ except Exception:
 class NodeIdentity(Identity):
     node_name: str
 
+    __serde_intern__ = True
+
     @staticmethod
     def from_api(api: SyftAPI) -> NodeIdentity:
         # stores the name root verify key of the domain node
@@ -21,6 +21,8 @@ SIGNING_KEY_FOR = "SigningKey for"
 class SyftVerifyKey(SyftBaseModel):
     verify_key: VerifyKey
 
+    __serde_intern__ = True
+
     def __init__(self, verify_key: str | VerifyKey):
         if isinstance(verify_key, str):
             verify_key = VerifyKey(bytes.fromhex(verify_key))
@@ -12,7 +12,9 @@ import os
 from pathlib import Path
 import shutil
 import subprocess  # nosec
+import sys
 import tempfile
+from threading import Thread
 from time import sleep
 import traceback
 from typing import Any
@@ -119,6 +121,7 @@ from ..store.mongo_document_store import MongoStoreConfig
 from ..store.sqlite_document_store import SQLiteStoreClientConfig
 from ..store.sqlite_document_store import SQLiteStoreConfig
 from ..types.syft_object import SYFT_OBJECT_VERSION_2
+from ..types.syft_object import SyftMigrationRegistry
 from ..types.syft_object import SyftObject
 from ..types.uid import UID
 from ..util.experimental_flags import flags
@@ -148,6 +151,9 @@ DEFAULT_ROOT_EMAIL = "DEFAULT_ROOT_EMAIL"
 DEFAULT_ROOT_USERNAME = "DEFAULT_ROOT_USERNAME"
 DEFAULT_ROOT_PASSWORD = "DEFAULT_ROOT_PASSWORD"  # nosec
 
+# seconds between the batches migrated in the background with lazy migration
+MIGRATION_SWEEP_PAUSE = 0.1
+
 
 def get_private_key_env() -> str | None:
     return get_env(NODE_PRIVATE_KEY)
@@ -240,6 +246,44 @@ def get_syft_worker_uid() -> str | None:
     return uid
 
 
+def _migration_progress(canonical_name: str) -> Callable[[int, int], None]:
+    """Prints the progress of a migration every tenth of the objects."""
+    printed_tenths = 0
+
+    def report(done: int, total: int) -> None:
+        nonlocal printed_tenths
+        tenths = done * 10 // max(total, 1)
+        if tenths > printed_tenths:
+            printed_tenths = tenths
+            print(f"Migrated {done}/{total} objects of: {canonical_name} table.")
+
+    return report
+
+
+def _index_keys(klass: type) -> set[str]:
+    return set(getattr(klass, "__attr_unique__", [])) | set(
+        getattr(klass, "__attr_searchable__", [])
+    )
+
+
+def _adds_index_keys(object_type: type[SyftObject]) -> bool:
+    """Whether the type has unique or searchable keys an older version of it
+    doesn't have. Objects stored in the older version aren't in the index of
+    those keys until they are migrated."""
+    keys = _index_keys(object_type)
+    versions = SyftMigrationRegistry.__migration_version_registry__.get(
+        object_type.__canonical_name__, {}
+    )
+    for version, fqn in versions.items():
+        if version == object_type.__version__:
+            continue
+        module_name, _, klass_name = fqn.rpartition(".")
+        klass = getattr(sys.modules.get(module_name), klass_name, None)
+        if klass is None or not keys <= _index_keys(klass):
+            return True
+    return False
+
+
 signing_key_env = get_private_key_env()
 node_uid_env = get_node_uid_env()
 
@@ -314,6 +358,7 @@ class Node(AbstractNode):
         enable_warnings: bool = False,
         dev_mode: bool = False,
         migrate: bool = False,
+        lazy_migrate: bool = False,
         in_memory_workers: bool = True,
         smtp_username: str | None = None,
         smtp_password: str | None = None,
@@ -331,6 +376,7 @@ class Node(AbstractNode):
         self.is_subprocess = is_subprocess
         self.name = name or random_name()
         self.enable_warnings = enable_warnings
+        self.lazy_migrate = lazy_migrate
         self.in_memory_workers = in_memory_workers
         self.node_type = NodeType(node_type)
         self.node_side_type = NodeSideType(node_side_type)
@@ -380,6 +426,17 @@ class Node(AbstractNode):
             document_store_config=document_store_config,
         )
 
+        # Objects of the document store are migrated when read, the pending
+        # migrations are finished in the background
+        if lazy_migrate:
+            self.document_store.enable_lazy_migration(
+                AuthedServiceContext(
+                    node=self,
+                    credentials=self.verify_key,
+                    role=ServiceRole.ADMIN,
+                )
+            )
+
         # construct services only after init stores
         self._construct_services()
 
@@ -600,6 +657,7 @@ class Node(AbstractNode):
         queue_port: int | None = None,
         dev_mode: bool = False,
         migrate: bool = False,
+        lazy_migrate: bool = False,
         in_memory_workers: bool = True,
         association_request_auto_approval: bool = False,
     ) -> Self:
@@ -627,6 +685,7 @@ class Node(AbstractNode):
             create_producer=create_producer,
             dev_mode=dev_mode,
             migrate=migrate,
+            lazy_migrate=lazy_migrate,
             in_memory_workers=in_memory_workers,
             reset=reset,
             association_request_auto_approval=association_request_auto_approval,
@@ -706,22 +765,6 @@ class Node(AbstractNode):
                 object_pending_migration,
             )
 
-        # Migrate data for objects in document store
-        for object_type in object_pending_migration:
-            canonical_name = object_type.__canonical_name__
-            object_partition = self.document_store.partitions.get(canonical_name)
-            if object_partition is None:
-                continue
-
-            print(f"Migrating data for: {canonical_name} table.")
-            migration_status = object_partition.migrate_data(
-                to_klass=object_type, context=context
-            )
-            if migration_status.is_err():
-                raise Exception(
-                    f"Failed to migrate data for {canonical_name}. Error: {migration_status.err()}"
-                )
-
         # Track all object types from action store
         action_object_types = [Action, ActionObject]
         action_object_types.extend(ActionObject.__subclasses__())
@@ -735,18 +778,106 @@ class Node(AbstractNode):
                 action_object_pending_migration,
             )
 
-        # Migrate data for objects in action store
-        for object_type in action_object_pending_migration:
+        if self.lazy_migrate:
+            # the partitions migrate their objects when read, the rest is
+            # migrated in the background. Types with new index keys are
+            # migrated now, queries on those keys would miss the objects
+            # not migrated yet
+            lazy_migration = [
+                object_type
+                for object_type in object_pending_migration
+                if not _adds_index_keys(object_type)
+            ]
+            Thread(
+                target=self._sweep_migrations,
+                args=(lazy_migration, context),
+                daemon=True,
+            ).start()
+            object_pending_migration = [
+                object_type
+                for object_type in object_pending_migration
+                if object_type not in lazy_migration
+            ]
+
+        # Partitions are migrated one after the other: a partition holds its
+        # lock while it migrates, and the migrations read other partitions
+        # through the node
+        migrated = []
+        errors = []
+        for object_type in object_pending_migration:
             canonical_name = object_type.__canonical_name__
+            object_partition = self.document_store.partitions.get(canonical_name)
+            if object_partition is None:
+                continue
+
+            print(f"Migrating data for: {canonical_name} table.")
+            migration_status = object_partition.migrate_data(
+                to_klass=object_type,
+                context=context,
+                progress=_migration_progress(canonical_name),
+            )
+            if migration_status.is_err():
+                errors.append((object_type, migration_status.err()))
+                break
+            migrated.append(object_type)
 
+        if errors:
+            # the action store is migrated once the partitions are
+            action_object_pending_migration = []
+        for object_type in action_object_pending_migration:
+            canonical_name = object_type.__canonical_name__
             migration_status = self.action_store.migrate_data(
-                to_klass=object_type, credentials=self.verify_key
+                to_klass=object_type,
+                credentials=self.verify_key,
+                progress=_migration_progress(canonical_name),
             )
             if migration_status.is_err():
-                raise Exception(
+                errors.append((object_type, migration_status.err()))
+                break
+            migrated.append(object_type)
+
+        # a failed migration is resumed on the next start, the migrated
+        # types are not migrated again
+        for object_type in migrated:
+            migration_state = self.get_service(MigrateStateService).update_version(
+                context,
+                canonical_name=object_type.__canonical_name__,
+                current_version=object_type.__version__,
+            )
+            if isinstance(migration_state, SyftError):
+                errors.append((object_type, migration_state.message))
+
+        if errors:
+            object_type, error = errors[0]
+            raise Exception(
+                f"Failed to migrate data for {object_type.__canonical_name__}. Error: {error}"
+            )
+        print("Data Migrated to latest version !!!")
+
+    def _sweep_migrations(
+        self, object_types: list[SyftObject], context: AuthedServiceContext
+    ) -> None:
+        for object_type in object_types:
+            canonical_name = object_type.__canonical_name__
+            object_partition = self.document_store.partitions.get(canonical_name)
+            if object_partition is None:
+                continue
+
+            migration_status = object_partition.sweep_migrations(
+                pause=MIGRATION_SWEEP_PAUSE
+            )
+            if migration_status.is_err():
+                logger.error(
                     f"Failed to migrate data for {canonical_name}. Error: {migration_status.err()}"
                 )
-        print("Data Migrated to latest version !!!")
+                continue
+
+            self.get_service(MigrateStateService).update_version(
+                context,
+                canonical_name=canonical_name,
+                current_version=object_type.__version__,
+            )
+            print(f"Migrated data for: {canonical_name} table.")
 
     @property
     def guest_client(self) -> SyftClient:
@@ -9,8 +9,13 @@ import pyarrow as pa
 from ..util.experimental_flags import ApacheArrowCompression
 from ..util.experimental_flags import flags
 from .deserialize import _deserialize
+from .deserialize import get_out_of_band_buffer
+from .serialize import OUT_OF_BAND_SINK
 from .serialize import _serialize
 
+# arrays smaller than this are cheaper to copy into the message
+OUT_OF_BAND_MIN_SIZE = 64 * 1024  # 64KB
+
 
 def arrow_serialize(obj: np.ndarray) -> bytes:
     # inner function to make sure variables go out of scope after this
@@ -50,12 +55,124 @@ def arrow_deserialize(
     result = pa.ipc.read_tensor(numpy_bytes)
     np_array = result.to_numpy()
     np_array.setflags(write=True)
-    return np_array.astype(original_dtype)
+    return np_array.astype(original_dtype, copy=False)
+
+
+def out_of_band_serialize(obj: np.ndarray) -> bytes:
+    """Sends the array data as an out-of-band buffer, only the header is serialized.
+
+    The buffer is a flat memoryview over the array, it is only copied if the
+    array is not C-contiguous.
+    """
+    out_of_band = OUT_OF_BAND_SINK.get()
+    if out_of_band is None:
+        raise ValueError("Out-of-band serialization requires a buffer_callback.")
+
+    data = np.ascontiguousarray(obj).reshape(-1).view(np.uint8)
+    header = {
+        "buffer_index": out_of_band.add(data),
+        "dtype": obj.dtype.str,
+        "shape": obj.shape,
+    }
+    return cast(bytes, _serialize(header, to_bytes=True))
+
+
+def out_of_band_deserialize(header: dict) -> np.ndarray:
+    """Wraps the out-of-band buffer without copying.
+
+    Like pickle protocol 5, the array is only writable if the buffer is.
+    """
+    buffer = get_out_of_band_buffer(header["buffer_index"])
+    np_array = np.frombuffer(buffer, dtype=np.dtype(header["dtype"]))
+    return np_array.reshape(header["shape"])
+
+
+def is_out_of_band_compatible(obj: np.ndarray) -> bool:
+    return (
+        OUT_OF_BAND_SINK.get() is not None
+        and obj.nbytes >= OUT_OF_BAND_MIN_SIZE
+        and not obj.dtype.hasobject
+        and obj.dtype.kind not in "USV"
+    )
+
+
+def _has_embedded_nulls(flat: np.ndarray) -> bool:
+    # numpy only pads with trailing nulls, a null followed by a character is data
+    if flat.size == 0 or flat.dtype.itemsize <= 4:
+        return False
+    codepoints = flat.view(np.uint32).reshape(flat.size, -1)
+    return bool(((codepoints[:, :-1] == 0) & (codepoints[:, 1:] != 0)).any())
+
+
+def _utf8_encode(flat: np.ndarray) -> tuple[bytes, np.ndarray]:
+    """Returns the concatenated utf-8 bytes and byte lengths of a 1-D str array."""
+    # arrow encodes the whole array in C++, but cuts numpy strings at the first
+    # null, those arrays go through python str objects instead
+    values = flat.tolist() if _has_embedded_nulls(flat) else flat
+    strings = pa.array(values, type=pa.string())
+    if isinstance(strings, pa.ChunkedArray):
+        # more than 2GB of text doesn't fit into 32 bit offsets
+        strings = pa.concat_arrays(
+            [chunk.cast(pa.large_string()) for chunk in strings.chunks]
+        )
+    offset_type = np.int64 if pa.types.is_large_string(strings.type) else np.int32
+    _, offsets_buffer, data_buffer = strings.buffers()
+    offsets = np.frombuffer(offsets_buffer, dtype=offset_type)[: len(strings) + 1]
+    data = b""
+    if data_buffer is not None:
+        data = data_buffer.slice(offsets[0], offsets[-1] - offsets[0]).to_pybytes()
+    lengths = np.diff(offsets)
+    max_length = int(lengths.max()) if lengths.size else 0
+    return data, lengths.astype(np.min_scalar_type(max_length))
+
+
+def _utf8_decode(data: bytes, lengths: np.ndarray) -> np.ndarray:
+    """Inverse of `_utf8_encode`, returns a 1-D object array of str."""
+    offsets = np.zeros(lengths.size + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    strings = pa.LargeStringArray.from_buffers(
+        lengths.size, pa.py_buffer(offsets), pa.py_buffer(data)
+    )
+    return strings.to_numpy(zero_copy_only=False)
+
+
+def string_array_serialize(obj: np.ndarray) -> bytes:
+    data, lengths = _utf8_encode(obj.reshape(-1))
+    codec = None
+    if flags.APACHE_ARROW_COMPRESSION is not ApacheArrowCompression.NONE:
+        codec = flags.APACHE_ARROW_COMPRESSION.value
+        data = pa.compress(data, asbytes=True, codec=codec)
+    header = {
+        "utf8": data,
+        "lengths": lengths,
+        "codec": codec,
+        "dtype": obj.dtype.str,
+        "shape": obj.shape,
+    }
+    return cast(bytes, _serialize(header, to_bytes=True))
+
+
+def string_array_deserialize(header: dict) -> np.ndarray:
+    lengths = header["lengths"]
+    data = header["utf8"]
+    if header["codec"] is not None:
+        data = pa.decompress(
+            data,
+            decompressed_size=int(lengths.sum()),
+            codec=header["codec"],
+            asbytes=True,
+        )
+    np_array = _utf8_decode(data, lengths)
+    return np_array.astype(np.dtype(header["dtype"]), copy=False).reshape(
+        header["shape"]
+    )
 
 
 def numpyutf8toarray(input_index: np.ndarray) -> np.ndarray:
     """Decodes utf-8 encoded numpy array to string numpy array.
 
+    Only used for arrays serialized before `string_array_serialize`.
+
     Args:
         input_index (np.ndarray): utf-8 encoded array
 
@@ -69,61 +186,27 @@ def numpyutf8toarray(input_index: np.ndarray) -> np.ndarray:
     index_array = string_index[-(index_length + 1) : -1]  # noqa
     string_array: np.ndarray = string_index[: -(index_length + 1)]
     output_bytes: bytes = string_array.astype(np.uint8).tobytes()
-    output_list = []
-    last_offset = 0
-    for offset in index_array:
-        chars = output_bytes[last_offset:offset]
-        final_string = chars.decode("utf-8")
-        last_offset = offset
-        output_list.append(final_string)
-    return np.array(output_list).reshape(shape)
-
-
-def arraytonumpyutf8(string_list: str | np.ndarray) -> bytes:
-    """Encodes string Numpyarray  to utf-8 encoded numpy array.
-
-    Args:
-        string_list (np.ndarray): NumpyArray to be encoded
-
-    Returns:
-        bytes: serialized utf-8 encoded int Numpy array
-    """
-    array_shape = np.array(string_list).shape
-    string_list = np.array(string_list).flatten()
-    bytes_list = []
-    indexes = []
-    offset = 0
-
-    for item in string_list:
-        name_bytes = item.encode("utf-8")
-        offset += len(name_bytes)
-        indexes.append(offset)
-        bytes_list.append(name_bytes)
-
-    np_bytes = np.frombuffer(b"".join(bytes_list), dtype=np.uint8)
-    np_bytes = np_bytes.astype(np.uint64)
-    np_indexes = np.array(indexes, dtype=np.uint64)
-    index_length = np.array([len(np_indexes)], dtype=np.uint64)
-    shape = np.array(array_shape, dtype=np.uint64)
-    shape_length = np.array([len(shape)], dtype=np.uint64)
-    output_array = np.concatenate(
-        [np_bytes, np_indexes, index_length, shape, shape_length]
-    )
-
-    return cast(bytes, _serialize(output_array, to_bytes=True))
+    lengths = np.diff(index_array, prepend=0)
+    return _utf8_decode(output_bytes, lengths).astype(np.str_).reshape(shape)
 
 
 def numpy_serialize(obj: np.ndarray) -> bytes:
-    if obj.dtype.type != np.str_:
-        return arrow_serialize(obj)
+    if obj.dtype.type == np.str_:
+        return string_array_serialize(obj)
+    elif is_out_of_band_compatible(obj):
+        return out_of_band_serialize(obj)
     else:
-        return arraytonumpyutf8(obj)
+        return arrow_serialize(obj)
 
 
 def numpy_deserialize(buf: bytes) -> np.ndarray:
     deser = _deserialize(buf, from_bytes=True)
     if isinstance(deser, tuple):
         return arrow_deserialize(*deser)
+    elif isinstance(deser, dict) and "utf8" in deser:
+        return string_array_deserialize(deser)
+    elif isinstance(deser, dict):
+        return out_of_band_deserialize(deser)
     elif isinstance(deser, np.ndarray):
         return numpyutf8toarray(deser)
     else:
@@ -1,32 +1,126 @@
 # stdlib
+from collections.abc import Iterable
+from collections.abc import Sequence
+from contextvars import ContextVar
+import copy
+from io import IOBase
+from mmap import mmap
+import os
 from typing import Any
 
 # third party
 from capnp.lib.capnp import _DynamicStructBuilder
 
+OUT_OF_BAND_BUFFERS: ContextVar[Sequence | None] = ContextVar(
+    "OUT_OF_BAND_BUFFERS", default=None
+)
+
+
+def get_out_of_band_buffer(index: int) -> Any:
+    buffers = OUT_OF_BAND_BUFFERS.get()
+    if buffers is None:
+        raise ValueError(
+            "Message references out-of-band buffers, pass them with "
+            "deserialize(..., buffers=...)."
+        )
+    if index >= len(buffers):
+        raise ValueError(
+            f"Out-of-band buffer {index} missing, only {len(buffers)} were passed."
+        )
+    return buffers[index]
+
+
+class InternedObjects:
+    """Lazily deserialized intern table of the outermost message.
+
+    Every entry is deserialized once, each reference gets its own shallow copy
+    of it, so interned objects can be mutated without changing the others.
+    """
+
+    def __init__(self, blobs: Sequence) -> None:
+        self.blobs = blobs
+        self.objects: dict[int, Any] = {}
+
+    def get(self, index: int) -> Any:
+        if index not in self.objects:
+            # relative
+            from .recursive import combine_bytes
+            from .recursive import rs_bytes2object
+
+            if index >= len(self.blobs):
+                raise ValueError(
+                    f"Interned object {index} missing, the message only has "
+                    f"{len(self.blobs)}."
+                )
+            self.objects[index] = rs_bytes2object(combine_bytes(self.blobs[index]))
+        return copy.copy(self.objects[index])
+
+
+INTERNED_OBJECTS: ContextVar[InternedObjects | None] = ContextVar(
+    "INTERNED_OBJECTS", default=None
+)
+
+
+def get_interned_object(index: int) -> Any:
+    interned_objects = INTERNED_OBJECTS.get()
+    if interned_objects is None:
+        raise ValueError(
+            "Message references interned objects but was deserialized without "
+            "the message that holds them."
+        )
+    return interned_objects.get(index)
+
+
+# set while deserializing data written by the node itself, like store rows and
+# queue messages, syft objects are then built without re-running validation
+TRUSTED: ContextVar[bool] = ContextVar("TRUSTED", default=False)
+
 
 def _deserialize(
     blob: Any,
     from_proto: bool = True,
     from_bytes: bool = False,
+    buffers: Iterable | None = None,
+    from_file: bool = False,
+    trusted: bool = False,
 ) -> Any:
     # relative
     from .recursive import rs_bytes2object
+    from .recursive import rs_file2object
     from .recursive import rs_proto2object
 
     if (
-        (from_bytes and not isinstance(blob, bytes))
+        (from_file and not isinstance(blob, str | os.PathLike | IOBase))
+        or (
+            from_bytes
+            and not from_file
+            and not isinstance(blob, bytes | bytearray | memoryview | mmap)
+        )
         or (
             from_proto
-            and not from_bytes
+            and not (from_bytes or from_file)
             and not isinstance(blob, _DynamicStructBuilder)
         )
-        or not (from_bytes or from_proto)
+        or not (from_bytes or from_proto or from_file)
     ):
         raise TypeError("Wrong deserialization format.")
 
-    if from_bytes:
-        return rs_bytes2object(blob)
+    token = None
+    if buffers is not None:
+        token = OUT_OF_BAND_BUFFERS.set(list(buffers))
+    trusted_token = TRUSTED.set(True) if trusted else None
+
+    try:
+        if from_file:
+            return rs_file2object(blob)
+
+        if from_bytes:
+            return rs_bytes2object(blob)
 
-    if from_proto:
-        return rs_proto2object(blob)
+        if from_proto:
+            return rs_proto2object(blob)
+    finally:
+        if token is not None:
+            OUT_OF_BAND_BUFFERS.reset(token)
+        if trusted_token is not None:
+            TRUSTED.reset(trusted_token)
@@ -1,19 +1,23 @@
 # stdlib
 from collections.abc import Callable
+from collections.abc import Iterable
+from collections.abc import Iterator
 from enum import Enum
 from enum import EnumMeta
+import functools
+import io
+import mmap
+import os
 import sys
 import tempfile
 import types
 from typing import Any
+from typing import BinaryIO
 
 # third party
 from capnp.lib.capnp import _DynamicStructBuilder
 from pydantic import BaseModel
 
-# syft absolute
-import syft as sy
-
 # relative
 from ..util.util import get_fully_qualified_name
 from ..util.util import index_syft_by_module_name
@@ -26,6 +30,8 @@ recursive_scheme = get_capnp_schema("recursive_serde.capnp").RecursiveSerde
 
 SPOOLED_FILE_MAX_SIZE_SERDE = 50 * (1024**2)  # 50MB
 
+_MISSING = object()
+
 
 def get_types(cls: type, keys: list[str] | None = None) -> list[type] | None:
     if keys is None:
@@ -78,6 +84,157 @@ def check_fqn_alias(cls: object | type) -> tuple | None:
     return None
 
 
+class SerdePlan:
+    """Precomputed (de)serialization plan for a type registered in the TYPE_BANK.
+
+    Everything that can be derived from the registration (the ordered field
+    tuple, the serde override transforms, the resolved class) is computed once
+    here instead of on every `rs_object2proto` / `rs_proto2object` call.
+
+    Iterating a plan yields the legacy TYPE_BANK tuple, so existing consumers
+    which unpack `TYPE_BANK[fqn]` keep working.
+    """
+
+    __slots__ = (
+        "fqn",
+        "nonrecursive",
+        "serialize",
+        "deserialize",
+        "attribute_list",
+        "exclude_attrs",
+        "serde_overrides",
+        "hash_exclude_attrs",
+        "cls",
+        "attribute_types",
+        "version",
+        "intern",
+        "fields",
+        "deserialize_overrides",
+        "exclude_set",
+        "is_user_code",
+        "_hash_fields",
+        "_hash_exclude_set",
+        "_class_type",
+    )
+
+    def __init__(
+        self,
+        fqn: str,
+        nonrecursive: bool,
+        serialize: Callable | None,
+        deserialize: Callable | None,
+        attribute_list: set[str] | None,
+        exclude_attrs: list[str],
+        serde_overrides: dict[str, tuple[Callable, Callable]],
+        hash_exclude_attrs: list[str],
+        cls: type,
+        attribute_types: list[type] | None,
+        version: int | None,
+        intern: bool = False,
+    ) -> None:
+        self.fqn = fqn
+        self.nonrecursive = nonrecursive
+        self.serialize = serialize
+        self.deserialize = deserialize
+        self.attribute_list = attribute_list
+        self.exclude_attrs = exclude_attrs
+        self.serde_overrides = serde_overrides
+        self.hash_exclude_attrs = hash_exclude_attrs
+        self.cls = cls
+        self.attribute_types = attribute_types
+        self.version = version
+        self.intern = intern
+
+        # (attr_name, serialize override or None) in wire order
+        self.fields: tuple[tuple[str, Callable | None], ...] | None = None
+        if attribute_list is not None:
+            self.fields = self._make_fields(attribute_list)
+        self.deserialize_overrides = {
+            attr_name: transforms[1]
+            for attr_name, transforms in serde_overrides.items()
+        }
+        self.exclude_set = frozenset(exclude_attrs)
+        self.is_user_code = "syft.user" in fqn
+        self._hash_fields: tuple[tuple[str, Callable | None], ...] | None = None
+        self._hash_exclude_set: frozenset[str] | None = None
+        self._class_type: type | None = None
+
+    def __iter__(self) -> Iterator:
+        return iter(
+            (
+                self.nonrecursive,
+                self.serialize,
+                self.deserialize,
+                self.attribute_list,
+                self.exclude_attrs,
+                self.serde_overrides,
+                self.hash_exclude_attrs,
+                self.cls,
+                self.attribute_types,
+                self.version,
+            )
+        )
+
+    def _make_fields(
+        self, attribute_list: Iterable[str]
+    ) -> tuple[tuple[str, Callable | None], ...]:
+        return tuple(
+            (attr_name, self._serialize_override(attr_name))
+            for attr_name in sorted(attribute_list)
+        )
+
+    def _serialize_override(self, attr_name: str) -> Callable | None:
+        transforms = self.serde_overrides.get(attr_name, None)
+        return transforms[0] if transforms is not None else None
+
+    @property
+    def hash_exclude_set(self) -> frozenset[str]:
+        # built lazily, DYNAMIC_SYFT_ATTRIBUTES can't be imported at register time
+        if self._hash_exclude_set is None:
+            # relative
+            from ..types.syft_object import DYNAMIC_SYFT_ATTRIBUTES
+
+            self._hash_exclude_set = frozenset(self.hash_exclude_attrs).union(
+                DYNAMIC_SYFT_ATTRIBUTES
+            )
+        return self._hash_exclude_set
+
+    def fields_for(
+        self, obj: Any, for_hashing: bool = False
+    ) -> tuple[tuple[str, Callable | None], ...]:
+        if self.fields is None:
+            # no registered attributes, fall back to the instance __dict__
+            attribute_list = set(obj.__dict__.keys()) - self.exclude_set
+            if for_hashing:
+                attribute_list = attribute_list - self.hash_exclude_set
+            return self._make_fields(attribute_list)
+
+        if not for_hashing:
+            return self.fields
+
+        if self._hash_fields is None:
+            hash_exclude_set = self.hash_exclude_set
+            self._hash_fields = tuple(
+                field for field in self.fields if field[0] not in hash_exclude_set
+            )
+        return self._hash_fields
+
+    def class_type(self) -> type:
+        if self._class_type is not None:
+            return self._class_type
+
+        class_type = _resolve_class(self.fqn)
+        if class_type == type(None):
+            # yes this looks stupid but it works and the opposite breaks
+            class_type = self.cls
+
+        # syft.user classes are reloaded per process, so we always resolve them,
+        # and we only cache a lookup that agrees with the registered class
+        if not self.is_user_code and class_type is self.cls:
+            self._class_type = class_type
+        return class_type
+
+
 def recursive_serde_register(
     cls: object | type,
     serialize: Callable | None = None,
@@ -142,26 +299,24 @@ def recursive_serde_register(
     attribute_types = get_types(cls, attributes)
     serde_overrides = getattr(cls, "__serde_overrides__", {})
     version = getattr(cls, "__version__", None)
+    intern = getattr(cls, "__serde_intern__", False)
 
     # without fqn duplicate class names overwrite
-    serde_attributes = (
-        nonrecursive,
-        _serialize,
-        _deserialize,
-        attributes,
-        exclude_attrs,
-        serde_overrides,
-        hash_exclude_attrs,
-        cls,
-        attribute_types,
-        version,
-    )
-
-    TYPE_BANK[fqn] = serde_attributes
-
-    if isinstance(alias_fqn, tuple):
-        for alias in alias_fqn:
-            TYPE_BANK[alias] = serde_attributes
+    for key in (fqn, *(alias_fqn or ())):
+        TYPE_BANK[key] = SerdePlan(
+            fqn=key,
+            nonrecursive=nonrecursive,
+            serialize=_serialize,
+            deserialize=_deserialize,
+            attribute_list=attributes,
+            exclude_attrs=exclude_attrs,
+            serde_overrides=serde_overrides,
+            hash_exclude_attrs=hash_exclude_attrs,
+            cls=cls,
+            attribute_types=attribute_types,
+            version=version,
+            intern=intern,
+        )
 
 
 def chunk_bytes(
@@ -198,91 +353,85 @@ def chunk_bytes(
 
 
 def combine_bytes(capnp_list: list[bytes]) -> bytes:
-    # TODO: make sure this doesn't copy, perhaps allocate a fixed size buffer
-    # and move the bytes into it as we go
-    bytes_value = b""
-    for value in capnp_list:
-        bytes_value += value
-    return bytes_value
+    # a single chunk is the common case and is returned as is
+    if len(capnp_list) == 1:
+        return capnp_list[0]
+    # join sizes the result once, so every chunk is copied exactly one time
+    return b"".join(capnp_list)
 
 
 def rs_object2proto(self: Any, for_hashing: bool = False) -> _DynamicStructBuilder:
     # relative
-    from ..types.syft_object import DYNAMIC_SYFT_ATTRIBUTES
-
-    is_type = False
-    if isinstance(self, type):
-        is_type = True
+    from .serialize import INTERN_TABLE
 
-    msg = recursive_scheme.new_message()
     fqn = get_fully_qualified_name(self)
-    if fqn not in TYPE_BANK:
+    plan = TYPE_BANK.get(fqn, None)
+    if plan is None:
         # third party
         raise Exception(f"{fqn} not in TYPE_BANK")
-    msg.fullyQualifiedName = fqn
-    (
-        nonrecursive,
-        serialize,
-        deserialize,
-        attribute_list,
-        exclude_attrs_list,
-        serde_overrides,
-        hash_exclude_attrs,
-        cls,
-        attribute_types,
-        version,
-    ) = TYPE_BANK[fqn]
-
-    if nonrecursive or is_type:
-        if serialize is None:
+
+    intern_table = INTERN_TABLE.get()
+    if (
+        plan.intern
+        and not for_hashing
+        and intern_table is not None
+        and self is not intern_table.root
+    ):
+        # stored once in the outermost message, referenced by index
+        msg = recursive_scheme.new_message()
+        msg.internIndex = intern_table.index_for(
+            self, lambda obj: _object2proto(obj, plan, False).to_bytes()
+        )
+        return msg
+
+    return _object2proto(self, plan, for_hashing)
+
+
+def _object2proto(
+    self: Any, plan: SerdePlan, for_hashing: bool
+) -> _DynamicStructBuilder:
+    # relative
+    from .serialize import _serialize
+
+    msg = recursive_scheme.new_message()
+    msg.fullyQualifiedName = plan.fqn
+
+    if plan.nonrecursive or isinstance(self, type):
+        if plan.serialize is None:
             raise Exception(
                 f"Cant serialize {type(self)} nonrecursive without serialize."
             )
-        chunk_bytes(self, serialize, "nonrecursiveBlob", msg)
+        chunk_bytes(self, plan.serialize, "nonrecursiveBlob", msg)
         return msg
 
-    if attribute_list is None:
-        attribute_list = self.__dict__.keys()
+    fields = plan.fields_for(self, for_hashing=for_hashing)
 
-    hash_exclude_attrs_set = (
-        set(hash_exclude_attrs).union(set(DYNAMIC_SYFT_ATTRIBUTES))
-        if for_hashing
-        else set()
-    )
-    attribute_list = (
-        set(attribute_list) - set(exclude_attrs_list) - hash_exclude_attrs_set
-    )
+    msg.init("fieldsName", len(fields))
+    msg.init("fieldsData", len(fields))
 
-    msg.init("fieldsName", len(attribute_list))
-    msg.init("fieldsData", len(attribute_list))
-
-    for idx, attr_name in enumerate(sorted(attribute_list)):
-        if not hasattr(self, attr_name):
+    serialize_field = functools.partial(
+        _serialize, to_bytes=True, for_hashing=for_hashing
+    )
+    for idx, (attr_name, serialize_override) in enumerate(fields):
+        field_obj = getattr(self, attr_name, _MISSING)
+        if field_obj is _MISSING:
             raise ValueError(
                 f"{attr_name} on {type(self)} does not exist, serialization aborted!"
             )
 
-        field_obj = getattr(self, attr_name)
-        transforms = serde_overrides.get(attr_name, None)
-
-        if transforms is not None:
-            field_obj = transforms[0](field_obj)
+        if serialize_override is not None:
+            field_obj = serialize_override(field_obj)
 
         if isinstance(field_obj, types.FunctionType):
             continue
 
         msg.fieldsName[idx] = attr_name
-        chunk_bytes(
-            field_obj,
-            lambda x: sy.serialize(x, to_bytes=True, for_hashing=for_hashing),
-            idx,
-            msg.fieldsData,
-        )
+        chunk_bytes(field_obj, serialize_field, idx, msg.fieldsData)
 
     return msg
 
 
-def rs_bytes2object(blob: bytes) -> Any:
+def rs_bytes2object(blob: bytes | bytearray | memoryview | mmap.mmap) -> Any:
     MAX_TRAVERSAL_LIMIT = 2**64 - 1
 
     with recursive_scheme.from_bytes(
@@ -291,23 +440,44 @@ def rs_bytes2object(blob: bytes) -> Any:
         return rs_proto2object(msg)
 
 
-def rs_proto2object(proto: _DynamicStructBuilder) -> Any:
-    # relative
-    from .deserialize import _deserialize
+def rs_file2object(file: str | os.PathLike | BinaryIO) -> Any:
+    """Deserialize a message stored in a file.
+
+    The file is memory mapped, so the message is decoded straight from the page
+    cache instead of being read into a `bytes` object first.
+    """
+    if isinstance(file, str | os.PathLike):
+        with open(file, "rb") as f:
+            return rs_file2object(f)
+
+    try:
+        fileno = file.fileno()
+    except (AttributeError, io.UnsupportedOperation):
+        # in-memory file objects can't be mapped
+        return rs_bytes2object(file.read())
 
+    if os.fstat(fileno).st_size == 0:
+        # empty files can't be mapped either, fail like an empty blob does
+        return rs_bytes2object(file.read())
+
+    with mmap.mmap(fileno, 0, access=mmap.ACCESS_READ) as mapped:
+        return rs_bytes2object(mapped)
+
+
+def _resolve_class(fully_qualified_name: str) -> type | Any:
     # clean this mess, Tudor
-    module_parts = proto.fullyQualifiedName.split(".")
+    module_parts = fully_qualified_name.split(".")
     klass = module_parts.pop()
     class_type: type | Any = type(None)
 
     if klass != "NoneType":
         try:
-            class_type = index_syft_by_module_name(proto.fullyQualifiedName)  # type: ignore[assignment,unused-ignore]
+            class_type = index_syft_by_module_name(fully_qualified_name)  # type: ignore[assignment,unused-ignore]
         except Exception:  # nosec
             try:
                 class_type = getattr(sys.modules[".".join(module_parts)], klass)
             except Exception:  # nosec
-                if "syft.user" in proto.fullyQualifiedName:
+                if "syft.user" in fully_qualified_name:
                     # relative
                     from ..node.node import CODE_RELOADER
 
@@ -317,50 +487,67 @@ def rs_proto2object(proto: _DynamicStructBuilder) -> Any:
                     class_type = getattr(sys.modules[".".join(module_parts)], klass)
                 except Exception:  # nosec
                     pass
+    return class_type
 
-    if proto.fullyQualifiedName not in TYPE_BANK:
-        raise Exception(f"{proto.fullyQualifiedName} not in TYPE_BANK")
+
+def rs_proto2object(proto: _DynamicStructBuilder) -> Any:
+    # relative
+    from .deserialize import INTERNED_OBJECTS
+    from .deserialize import InternedObjects
+    from .deserialize import get_interned_object
+
+    if proto.internIndex >= 0:
+        return get_interned_object(proto.internIndex)
+
+    if len(proto.internTable) > 0:
+        # outermost message, references inside it point into its table
+        token = INTERNED_OBJECTS.set(InternedObjects(proto.internTable))
+        try:
+            return _proto2object(proto)
+        finally:
+            INTERNED_OBJECTS.reset(token)
+
+    return _proto2object(proto)
+
+
+def _proto2object(proto: _DynamicStructBuilder) -> Any:
+    # relative
+    from .deserialize import TRUSTED
+
+    fqn = proto.fullyQualifiedName
+    plan = TYPE_BANK.get(fqn, None)
+    if plan is None:
+        # resolving the class may reload user code which registers the type
+        _resolve_class(fqn)
+        plan = TYPE_BANK.get(fqn, None)
+        if plan is None:
+            raise Exception(f"{fqn} not in TYPE_BANK")
+
+    if plan.nonrecursive:
+        if plan.deserialize is None:
+            raise Exception(
+                f"Cant serialize {type(proto)} nonrecursive without serialize."
+            )
+
+        return plan.deserialize(combine_bytes(proto.nonrecursiveBlob))
 
     # TODO: 🐉 sort this out, basically sometimes the syft.user classes are not in the
     # module name space in sub-processes or threads even though they are loaded on start
     # its possible that the uvicorn awsgi server is preloading a bunch of threads
     # however simply getting the class from the TYPE_BANK doesn't always work and
     # causes some errors so it seems like we want to get the local one where possible
-    (
-        nonrecursive,
-        serialize,
-        deserialize,
-        attribute_list,
-        exclude_attrs_list,
-        serde_overrides,
-        hash_exclude_attrs,
-        cls,
-        attribute_types,
-        version,
-    ) = TYPE_BANK[proto.fullyQualifiedName]
-
-    if class_type == type(None):
-        # yes this looks stupid but it works and the opposite breaks
-        class_type = cls
-
-    if nonrecursive:
-        if deserialize is None:
-            raise Exception(
-                f"Cant serialize {type(proto)} nonrecursive without serialize."
-            )
-
-        return deserialize(combine_bytes(proto.nonrecursiveBlob))
+    class_type = plan.class_type()
 
     kwargs = {}
+    deserialize_overrides = plan.deserialize_overrides
 
     for attr_name, attr_bytes_list in zip(proto.fieldsName, proto.fieldsData):
         if attr_name != "":
-            attr_bytes = combine_bytes(attr_bytes_list)
-            attr_value = _deserialize(attr_bytes, from_bytes=True)
-            transforms = serde_overrides.get(attr_name, None)
+            attr_value = rs_bytes2object(combine_bytes(attr_bytes_list))
+            deserialize_override = deserialize_overrides.get(attr_name, None)
 
-            if transforms is not None:
-                attr_value = transforms[1](attr_value)
+            if deserialize_override is not None:
+                attr_value = deserialize_override(attr_value)
             kwargs[attr_name] = attr_value
 
     if hasattr(class_type, "serde_constructor"):
@@ -372,12 +559,14 @@ def rs_proto2object(proto: _DynamicStructBuilder) -> Any:
         # if we skip the __new__ flow of BaseModel we get the error
         # AttributeError: object has no attribute '__fields_set__'
 
-        if "syft.user" in proto.fullyQualifiedName:
+        if plan.is_user_code:
             # weird issues with pydantic and ForwardRef on user classes being inited
             # with custom state args / kwargs
             obj = class_type()
             for attr_name, attr_value in kwargs.items():
                 setattr(obj, attr_name, attr_value)
+        elif TRUSTED.get() and hasattr(class_type, "_syft_construct_trusted_"):
+            obj = class_type._syft_construct_trusted_(kwargs)
         else:
             obj = class_type(**kwargs)
 
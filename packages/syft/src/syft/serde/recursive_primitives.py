@@ -2,6 +2,7 @@
 from abc import ABCMeta
 from collections import OrderedDict
 from collections import defaultdict
+from collections.abc import Callable
 from collections.abc import Collection
 from collections.abc import Iterable
 from collections.abc import Mapping
@@ -26,11 +27,15 @@ from typing import _UnionGenericAlias
 from typing import cast
 import weakref
 
+# third party
+import numpy as np
+
 # relative
 from .capnp import get_capnp_schema
 from .recursive import SPOOLED_FILE_MAX_SIZE_SERDE
 from .recursive import chunk_bytes
 from .recursive import combine_bytes
+from .recursive import recursive_scheme
 from .recursive import recursive_serde_register
 from .util import compatible_with_large_file_writes_capnp
 
@@ -38,17 +43,127 @@ iterable_schema = get_capnp_schema("iterable.capnp").Iterable
 kv_iterable_schema = get_capnp_schema("kv_iterable.capnp").KVIterable
 
 
+# exact type -> (fully qualified name, pack), fully qualified name -> unpack
+PACKED_TYPES: dict[type, tuple[str, Callable[[Collection], bytes]]] = {}
+PACKED_TYPES_BY_NAME: dict[str, Callable[[memoryview], list]] = {}
+
+
+def register_packed_type(
+    type_: type,
+    pack: Callable[[Collection], bytes],
+    unpack: Callable[[memoryview], list],
+) -> None:
+    """Registers a compact encoding for containers holding only `type_` values.
+
+    Homogeneous containers of a packed type are stored as one blob instead of
+    one serialized message per element.
+    """
+    fqn = f"{type_.__module__}.{type_.__name__}"
+    PACKED_TYPES[type_] = (fqn, pack)
+    PACKED_TYPES_BY_NAME[fqn] = unpack
+
+
+def _packed_placeholder() -> bytes:
+    # readers without the packed fields only see the regular ones, this single
+    # element of an unknown type makes them fail instead of returning an empty
+    # container
+    message = recursive_scheme.new_message()
+    message.fullyQualifiedName = "syft.serde.recursive_primitives.PackedValues"
+    return message.to_bytes()
+
+
+PACKED_PLACEHOLDER = _packed_placeholder()
+
+
+def pack_primitives(values: Collection) -> tuple[str, bytes] | None:
+    if len(values) == 0:
+        return None
+
+    value_type = type(next(iter(values)))
+    if value_type not in PACKED_TYPES:
+        return None
+    # exact type match, bools are not packed as ints and subclasses keep their type
+    if not all(type(value) is value_type for value in values):
+        return None
+
+    fqn, pack = PACKED_TYPES[value_type]
+    try:
+        return fqn, pack(values)
+    except OverflowError:
+        # ints which don't fit into 64 bits
+        return None
+
+
+def unpack_primitives(fqn: str, blob: bytes) -> list:
+    if fqn not in PACKED_TYPES_BY_NAME:
+        raise TypeError(f"No packed encoding registered for {fqn}")
+    return PACKED_TYPES_BY_NAME[fqn](memoryview(blob))
+
+
+def _pack_buffers(values: Collection) -> bytes:
+    # count, lengths and the concatenated buffers
+    lengths = np.fromiter(map(len, values), dtype="<u8", count=len(values))
+    return len(values).to_bytes(8, "little") + lengths.tobytes() + b"".join(values)
+
+
+def _unpack_buffers(blob: memoryview) -> list[memoryview]:
+    count = int.from_bytes(blob[:8], "little")
+    lengths = np.frombuffer(blob, dtype="<u8", count=count, offset=8)
+    offsets = np.empty(count + 1, dtype=np.uint64)
+    offsets[0] = 8 * (count + 1)
+    np.cumsum(lengths, out=offsets[1:])
+    offsets[1:] += offsets[0]
+    offsets_list = offsets.tolist()
+    return [blob[start:end] for start, end in zip(offsets_list[:-1], offsets_list[1:])]
+
+
+register_packed_type(
+    int,
+    pack=lambda values: np.fromiter(values, dtype="<i8", count=len(values)).tobytes(),
+    unpack=lambda blob: np.frombuffer(blob, dtype="<i8").tolist(),
+)
+register_packed_type(
+    float,
+    pack=lambda values: np.fromiter(values, dtype="<f8", count=len(values)).tobytes(),
+    unpack=lambda blob: np.frombuffer(blob, dtype="<f8").tolist(),
+)
+register_packed_type(
+    bool,
+    pack=lambda values: np.fromiter(
+        values, dtype=np.bool_, count=len(values)
+    ).tobytes(),
+    unpack=lambda blob: np.frombuffer(blob, dtype=np.bool_).tolist(),
+)
+register_packed_type(
+    str,
+    pack=lambda values: _pack_buffers([value.encode("utf-8") for value in values]),
+    unpack=lambda blob: [str(value, "utf-8") for value in _unpack_buffers(blob)],
+)
+register_packed_type(
+    bytes,
+    pack=_pack_buffers,
+    unpack=lambda blob: [bytes(value) for value in _unpack_buffers(blob)],
+)
+
+
 def serialize_iterable(iterable: Collection) -> bytes:
     # relative
     from .serialize import _serialize
 
     message = iterable_schema.new_message()
 
-    message.init("values", len(iterable))
+    packed = pack_primitives(iterable)
+    if packed is not None:
+        message.packedType, packed_values = packed
+        chunk_bytes(packed_values, lambda x: x, "packedValues", message)
+        message.init("values", 1)
+        chunk_bytes(PACKED_PLACEHOLDER, lambda x: x, 0, message.values)
+    else:
+        message.init("values", len(iterable))
 
-    for idx, it in enumerate(iterable):
-        # serialized = _serialize(it, to_bytes=True)
-        chunk_bytes(it, lambda x: _serialize(x, to_bytes=True), idx, message.values)
+        for idx, it in enumerate(iterable):
+            # serialized = _serialize(it, to_bytes=True)
+            chunk_bytes(it, lambda x: _serialize(x, to_bytes=True), idx, message.values)
 
     if compatible_with_large_file_writes_capnp(message):
         with tempfile.TemporaryFile() as tmp_file:
@@ -74,8 +189,11 @@ def deserialize_iterable(iterable_type: type, blob: bytes) -> Collection:
     with iterable_schema.from_bytes(
         blob, traversal_limit_in_words=MAX_TRAVERSAL_LIMIT
     ) as msg:
-        for element in msg.values:
-            values.append(_deserialize(combine_bytes(element), from_bytes=True))
+        if msg.packedType:
+            values = unpack_primitives(msg.packedType, combine_bytes(msg.packedValues))
+        else:
+            for element in msg.values:
+                values.append(_deserialize(combine_bytes(element), from_bytes=True))
 
     return iterable_type(values)
 
@@ -90,13 +208,36 @@ def _serialize_kv_pairs(size: int, kv_pairs: Iterable[tuple[_KT, _VT]]) -> bytes
 
     message = kv_iterable_schema.new_message()
 
-    message.init("keys", size)
-    message.init("values", size)
-
-    for index, (k, v) in enumerate(kv_pairs):
-        message.keys[index] = _serialize(k, to_bytes=True)
-        # serialized = _serialize(v, to_bytes=True)
-        chunk_bytes(v, lambda x: _serialize(x, to_bytes=True), index, message.values)
+    keys = []
+    values = []
+    for k, v in kv_pairs:
+        keys.append(k)
+        values.append(v)
+
+    packed_keys = pack_primitives(keys)
+    if packed_keys is not None:
+        message.packedKeysType, packed = packed_keys
+        chunk_bytes(packed, lambda x: x, "packedKeys", message)
+        message.init("keys", 1)
+        message.keys[0] = PACKED_PLACEHOLDER
+    else:
+        message.init("keys", size)
+        for index, k in enumerate(keys):
+            message.keys[index] = _serialize(k, to_bytes=True)
+
+    packed_values = pack_primitives(values)
+    if packed_values is not None:
+        message.packedValuesType, packed = packed_values
+        chunk_bytes(packed, lambda x: x, "packedValues", message)
+        message.init("values", 1)
+        chunk_bytes(PACKED_PLACEHOLDER, lambda x: x, 0, message.values)
+    else:
+        message.init("values", size)
+        for index, v in enumerate(values):
+            # serialized = _serialize(v, to_bytes=True)
+            chunk_bytes(
+                v, lambda x: _serialize(x, to_bytes=True), index, message.values
+            )
 
     return message.to_bytes()
 
@@ -110,19 +251,26 @@ def get_deserialized_kv_pairs(blob: bytes) -> list[Any]:
     from .deserialize import _deserialize
 
     MAX_TRAVERSAL_LIMIT = 2**64 - 1
-    pairs = []
 
     with kv_iterable_schema.from_bytes(
         blob, traversal_limit_in_words=MAX_TRAVERSAL_LIMIT
     ) as msg:
-        for key, value in zip(msg.keys, msg.values):
-            pairs.append(
-                (
-                    _deserialize(key, from_bytes=True),
-                    _deserialize(combine_bytes(value), from_bytes=True),
-                )
+        if msg.packedKeysType:
+            keys = unpack_primitives(msg.packedKeysType, combine_bytes(msg.packedKeys))
+        else:
+            keys = [_deserialize(key, from_bytes=True) for key in msg.keys]
+
+        if msg.packedValuesType:
+            values = unpack_primitives(
+                msg.packedValuesType, combine_bytes(msg.packedValues)
             )
-    return pairs
+        else:
+            values = [
+                _deserialize(combine_bytes(value), from_bytes=True)
+                for value in msg.values
+            ]
+
+    return list(zip(keys, values))
 
 
 def deserialize_kv(mapping_type: type, blob: bytes) -> Mapping:
@@ -1,22 +1,166 @@
 # stdlib
+from collections.abc import Callable
+from contextvars import ContextVar
+import io
+import os
 import tempfile
 from typing import Any
 
+# third party
+from capnp.lib.capnp import _DynamicStructBuilder
+
 # relative
 from .recursive import SPOOLED_FILE_MAX_SIZE_SERDE
+from .recursive import chunk_bytes
 from .util import compatible_with_large_file_writes_capnp
 
 
+class OutOfBandBuffers:
+    """Collects buffers which are sent out-of-band instead of inside the message.
+
+    Buffers are handed to `callback` in serialization order as flat memoryviews,
+    the message only stores their index. Deserialization needs the same buffers
+    in the same order, see `_deserialize(..., buffers=...)`.
+    """
+
+    def __init__(self, callback: Callable[[memoryview], Any]) -> None:
+        self.callback = callback
+        self.count = 0
+
+    def add(self, buffer: Any) -> int:
+        index = self.count
+        self.callback(memoryview(buffer))
+        self.count += 1
+        return index
+
+
+OUT_OF_BAND_SINK: ContextVar[OutOfBandBuffers | None] = ContextVar(
+    "OUT_OF_BAND_SINK", default=None
+)
+
+
+class InternTable:
+    """Sub-objects which are stored once per message and shared by reference.
+
+    Instances of types declaring `__serde_intern__ = True` are serialized into
+    the table of the outermost message, every occurrence is encoded as an index
+    into it. Equal values share an entry, the deserializer gives every
+    occurrence its own copy.
+    """
+
+    def __init__(self, root: Any) -> None:
+        # the outermost object is always serialized in place
+        self.root = root
+        self.blobs: list[bytes] = []
+        self._index_by_blob: dict[bytes, int] = {}
+        # id(obj) -> (obj, index), keeping obj alive so its id isn't reused
+        self._index_by_id: dict[int, tuple[Any, int]] = {}
+
+    def index_for(self, obj: Any, serialize: Callable[[Any], bytes]) -> int:
+        entry = self._index_by_id.get(id(obj))
+        if entry is not None:
+            return entry[1]
+
+        blob = serialize(obj)
+        index = self._index_by_blob.get(blob)
+        if index is None:
+            index = len(self.blobs)
+            self.blobs.append(blob)
+            self._index_by_blob[blob] = index
+        self._index_by_id[id(obj)] = (obj, index)
+        return index
+
+
+INTERN_TABLE: ContextVar[InternTable | None] = ContextVar("INTERN_TABLE", default=None)
+
+
+# chunk size used when copying a spooled message into a non-seekable sink
+SINK_CHUNK_SIZE = 8 * (1024**2)  # 8MB
+
+
+def _is_seekable_file(file: Any) -> bool:
+    try:
+        file.fileno()
+    except (AttributeError, io.UnsupportedOperation):
+        return False
+    # sockets have a file descriptor but no seekable()
+    return hasattr(file, "seekable") and file.seekable()
+
+
+def _write_message(proto: _DynamicStructBuilder, file: Any) -> int:
+    """Writes the message to a path, file or socket-like sink.
+
+    Returns the number of bytes written.
+    """
+    if isinstance(file, str | os.PathLike):
+        with open(file, "wb") as f:
+            return _write_message(proto, f)
+
+    write = file.write if hasattr(file, "write") else file.sendall
+
+    if not compatible_with_large_file_writes_capnp(proto):
+        data = proto.to_bytes()
+        write(data)
+        return len(data)
+
+    if _is_seekable_file(file):
+        # capnp writes the segments straight to the file descriptor
+        file.flush()
+        start = file.tell()
+        proto.write(file)
+        return file.tell() - start
+
+    # pipes and sockets can't report the size, so spool the message to disk
+    # and forward it chunk by chunk
+    with tempfile.TemporaryFile() as tmp_file:
+        proto.write(tmp_file)
+        size = tmp_file.tell()
+        tmp_file.seek(0)
+        while chunk := tmp_file.read(SINK_CHUNK_SIZE):
+            write(chunk)
+    return size
+
+
 def _serialize(
     obj: object,
     to_proto: bool = True,
     to_bytes: bool = False,
     for_hashing: bool = False,
+    buffer_callback: Callable[[memoryview], Any] | None = None,
+    to_file: Any | None = None,
 ) -> Any:
     # relative
     from .recursive import rs_object2proto
 
-    proto = rs_object2proto(obj, for_hashing=for_hashing)
+    token = None
+    if buffer_callback is not None:
+        token = OUT_OF_BAND_SINK.set(OutOfBandBuffers(buffer_callback))
+    elif for_hashing:
+        # hashes must cover the buffer contents, never send them out-of-band
+        token = OUT_OF_BAND_SINK.set(None)
+
+    intern_table = None
+    intern_token = None
+    if not for_hashing and INTERN_TABLE.get() is None:
+        intern_table = InternTable(root=obj)
+        intern_token = INTERN_TABLE.set(intern_table)
+
+    try:
+        proto = rs_object2proto(obj, for_hashing=for_hashing)
+    finally:
+        if token is not None:
+            OUT_OF_BAND_SINK.reset(token)
+        if intern_token is not None:
+            INTERN_TABLE.reset(intern_token)
+
+    if intern_table is not None and intern_table.blobs:
+        proto.init("internTable", len(intern_table.blobs))
+        for index, blob in enumerate(intern_table.blobs):
+            chunk_bytes(blob, lambda x: x, index, proto.internTable)
+
+    if to_file is not None:
+        return _write_message(proto, to_file)
+
     if to_bytes:
         if compatible_with_large_file_writes_capnp(proto):
             with tempfile.TemporaryFile() as tmp_file:
@@ -1,4 +1,7 @@
 # stdlib
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import date
 from datetime import datetime
 from datetime import time
@@ -19,6 +22,7 @@ from pandas import DataFrame
 from pandas import Series
 from pandas._libs.tslibs.timestamps import Timestamp
 import pyarrow as pa
+import pyarrow.feather as feather
 import pyarrow.parquet as pq
 import pydantic
 from pydantic._internal._model_construction import ModelMetaclass
@@ -67,28 +71,66 @@ recursive_serde_register(cls=TypeError)
 recursive_serde_register_type(Collection)
 
 
+# "uncompressed", "lz4" or "zstd", uncompressed frames are read without copies
+DATAFRAME_COMPRESSION = "uncompressed"
+
+DATAFRAME_COLUMNS: ContextVar[list[str] | None] = ContextVar(
+    "DATAFRAME_COLUMNS", default=None
+)
+
+PARQUET_MAGIC = b"PAR1"
+
+
+@contextmanager
+def dataframe_columns(columns: list[str]) -> Iterator[None]:
+    """Only load `columns` of the DataFrames deserialized inside the block.
+
+    with dataframe_columns(["age", "income"]):
+        df = sy.deserialize(blob, from_bytes=True)
+    """
+    token = DATAFRAME_COLUMNS.set(list(columns))
+    try:
+        yield
+    finally:
+        DATAFRAME_COLUMNS.reset(token)
+
+
 def serialize_dataframe(df: DataFrame) -> bytes:
+    # Feather v2, the Arrow IPC file format
     table = pa.Table.from_pandas(df)
     sink = pa.BufferOutputStream()
-    # 🟡 TODO 37: Should we warn about this?
-    parquet_args = {
-        "coerce_timestamps": "us",
-        "allow_truncated_timestamps": True,
-    }
-    pq.write_table(table, sink, **parquet_args)
-    buffer = sink.getvalue()
-    numpy_bytes = buffer.to_pybytes()
-    return numpy_bytes
+    feather.write_feather(table, sink, compression=DATAFRAME_COMPRESSION)
+    return sink.getvalue().to_pybytes()
 
 
-def deserialize_dataframe(buf: bytes) -> DataFrame:
+def _deserialize_parquet(buf: bytes, columns: list[str] | None) -> DataFrame:
+    # DataFrames serialized before the switch to Arrow IPC
     reader = pa.BufferReader(buf)
     numpy_bytes = reader.read_buffer()
-    result = pq.read_table(numpy_bytes)
+    result = pq.read_table(numpy_bytes, columns=columns)
     df = result.to_pandas()
     return df
 
 
+def deserialize_dataframe(buf: bytes) -> DataFrame:
+    columns = DATAFRAME_COLUMNS.get()
+    if buf[: len(PARQUET_MAGIC)] == PARQUET_MAGIC:
+        return _deserialize_parquet(buf, columns)
+
+    source = pa.BufferReader(buf)
+    if columns is not None:
+        # keep the index columns, the frame can't be rebuilt without them
+        pandas_metadata = pa.ipc.open_file(source).schema.pandas_metadata or {}
+        columns = columns + [
+            column
+            for column in pandas_metadata.get("index_columns", [])
+            if isinstance(column, str) and column not in columns
+        ]
+        source.seek(0)
+    table = feather.read_table(source, columns=columns, memory_map=False)
+    return table.to_pandas()
+
+
 # pandas
 recursive_serde_register(
     DataFrame,
@@ -97,14 +139,34 @@ recursive_serde_register(
 )
 
 
+SERIES_COLUMN = "series"
+
+
+def serialize_series(series: Series) -> bytes:
+    # the name can be any hashable, so it is stored next to the frame
+    df_bytes = serialize_dataframe(series.to_frame(name=SERIES_COLUMN))
+    return serialize((series.name, df_bytes), to_bytes=True)
+
+
 def deserialize_series(blob: bytes) -> Series:
-    df: DataFrame = DataFrame.from_dict(deserialize(blob, from_bytes=True))
-    return Series(df[df.columns[0]])
+    data = deserialize(blob, from_bytes=True)
+    if isinstance(data, dict):
+        # Series serialized with DataFrame.to_dict
+        df: DataFrame = DataFrame.from_dict(data)
+        return Series(df[df.columns[0]])
+
+    name, df_bytes = data
+    token = DATAFRAME_COLUMNS.set(None)
+    try:
+        df = deserialize_dataframe(df_bytes)
+    finally:
+        DATAFRAME_COLUMNS.reset(token)
+    return df[SERIES_COLUMN].rename(name)
 
 
 recursive_serde_register(
     Series,
-    serialize=lambda x: serialize(DataFrame(x).to_dict(), to_bytes=True),
+    serialize=serialize_series,
     deserialize=deserialize_series,
 )
 
@@ -242,38 +242,50 @@ class NetworkXBackingStore(BaseGraphStore):
         self._thread_safe_cbk(self._set, uid=uid, data=data)
 
     def _set(self, uid: UID, data: Any) -> None:
-        if self.exists(uid=uid):
-            self.update(uid=uid, data=data)
+        if self._exists(uid=uid):
+            self._update(uid=uid, data=data)
         else:
             self.db.add_node(uid, data=data)
-        self.save()
+            self.save()
 
     def get(self, uid: UID) -> Any:
+        # reads hold the lock shared, they only wait for writes
+        with self.lock.shared():
+            return self._get(uid=uid)
+
+    def _get(self, uid: UID) -> Any:
         node_data = self.db.nodes.get(uid)
-        return node_data.get("data")
+        return None if node_data is None else node_data.get("data")
 
     def exists(self, uid: Any) -> bool:
-        return uid in self.nodes()
+        with self.lock.shared():
+            return self._exists(uid=uid)
+
+    def _exists(self, uid: Any) -> bool:
+        return uid in self.db.nodes
 
     def delete(self, uid: UID) -> None:
         self._thread_safe_cbk(self._delete, uid=uid)
 
     def _delete(self, uid: UID) -> None:
-        if self.exists(uid=uid):
+        if self._exists(uid=uid):
             self.db.remove_node(uid)
         self.save()
 
     def find_neighbors(self, uid: UID) -> list | None:
-        if self.exists(uid=uid):
-            neighbors = self.db.neighbors(uid)
-            return neighbors
+        with self.lock.shared():
+            return self._find_neighbors(uid=uid)
+
+    def _find_neighbors(self, uid: UID) -> list | None:
+        if self._exists(uid=uid):
+            return list(self.db.neighbors(uid))
         return None
 
     def update(self, uid: UID, data: Any) -> None:
         self._thread_safe_cbk(self._update, uid=uid, data=data)
 
     def _update(self, uid: UID, data: Any) -> None:
-        if self.exists(uid=uid):
+        if self._exists(uid=uid):
             self.db.nodes[uid]["data"] = data
         self.save()
 
@@ -303,14 +315,16 @@ class NetworkXBackingStore(BaseGraphStore):
         return self.db.edges()
 
     def get_predecessors(self, uid: UID) -> list:
-        return self.db.predecessors(uid)
+        with self.lock.shared():
+            return list(self.db.predecessors(uid))
 
     def get_successors(self, uid: UID) -> list:
-        return self.db.successors(uid)
+        with self.lock.shared():
+            return list(self.db.successors(uid))
 
     def is_parent(self, parent: Any, child: Any) -> bool:
-        parents = self.db.predecessors(child)
-        return parent in parents
+        with self.lock.shared():
+            return self.db.has_edge(parent, child)
 
     def save(self) -> None:
         bytes = _serialize(self.db, to_bytes=True)
@@ -330,13 +344,13 @@ class NetworkXBackingStore(BaseGraphStore):
         return nx.subgraph_view(self.db, filter_node=filter_func)
 
     def topological_sort(self, subgraph: Any) -> Any:
-        return list(nx.topological_sort(subgraph))
+        # the subgraph is a view, the graph is only read while sorting
+        with self.lock.shared():
+            return list(nx.topological_sort(subgraph))
 
     @staticmethod
     def _load_from_path(file_path: str) -> None:
-        with open(file_path, "rb") as f:
-            bytes = f.read()
-        return _deserialize(blob=bytes, from_bytes=True)
+        return _deserialize(blob=file_path, from_file=True)
 
 
 @serializable()
@@ -6,9 +6,8 @@ from collections.abc import Callable
 from collections.abc import Iterable
 from enum import Enum
 import inspect
-from io import BytesIO
 from pathlib import Path
-import sys
+from tempfile import SpooledTemporaryFile
 import threading
 import time
 import traceback
@@ -33,6 +32,7 @@ from ...client.api import SyftAPI
 from ...client.api import SyftAPICall
 from ...client.client import SyftClient
 from ...node.credentials import SyftVerifyKey
+from ...serde.recursive import SPOOLED_FILE_MAX_SIZE_SERDE
 from ...serde.serializable import serializable
 from ...serde.serialize import _serialize as serialize
 from ...service.response import SyftError
@@ -800,34 +800,41 @@ class ActionObject(SyncableSyftObject):
                 )
                 data.upload_to_blobstorage_from_api(api)
             else:
-                serialized = serialize(data, to_bytes=True)
-                size = sys.getsizeof(serialized)
-                storage_entry = CreateBlobStorageEntry.from_obj(data, file_size=size)
-
-                if not TraceResultRegistry.current_thread_is_tracing():
-                    self.syft_action_data_cache = self.as_empty_data()
-                if self.syft_blob_storage_entry_id is not None:
-                    # TODO: check if it already exists
-                    storage_entry.id = self.syft_blob_storage_entry_id
-                allocate_method = from_api_or_context(
-                    func_or_path="blob_storage.allocate",
-                    syft_node_location=self.syft_node_location,
-                    syft_client_verify_key=self.syft_client_verify_key,
-                )
-                if allocate_method is not None:
-                    blob_deposit_object = allocate_method(storage_entry)
-
-                    if isinstance(blob_deposit_object, SyftError):
-                        return blob_deposit_object
+                # serialize into a spooled file, large payloads go to disk
+                # and are streamed to the blob storage from there
+                with SpooledTemporaryFile(
+                    max_size=SPOOLED_FILE_MAX_SIZE_SERDE
+                ) as serialized:
+                    size = serialize(data, to_file=serialized)
+                    serialized.seek(0)
+                    storage_entry = CreateBlobStorageEntry.from_obj(
+                        data, file_size=size
+                    )
 
-                    result = blob_deposit_object.write(BytesIO(serialized))
-                    if isinstance(result, SyftError):
-                        return result
-                    self.syft_blob_storage_entry_id = (
-                        blob_deposit_object.blob_storage_entry_id
+                    if not TraceResultRegistry.current_thread_is_tracing():
+                        self.syft_action_data_cache = self.as_empty_data()
+                    if self.syft_blob_storage_entry_id is not None:
+                        # TODO: check if it already exists
+                        storage_entry.id = self.syft_blob_storage_entry_id
+                    allocate_method = from_api_or_context(
+                        func_or_path="blob_storage.allocate",
+                        syft_node_location=self.syft_node_location,
+                        syft_client_verify_key=self.syft_client_verify_key,
                     )
-                else:
-                    print("cannot save to blob storage")
+                    if allocate_method is not None:
+                        blob_deposit_object = allocate_method(storage_entry)
+
+                        if isinstance(blob_deposit_object, SyftError):
+                            return blob_deposit_object
+
+                        result = blob_deposit_object.write(serialized)
+                        if isinstance(result, SyftError):
+                            return result
+                        self.syft_blob_storage_entry_id = (
+                            blob_deposit_object.blob_storage_entry_id
+                        )
+                    else:
+                        print("cannot save to blob storage")
 
             self.syft_action_data_type = type(data)
 
@@ -1878,6 +1885,7 @@ class ActionObject(SyncableSyftObject):
 
         # use the custom defined version
         if defined_on_self:
+            self._syft_invalidate_hash_(name)
             self.__dict__[name] = value
             return value
         else:
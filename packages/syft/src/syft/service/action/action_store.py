@@ -2,6 +2,9 @@
 from __future__ import annotations
 
 # stdlib
+from collections import defaultdict
+from collections.abc import Callable
+from collections.abc import Iterable
 import threading
 
 # third party
@@ -15,11 +18,17 @@ from ...node.credentials import SyftVerifyKey
 from ...serde.serializable import serializable
 from ...store.dict_document_store import DictStoreConfig
 from ...store.document_store import BasePartitionSettings
+from ...store.document_store import DEFAULT_BATCH_SIZE
+from ...store.document_store import permissions_by_uid
 from ...store.document_store import StoreConfig
+from ...store.kv_document_store import KeyValueBackingStore
+from ...store.kv_document_store import _permission_string
+from ...store.sqlite_document_store import SQLitePermissionStore
 from ...types.syft_object import SyftObject
 from ...types.twin_object import TwinObject
 from ...types.uid import LineageID
 from ...types.uid import UID
+from ...util.util import batched
 from ..response import SyftSuccess
 from .action_object import is_action_data_empty
 from .action_permissions import ActionObjectEXECUTE
@@ -60,9 +69,7 @@ class KeyValueActionStore(ActionStore):
         self.data = self.store_config.backing_store(
             "data", self.settings, self.store_config
         )
-        self.permissions = self.store_config.backing_store(
-            "permissions", self.settings, self.store_config, ddtype=set
-        )
+        self.permissions = self._init_permissions()
         self.storage_permissions = self.store_config.backing_store(
             "storage_permissions", self.settings, self.store_config, ddtype=set
         )
@@ -71,6 +78,11 @@ class KeyValueActionStore(ActionStore):
             root_verify_key = SyftSigningKey.generate().verify_key
         self.root_verify_key = root_verify_key
 
+    def _init_permissions(self) -> KeyValueBackingStore:
+        return self.store_config.backing_store(
+            "permissions", self.settings, self.store_config, ddtype=set
+        )
+
     def get(
         self, uid: UID, credentials: SyftVerifyKey, has_permission: bool = False
     ) -> Result[SyftObject, str]:
@@ -253,21 +265,49 @@ class KeyValueActionStore(ActionStore):
         return False
 
     def has_permissions(self, permissions: list[ActionObjectPermission]) -> bool:
-        return all(self.has_permission(p) for p in permissions)
+        # one lookup for the uids of every credentials and permission
+        uids_by_permission = defaultdict(list)
+        for permission in permissions:
+            uids_by_permission[(permission.credentials, permission.permission)].append(
+                permission.uid
+            )
+        return all(
+            len(self.filter_permitted(credentials, uids, permission)) == len(uids)
+            for (credentials, permission), uids in uids_by_permission.items()
+        )
+
+    def filter_permitted(
+        self,
+        credentials: SyftVerifyKey,
+        uids: Iterable[UID],
+        permission: ActionPermission,
+    ) -> list[UID]:
+        """The uids out of `uids` the credentials have `permission` for, in their
+        order, checked in one lookup."""
+        uids = list(uids)
+        if len(uids) == 0:
+            return []
+        # root can do everything, see has_permission
+        if (
+            credentials is not None
+            and self.root_verify_key.verify == credentials.verify
+        ):
+            return uids
+        granting = _permission_string(credentials, permission)
+        permitted = self.permissions.keys_with_any(uids, {granting})
+        return [uid for uid in uids if uid in permitted]
 
     def add_permission(self, permission: ActionObjectPermission) -> None:
-        permissions = self.permissions[permission.uid]
-        permissions.add(permission.permission_string)
-        self.permissions[permission.uid] = permissions
+        self.permissions.add_items(permission.uid, [permission.permission_string])
 
     def remove_permission(self, permission: ActionObjectPermission) -> None:
-        permissions = self.permissions[permission.uid]
-        permissions.remove(permission.permission_string)
-        self.permissions[permission.uid] = permissions
+        self.permissions.remove_items(permission.uid, [permission.permission_string])
 
     def add_permissions(self, permissions: list[ActionObjectPermission]) -> None:
-        for permission in permissions:
-            self.add_permission(permission)
+        for uid, uid_permissions in permissions_by_uid(permissions).items():
+            self.permissions.add_items(
+                uid, [p.permission_string for p in uid_permissions]
+            )
 
     def _get_permissions_for_uid(self, uid: UID) -> Result[set[str], str]:
         if uid in self.permissions:
@@ -302,32 +342,54 @@ class KeyValueActionStore(ActionStore):
         return Err(f"No storage permissions found for uid: {uid}")
 
     def migrate_data(
-        self, to_klass: SyftObject, credentials: SyftVerifyKey
+        self,
+        to_klass: SyftObject,
+        credentials: SyftVerifyKey,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        progress: Callable[[int, int], None] | None = None,
     ) -> Result[bool, str]:
-        has_root_permission = credentials == self.root_verify_key
+        """Migrates the objects of `to_klass` to its version, `batch_size` objects
+        at a time, each batch written at once. `progress` is called with the
+        number of objects done and the total after every batch.
 
-        if has_root_permission:
-            for key, value in self.data.items():
+        Objects already at that version are skipped, so running the migration
+        again after a failure resumes it."""
+        has_root_permission = credentials == self.root_verify_key
+        if not has_root_permission:
+            return Err("You don't have permissions to migrate data.")
+
+        total = len(self.data)
+        done = 0
+        for keys in batched(self.data.iter_keys(batch_size), batch_size):
+            migrated = {}
+            for key, value in self.data.get_many(keys).items():
+                if (
+                    value.__canonical_name__ != to_klass.__canonical_name__
+                    or value.__version__ == to_klass.__version__
+                ):
+                    continue
                 try:
-                    if value.__canonical_name__ != to_klass.__canonical_name__:
-                        continue
-                    migrated_value = value.migrate_to(to_klass.__version__)
+                    migrated[key] = value.migrate_to(to_klass.__version__)
                 except Exception as e:
                     return Err(
                         f"Failed to migrate data to {to_klass} for qk: {key}. Exception: {e}"
                     )
-                result = self.set(
-                    uid=key,
-                    credentials=credentials,
-                    syft_object=migrated_value,
-                )
 
-                if result.is_err():
-                    return result.err()
+            with self.data.transaction():
+                for key, migrated_value in migrated.items():
+                    result = self.set(
+                        uid=key,
+                        credentials=credentials,
+                        syft_object=migrated_value,
+                    )
+                    if result.is_err():
+                        return result
 
-            return Ok(True)
+            done += len(keys)
+            if progress is not None:
+                progress(done, total)
 
-        return Err("You don't have permissions to migrate data.")
+        return Ok(True)
 
 
 @serializable()
@@ -366,7 +428,13 @@ class SQLiteActionStore(KeyValueActionStore):
             Signature verification key, used for checking access permissions.
     """
 
-    pass
+    def _init_permissions(self) -> SQLitePermissionStore:
+        return SQLitePermissionStore(
+            "permission_index",
+            self.settings,
+            self.store_config,
+            legacy_index_name="permissions",
+        )
 
 
 @serializable()
@@ -1,5 +1,4 @@
 # stdlib
-from collections.abc import Collection
 from collections.abc import Sequence
 
 # relative
@@ -30,7 +29,7 @@ from .dataset_stash import DatasetStash
 
 
 def _paginate_collection(
-    collection: Collection,
+    total: int,
     page_size: int | None = 0,
     page_index: int | None = 0,
 ) -> slice | None:
@@ -38,7 +37,6 @@ def _paginate_collection(
         return None
 
     # If chunk size is defined, then split list into evenly sized chunks
-    total = len(collection)
     page_index = 0 if page_index is None else page_index
 
     if page_size > total or page_index >= total // page_size or page_index < 0:
@@ -54,7 +52,9 @@ def _paginate_dataset_collection(
     page_size: int | None = 0,
     page_index: int | None = 0,
 ) -> DictTuple[str, Dataset] | DatasetPageView:
-    slice_ = _paginate_collection(datasets, page_size=page_size, page_index=page_index)
+    slice_ = _paginate_collection(
+        len(datasets), page_size=page_size, page_index=page_index
+    )
     chunk = datasets[slice_] if slice_ is not None else datasets
     results = DictTuple(chunk, lambda dataset: dataset.name)
 
@@ -114,7 +114,24 @@ class DatasetService(AbstractService):
         page_index: int | None = 0,
     ) -> DatasetPageView | DictTuple[str, Dataset] | SyftError:
         """Get a Dataset"""
-        result = self.stash.get_all(context.credentials)
+        slice_ = None
+        if page_size:
+            total = self.stash.count(context.credentials)
+            if total.is_err():
+                return SyftError(message=total.err())
+            slice_ = _paginate_collection(
+                total.ok(), page_size=page_size, page_index=page_index
+            )
+
+        if slice_ is None:
+            result = self.stash.get_all(context.credentials)
+        else:
+            # read only the requested page
+            result = self.stash.get_all(
+                context.credentials,
+                limit=slice_.stop - slice_.start,
+                offset=slice_.start,
+            )
         if not result.is_ok():
             return SyftError(message=result.err())
 
@@ -124,9 +141,10 @@ class DatasetService(AbstractService):
             if context.node is not None:
                 dataset.node_uid = context.node.id
 
-        return _paginate_dataset_collection(
-            datasets=datasets, page_size=page_size, page_index=page_index
-        )
+        results = DictTuple(datasets, lambda dataset: dataset.name)
+        if slice_ is None:
+            return results
+        return DatasetPageView(datasets=results, total=total.ok())
 
     @service_method(path="dataset.search", name="search", roles=GUEST_ROLE_LEVEL)
     def search(
@@ -71,3 +71,29 @@ class MigrateStateService(AbstractService):
             return SyftError(message=f"{result.err()}")
 
         return result.ok()
+
+    def update_version(
+        self,
+        context: AuthedServiceContext,
+        canonical_name: str,
+        current_version: int,
+    ) -> SyftObjectMigrationState | SyftError:
+        """Records that the data of `canonical_name` was migrated to `current_version`."""
+        result = self.stash.get_by_name(
+            canonical_name=canonical_name, credentials=context.credentials
+        )
+        if result.is_err():
+            return SyftError(message=f"{result.err()}")
+
+        migration_state = result.ok()
+        if migration_state is None:
+            return self.register_migration_state(
+                context, current_version=current_version, canonical_name=canonical_name
+            )
+
+        migration_state.current_version = current_version
+        result = self.stash.update(credentials=context.credentials, obj=migration_state)
+        if result.is_err():
+            return SyftError(message=f"{result.err()}")
+
+        return result.ok()
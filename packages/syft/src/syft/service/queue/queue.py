@@ -162,6 +162,8 @@ def handle_message_multiprocessing(
         queue_config=queue_config,
         is_subprocess=True,
         migrate=False,
+        # the node may not have migrated all objects yet
+        lazy_migrate=True,
     )
 
     job_item = worker.job_stash.get_by_uid(credentials, queue_item.job_id).ok()
@@ -280,7 +282,7 @@ class APICallMessageHandler(AbstractMessageHandler):
         # relative
         from ...node.node import Node
 
-        queue_item = deserialize(message, from_bytes=True)
+        queue_item = deserialize(message, from_bytes=True, trusted=True)
         worker_settings = queue_item.worker_settings
 
         queue_config = worker_settings.queue_config
@@ -297,6 +299,8 @@ class APICallMessageHandler(AbstractMessageHandler):
             queue_config=queue_config,
             is_subprocess=True,
             migrate=False,
+            # the node may not have migrated all objects yet
+            lazy_migrate=True,
         )
 
         # otherwise it reads it from env, resulting in the wrong credentials
@@ -781,7 +781,7 @@ class ZMQConsumer(QueueConsumer):
 
     def associate_job(self, message: Frame) -> None:
         try:
-            queue_item = _deserialize(message, from_bytes=True)
+            queue_item = _deserialize(message, from_bytes=True, trusted=True)
             self._set_worker_job(queue_item.job_id)
         except Exception as e:
             logger.exception("Could not associate job. {}", e)
@@ -124,7 +124,13 @@ class RequestService(AbstractService):
     ) -> list[list[RequestInfo]] | list[RequestInfo] | SyftError:
         """Get the information of all requests"""
 
-        result = self.stash.get_all(context.credentials)
+        if page_size and page_index:
+            # only read and resolve the requested page
+            result = self.stash.get_all(
+                context.credentials, limit=page_size, offset=page_size * page_index
+            )
+        else:
+            result = self.stash.get_all(context.credentials)
         if result.is_err():
             return SyftError(message=result.err())
 
@@ -136,17 +142,11 @@ class RequestService(AbstractService):
             user = method(req.requesting_user_verify_key).to(UserView)
             message = get_message(context=context, obj_uid=req.id)
             requests.append(RequestInfo(user=user, request=req, notification=message))
-        if not page_size:
+        if not page_size or page_index:
             return requests
 
         # If chunk size is defined, then split list into evenly sized chunks
-        chunked_requests: list[list[RequestInfo]] = [
-            requests[i : i + page_size] for i in range(0, len(requests), page_size)
-        ]
-        if page_index:
-            return chunked_requests[page_index]
-        else:
-            return chunked_requests
+        return [requests[i : i + page_size] for i in range(0, len(requests), page_size)]
 
     @service_method(path="request.add_changes", name="add_changes")
     def add_changes(
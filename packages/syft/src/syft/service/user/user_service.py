@@ -8,6 +8,7 @@ from ...node.credentials import SyftVerifyKey
 from ...node.credentials import UserLoginCredentials
 from ...serde.serializable import serializable
 from ...store.document_store import DocumentStore
+from ...store.document_store import QueryKeys
 from ...store.linked_obj import LinkedObject
 from ...types.syft_metaclass import Empty
 from ...types.uid import UID
@@ -109,7 +110,24 @@ class UserService(AbstractService):
         page_size: int | None = 0,
         page_index: int | None = 0,
     ) -> list[UserView] | UserViewPage | UserView | SyftError:
-        if context.role in [ServiceRole.DATA_OWNER, ServiceRole.ADMIN]:
+        has_permission = context.role in [ServiceRole.DATA_OWNER, ServiceRole.ADMIN]
+        if page_size and page_index is not None:
+            # read only the requested page
+            total = self.stash.count(context.credentials, has_permission=has_permission)
+            if total.is_err():
+                return SyftError(message=str(total.err()))
+            result = self.stash.get_all(
+                context.credentials,
+                has_permission=has_permission,
+                limit=page_size,
+                offset=page_size * page_index,
+            )
+            if result.is_err():
+                return SyftError(message=str(result.err()))
+            users = [user.to(UserView) for user in result.ok()]
+            return UserViewPage(users=users, total=total.ok())
+
+        if has_permission:
             result = self.stash.get_all(context.credentials, has_permission=True)
         else:
             result = self.stash.get_all(context.credentials)
@@ -118,15 +136,10 @@ class UserService(AbstractService):
 
             # If chunk size is defined, then split list into evenly sized chunks
             if page_size:
-                total = len(results)
                 results = [
                     results[i : i + page_size]
                     for i in range(0, len(results), page_size)
                 ]
-                # Return the proper slice using chunk_index
-                if page_index is not None:
-                    results = results[page_index]
-                    results = UserViewPage(users=results, total=total)
 
             return results
 
@@ -168,6 +181,22 @@ class UserService(AbstractService):
                 message=f"Invalid Search parameters. \
                 Allowed params: {valid_search_params}"
             )
+        if page_size and page_index is not None:
+            # read only the requested page
+            total = self.stash.count(context.credentials, QueryKeys.from_dict(kwargs))
+            if total.is_err():
+                return SyftError(message=str(total.err()))
+            result = self.stash.find_all(
+                credentials=context.credentials,
+                limit=page_size,
+                offset=page_size * page_index,
+                **kwargs,
+            )
+            if result.is_err():
+                return SyftError(message=str(result.err()))
+            users = [user.to(UserView) for user in result.ok()]
+            return UserViewPage(users=users, total=total.ok())
+
         result = self.stash.find_all(credentials=context.credentials, **kwargs)
 
         if result.is_err():
@@ -177,16 +206,10 @@ class UserService(AbstractService):
 
         # If page size is defined, then split list into evenly sized chunks
         if page_size:
-            total = len(results)
             results = [
                 results[i : i + page_size] for i in range(0, len(results), page_size)
             ]
 
-            # Return the proper slice using page_index
-            if page_index is not None:
-                results = results[page_index]
-                results = UserViewPage(users=results, total=total)
-
         return results
 
     # @service_method(path="user.get_admin", name="get_admin", roles=GUEST_ROLE_LEVEL)
@@ -43,8 +43,8 @@ Read/retrieve SyftObject from blob storage
 # stdlib
 from collections.abc import Callable
 from collections.abc import Generator
-from io import BytesIO
 from typing import Any
+from typing import BinaryIO
 
 # third party
 from pydantic import BaseModel
@@ -227,7 +227,7 @@ class BlobDeposit(SyftObject):
 
     blob_storage_entry_id: UID
 
-    def write(self, data: BytesIO) -> SyftSuccess | SyftError:
+    def write(self, data: BinaryIO) -> SyftSuccess | SyftError:
         raise NotImplementedError
 
 
@@ -1,7 +1,7 @@
 # stdlib
-from io import BytesIO
 from pathlib import Path
 from typing import Any
+from typing import BinaryIO
 
 # third party
 from typing_extensions import Self
@@ -28,7 +28,7 @@ class OnDiskBlobDeposit(BlobDeposit):
     __canonical_name__ = "OnDiskBlobDeposit"
     __version__ = SYFT_OBJECT_VERSION_2
 
-    def write(self, data: BytesIO) -> SyftSuccess | SyftError:
+    def write(self, data: BinaryIO) -> SyftSuccess | SyftError:
         # relative
         from ...service.service import from_api_or_context
 
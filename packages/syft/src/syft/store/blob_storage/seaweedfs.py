@@ -1,10 +1,10 @@
 # stdlib
 from collections.abc import Generator
-from io import BytesIO
 import math
 from queue import Queue
 import threading
 from typing import Any
+from typing import BinaryIO
 
 # third party
 import boto3
@@ -49,7 +49,7 @@ class SeaweedFSBlobDeposit(BlobDeposit):
     urls: list[GridURL]
     size: int
 
-    def write(self, data: BytesIO) -> SyftSuccess | SyftError:
+    def write(self, data: BinaryIO) -> SyftSuccess | SyftError:
         # relative
         from ...client.api import APIRegistry
 
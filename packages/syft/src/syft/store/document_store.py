@@ -2,7 +2,11 @@
 from __future__ import annotations
 
 # stdlib
+from collections import defaultdict
 from collections.abc import Callable
+from collections.abc import Iterable
+from collections.abc import Iterator
+import time
 import types
 import typing
 from typing import Any
@@ -20,12 +24,14 @@ from ..node.credentials import SyftSigningKey
 from ..node.credentials import SyftVerifyKey
 from ..serde.serializable import serializable
 from ..service.action.action_permissions import ActionObjectPermission
+from ..service.action.action_permissions import ActionPermission
 from ..service.action.action_permissions import StoragePermission
 from ..service.context import AuthedServiceContext
 from ..service.response import SyftSuccess
 from ..types.base import SyftBaseModel
 from ..types.syft_object import SYFT_OBJECT_VERSION_2
 from ..types.syft_object import SyftBaseObject
+from ..types.syft_object import SyftMigrationRegistry
 from ..types.syft_object import SyftObject
 from ..types.uid import UID
 from ..util.telemetry import instrument
@@ -33,6 +39,9 @@ from .locks import LockingConfig
 from .locks import NoLockingConfig
 from .locks import SyftLock
 
+# objects read at a time by iter_all and iter_query
+DEFAULT_BATCH_SIZE = 100
+
 
 @serializable()
 class BasePartitionSettings(SyftBaseModel):
@@ -52,6 +61,15 @@ def first_or_none(result: Any) -> Ok:
     return Ok(None)
 
 
+def permissions_by_uid(
+    permissions: list[ActionObjectPermission] | None,
+) -> dict[UID, list[ActionObjectPermission]]:
+    permissions_dict: dict[UID, list[ActionObjectPermission]] = defaultdict(list)
+    for permission in permissions or []:
+        permissions_dict[permission.uid].append(permission)
+    return permissions_dict
+
+
 def is_generic_alias(t: type) -> bool:
     return isinstance(t, types.GenericAlias | typing._GenericAlias)
 
@@ -303,6 +321,10 @@ class StorePartition:
             Backend specific configuration
     """
 
+    # set by `enable_lazy_migration`, objects are then migrated when read
+    migration_context: AuthedServiceContext | None = None
+    migration_write_back: bool = False
+
     def __init__(
         self,
         node_uid: UID,
@@ -361,6 +383,17 @@ class StorePartition:
 
         return result
 
+    def _thread_safe_read_cbk(
+        self, cbk: Callable, *args: Any, **kwargs: Any
+    ) -> Any | Err:
+        """Like `_thread_safe_cbk`, for read-only operations: holds the lock
+        shared, so reads run concurrently with each other but not with writes."""
+        try:
+            with self.lock.shared():
+                return cbk(*args, **kwargs)
+        except BaseException as e:
+            return Err(str(e))
+
     def set(
         self,
         credentials: SyftVerifyKey,
@@ -383,11 +416,12 @@ class StorePartition:
         credentials: SyftVerifyKey,
         uid: UID,
     ) -> Result[SyftObject, str]:
-        return self._thread_safe_cbk(
+        res = self._thread_safe_read_cbk(
             self._get,
             uid=uid,
             credentials=credentials,
         )
+        return self._read_migrated(res)
 
     def find_index_or_search_keys(
         self,
@@ -395,14 +429,19 @@ class StorePartition:
         index_qks: QueryKeys,
         search_qks: QueryKeys,
         order_by: PartitionKey | None = None,
+        limit: int | None = None,
+        offset: int = 0,
     ) -> Result[list[SyftObject], str]:
-        return self._thread_safe_cbk(
+        res = self._thread_safe_read_cbk(
             self._find_index_or_search_keys,
             credentials,
             index_qks=index_qks,
             search_qks=search_qks,
             order_by=order_by,
+            limit=limit,
+            offset=offset,
         )
+        return self._read_migrated(res)
 
     def remove_keys(
         self,
@@ -435,10 +474,18 @@ class StorePartition:
         credentials: SyftVerifyKey,
         qks: QueryKeys,
         order_by: PartitionKey | None = None,
+        limit: int | None = None,
+        offset: int = 0,
     ) -> Result[list[SyftObject], str]:
-        return self._thread_safe_cbk(
-            self._get_all_from_store, credentials, qks, order_by
+        res = self._thread_safe_read_cbk(
+            self._get_all_from_store,
+            credentials,
+            qks,
+            order_by,
+            limit=limit,
+            offset=offset,
         )
+        return self._read_migrated(res)
 
     def delete(
         self, credentials: SyftVerifyKey, qk: QueryKey, has_permission: bool = False
@@ -447,24 +494,244 @@ class StorePartition:
             self._delete, credentials, qk, has_permission=has_permission
         )
 
+    def set_many(
+        self,
+        credentials: SyftVerifyKey,
+        objs: list[SyftObject],
+        add_permissions: list[ActionObjectPermission] | None = None,
+        add_storage_permission: bool = True,
+        ignore_duplicates: bool = False,
+    ) -> Result[list[Result[SyftObject, str]], str]:
+        """Writes all objects as one batch.
+
+        Returns the result of `set` for every object, in order. `add_permissions`
+        may hold permissions for any of the objects, they are added with their object.
+        """
+        return self._thread_safe_cbk(
+            self._set_many,
+            credentials=credentials,
+            objs=objs,
+            add_permissions=add_permissions,
+            add_storage_permission=add_storage_permission,
+            ignore_duplicates=ignore_duplicates,
+        )
+
+    def update_many(
+        self,
+        credentials: SyftVerifyKey,
+        objs: list[SyftObject],
+        has_permission: bool = False,
+    ) -> Result[list[Result[SyftObject, str]], str]:
+        """Updates every object by its store key, returns the result of each update."""
+        return self._thread_safe_cbk(
+            self._update_many,
+            credentials=credentials,
+            objs=objs,
+            has_permission=has_permission,
+        )
+
+    def delete_many(
+        self,
+        credentials: SyftVerifyKey,
+        qks: list[QueryKey],
+        has_permission: bool = False,
+    ) -> Result[list[Result[SyftSuccess, str]], str]:
+        """Deletes the object of every store query key, returns the result of each."""
+        return self._thread_safe_cbk(
+            self._delete_many,
+            credentials=credentials,
+            qks=qks,
+            has_permission=has_permission,
+        )
+
     def all(
         self,
         credentials: SyftVerifyKey,
         order_by: PartitionKey | None = None,
         has_permission: bool | None = False,
+        limit: int | None = None,
+        offset: int = 0,
     ) -> Result[list[BaseStash.object_type], str]:
-        return self._thread_safe_cbk(self._all, credentials, order_by, has_permission)
+        """All readable objects, optionally only the page of `limit` objects
+        after skipping `offset` of them."""
+        res = self._thread_safe_read_cbk(
+            self._all,
+            credentials,
+            order_by,
+            has_permission,
+            limit=limit,
+            offset=offset,
+        )
+        return self._read_migrated(res)
+
+    def iter_all(
+        self,
+        credentials: SyftVerifyKey,
+        has_permission: bool | None = False,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> Result[Iterator[BaseStash.object_type], str]:
+        """Like `all`, but reads `batch_size` objects at a time while iterating."""
+        res = self._thread_safe_read_cbk(
+            self._iter_all, credentials, has_permission, batch_size=batch_size
+        )
+        if res.is_err():
+            return res
+        return Ok(self._iter_batches(res.ok()))
+
+    def iter_query(
+        self,
+        credentials: SyftVerifyKey,
+        index_qks: QueryKeys,
+        search_qks: QueryKeys,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> Result[Iterator[BaseStash.object_type], str]:
+        """Like `find_index_or_search_keys`, but reads `batch_size` objects at a
+        time while iterating."""
+        res = self._thread_safe_read_cbk(
+            self._iter_query, credentials, index_qks, search_qks, batch_size=batch_size
+        )
+        if res.is_err():
+            return res
+        return Ok(self._iter_batches(res.ok()))
+
+    def count(
+        self,
+        credentials: SyftVerifyKey,
+        index_qks: QueryKeys,
+        search_qks: QueryKeys,
+        has_permission: bool | None = False,
+    ) -> Result[int, str]:
+        """Number of readable objects matching the query keys, without reading
+        the objects. Without query keys all objects are counted."""
+        return self._thread_safe_read_cbk(
+            self._count,
+            credentials,
+            index_qks,
+            search_qks,
+            has_permission=has_permission,
+        )
+
+    def _iter_batches(
+        self, batches: Iterator[list[SyftObject]]
+    ) -> Iterator[SyftObject]:
+        for batch in self._locked_batches(batches):
+            if self.migration_context is not None:
+                batch = self._migrate_on_read(batch)
+            yield from batch
+
+    def _locked_batches(
+        self, batches: Iterator[list[SyftObject]]
+    ) -> Iterator[list[SyftObject]]:
+        # the lock is only held while a batch is read, not while it is consumed
+        while True:
+            with self.lock.shared():
+                batch = next(batches, None)
+            if batch is None:
+                return
+            yield batch
 
     def migrate_data(
         self,
         to_klass: SyftObject,
         context: AuthedServiceContext,
         has_permission: bool | None = False,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        progress: Callable[[int, int], None] | None = None,
     ) -> Result[bool, str]:
+        """Migrates all objects to the version of `to_klass`, `batch_size` objects
+        at a time, each batch written at once. `progress` is called with the
+        number of objects done and the total after every batch.
+
+        Objects already at that version are skipped, so running the migration
+        again after a failure resumes it."""
         return self._thread_safe_cbk(
-            self._migrate_data, to_klass, context, has_permission
+            self._migrate_data,
+            to_klass,
+            context,
+            has_permission,
+            batch_size=batch_size,
+            progress=progress,
         )
 
+    # Lazy migration, objects are stored in any of their versions and migrated
+    # to the latest one when read.
+
+    def enable_lazy_migration(
+        self, context: AuthedServiceContext, write_back: bool = False
+    ) -> None:
+        """Migrates the objects read to the latest version of their type with
+        `context`. With `write_back` the migrated objects are also stored,
+        otherwise they stay in their old version until `sweep_migrations`."""
+        self.migration_context = context
+        self.migration_write_back = write_back
+
+    def sweep_migrations(
+        self, batch_size: int = DEFAULT_BATCH_SIZE, pause: float = 0
+    ) -> Result[int, str]:
+        """Stores all objects not at their latest version yet migrated,
+        `batch_size` objects at a time with a `pause` in seconds between the
+        batches. The lock is only held per batch, requests are served in
+        between. Returns the number of objects migrated."""
+        if self.migration_context is None:
+            return Err(f"Lazy migration is not enabled for {self.settings.name}")
+
+        res = self._thread_safe_read_cbk(
+            self._iter_all, self.root_verify_key, True, batch_size=batch_size
+        )
+        if res.is_err():
+            return res
+
+        migrated = 0
+        for batch in self._locked_batches(res.ok()):
+            try:
+                stale = [
+                    new
+                    for old, new in zip(batch, self._migrate_batch_to_latest(batch))
+                    if new is not old
+                ]
+            except Exception as e:
+                return Err(f"Failed to migrate data of {self.settings.name}: {e}")
+            if stale:
+                written = self._thread_safe_cbk(self._write_back, stale)
+                if written.is_err():
+                    return written
+                migrated += len(stale)
+            time.sleep(pause)
+        return Ok(migrated)
+
+    def _read_migrated(self, res: Result) -> Result:
+        if self.migration_context is None or res.is_err():
+            return res
+        value = res.ok()
+        try:
+            if isinstance(value, list):
+                return Ok(self._migrate_on_read(value))
+            return Ok(self._migrate_on_read([value])[0])
+        except Exception as e:
+            return Err(f"Failed to migrate data of {self.settings.name}: {e}")
+
+    def _migrate_on_read(self, objs: list[SyftObject]) -> list[SyftObject]:
+        migrated = self._migrate_batch_to_latest(objs)
+        if self.migration_write_back:
+            stale = [new for old, new in zip(objs, migrated) if new is not old]
+            if stale:
+                # a failed write back is retried on the next read
+                self._thread_safe_cbk(self._write_back, stale)
+        return migrated
+
+    def _migrate_batch_to_latest(self, objs: list[SyftObject]) -> list[SyftObject]:
+        migrated = []
+        for obj in objs:
+            versions = (
+                SyftMigrationRegistry.get_versions(obj.__canonical_name__)
+                if isinstance(obj, SyftObject)
+                else []
+            )
+            if versions:
+                obj = obj.migrate_to(max(versions), self.migration_context)
+            migrated.append(obj)
+        return migrated
+
     # Potentially thread-unsafe methods.
     # CAUTION:
     #       * Don't use self.lock here.
@@ -495,6 +762,8 @@ class StorePartition:
         credentials: SyftVerifyKey,
         qks: QueryKeys,
         order_by: PartitionKey | None = None,
+        limit: int | None = None,
+        offset: int = 0,
     ) -> Result[list[SyftObject], str]:
         raise NotImplementedError
 
@@ -503,14 +772,116 @@ class StorePartition:
     ) -> Result[SyftSuccess, Err]:
         raise NotImplementedError
 
+    def _write_back(self, objs: list[SyftObject]) -> Result[int, str]:
+        """Stores the migrated objects over their old versions, objects updated
+        since they were read are left as they are."""
+        written = 0
+        for obj in objs:
+            qk = self.store_query_key(obj)
+            stored = self._get_all_from_store(self.root_verify_key, QueryKeys(qks=[qk]))
+            if stored.is_err():
+                return stored
+            if not stored.ok() or stored.ok()[0].__version__ == obj.__version__:
+                continue
+            res = self._update(
+                self.root_verify_key, qk, obj, has_permission=True, overwrite=True
+            )
+            if res.is_err():
+                return res
+            written += 1
+        return Ok(written)
+
+    # Bulk writes, partitions with a native batch API override these.
+
+    def _set_many(
+        self,
+        credentials: SyftVerifyKey,
+        objs: list[SyftObject],
+        add_permissions: list[ActionObjectPermission] | None = None,
+        add_storage_permission: bool = True,
+        ignore_duplicates: bool = False,
+    ) -> Result[list[Result[SyftObject, str]], str]:
+        permissions_dict = permissions_by_uid(add_permissions)
+        return Ok(
+            [
+                self._set(
+                    credentials=credentials,
+                    obj=obj,
+                    add_permissions=permissions_dict.get(obj.id),
+                    add_storage_permission=add_storage_permission,
+                    ignore_duplicates=ignore_duplicates,
+                )
+                for obj in objs
+            ]
+        )
+
+    def _update_many(
+        self,
+        credentials: SyftVerifyKey,
+        objs: list[SyftObject],
+        has_permission: bool = False,
+    ) -> Result[list[Result[SyftObject, str]], str]:
+        return Ok(
+            [
+                self._update(
+                    credentials=credentials,
+                    qk=self.store_query_key(obj),
+                    obj=obj,
+                    has_permission=has_permission,
+                )
+                for obj in objs
+            ]
+        )
+
+    def _delete_many(
+        self,
+        credentials: SyftVerifyKey,
+        qks: list[QueryKey],
+        has_permission: bool = False,
+    ) -> Result[list[Result[SyftSuccess, str]], str]:
+        return Ok(
+            [self._delete(credentials, qk, has_permission=has_permission) for qk in qks]
+        )
+
     def _all(
         self,
         credentials: SyftVerifyKey,
         order_by: PartitionKey | None = None,
         has_permission: bool | None = False,
+        limit: int | None = None,
+        offset: int = 0,
     ) -> Result[list[BaseStash.object_type], str]:
         raise NotImplementedError
 
+    # Streaming reads, the iterators yield the readable objects in batches of
+    # at most `batch_size`.
+
+    def _iter_all(
+        self,
+        credentials: SyftVerifyKey,
+        has_permission: bool | None = False,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> Result[Iterator[list[SyftObject]], str]:
+        raise NotImplementedError
+
+    def _iter_query(
+        self,
+        credentials: SyftVerifyKey,
+        index_qks: QueryKeys,
+        search_qks: QueryKeys,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> Result[Iterator[list[SyftObject]], str]:
+        raise NotImplementedError
+
+    def _count(
+        self,
+        credentials: SyftVerifyKey,
+        index_qks: QueryKeys,
+        search_qks: QueryKeys,
+        has_permission: bool | None = False,
+    ) -> Result[int, str]:
+        raise NotImplementedError
+
     def add_permission(self, permission: ActionObjectPermission) -> None:
         raise NotImplementedError
 
@@ -523,6 +894,20 @@ class StorePartition:
     def has_permission(self, permission: ActionObjectPermission) -> bool:
         raise NotImplementedError
 
+    def filter_permitted(
+        self,
+        credentials: SyftVerifyKey,
+        uids: Iterable[UID],
+        permission: ActionPermission,
+    ) -> list[UID]:
+        """The uids out of `uids` the credentials have `permission` for, in their
+        order. Partitions override this to check all uids in one lookup."""
+        return [
+            uid
+            for uid in uids
+            if self.has_permission(ActionObjectPermission(uid, permission, credentials))
+        ]
+
     def _get_permissions_for_uid(self, uid: UID) -> Result[set[str], str]:
         raise NotImplementedError
 
@@ -546,9 +931,29 @@ class StorePartition:
         to_klass: SyftObject,
         context: AuthedServiceContext,
         has_permission: bool,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        progress: Callable[[int, int], None] | None = None,
     ) -> Result[bool, str]:
         raise NotImplementedError
 
+    def _migrate_batch(
+        self,
+        values: list[SyftObject],
+        to_klass: SyftObject,
+        context: AuthedServiceContext,
+    ) -> Result[list[SyftObject], str]:
+        """The values of a batch migrated to the version of `to_klass`, without
+        the values already at that version."""
+        migrated = []
+        for value in values:
+            if value.__version__ == to_klass.__version__:
+                continue
+            try:
+                migrated.append(value.migrate_to(to_klass.__version__, context))
+            except Exception:
+                return Err(f"Failed to migrate data to {to_klass} for qk: {value.id}")
+        return Ok(migrated)
+
 
 @instrument
 @serializable()
@@ -575,17 +980,34 @@ class DocumentStore:
         self.store_config = store_config
         self.node_uid = node_uid
         self.root_verify_key = root_verify_key
+        self.migration_context: AuthedServiceContext | None = None
+        self.migration_write_back = False
 
     def partition(self, settings: PartitionSettings) -> StorePartition:
         if settings.name not in self.partitions:
-            self.partitions[settings.name] = self.partition_type(
+            partition = self.partition_type(
                 node_uid=self.node_uid,
                 root_verify_key=self.root_verify_key,
                 settings=settings,
                 store_config=self.store_config,
             )
+            if self.migration_context is not None:
+                partition.enable_lazy_migration(
+                    self.migration_context, write_back=self.migration_write_back
+                )
+            self.partitions[settings.name] = partition
         return self.partitions[settings.name]
 
+    def enable_lazy_migration(
+        self, context: AuthedServiceContext, write_back: bool = False
+    ) -> None:
+        """Enables lazy migration for all partitions, see
+        `StorePartition.enable_lazy_migration`."""
+        self.migration_context = context
+        self.migration_write_back = write_back
+        for partition in self.partitions.values():
+            partition.enable_lazy_migration(context, write_back=write_back)
+
 
 @instrument
 class BaseStash:
@@ -609,8 +1031,22 @@ class BaseStash:
         credentials: SyftVerifyKey,
         order_by: PartitionKey | None = None,
         has_permission: bool = False,
+        limit: int | None = None,
+        offset: int = 0,
     ) -> Result[list[BaseStash.object_type], str]:
-        return self.partition.all(credentials, order_by, has_permission)
+        return self.partition.all(
+            credentials, order_by, has_permission, limit=limit, offset=offset
+        )
+
+    def iter_all(
+        self,
+        credentials: SyftVerifyKey,
+        has_permission: bool = False,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> Result[Iterator[BaseStash.object_type], str]:
+        return self.partition.iter_all(
+            credentials, has_permission, batch_size=batch_size
+        )
 
     def add_permissions(self, permissions: list[ActionObjectPermission]) -> None:
         self.partition.add_permissions(permissions)
@@ -646,12 +1082,83 @@ class BaseStash:
             add_storage_permission=add_storage_permission,
         )
 
+    def set_many(
+        self,
+        credentials: SyftVerifyKey,
+        objs: list[BaseStash.object_type],
+        add_permissions: list[ActionObjectPermission] | None = None,
+        add_storage_permission: bool = True,
+        ignore_duplicates: bool = False,
+    ) -> Result[list[Result[BaseStash.object_type, str]], str]:
+        return self.partition.set_many(
+            credentials=credentials,
+            objs=objs,
+            ignore_duplicates=ignore_duplicates,
+            add_permissions=add_permissions,
+            add_storage_permission=add_storage_permission,
+        )
+
     def query_all(
         self,
         credentials: SyftVerifyKey,
         qks: QueryKey | QueryKeys,
         order_by: PartitionKey | None = None,
+        limit: int | None = None,
+        offset: int = 0,
     ) -> Result[list[BaseStash.object_type], str]:
+        res = self._index_and_search_keys(qks)
+        if res.is_err():
+            return res
+        index_qks, search_qks = res.ok()
+
+        return self.partition.find_index_or_search_keys(
+            credentials=credentials,
+            index_qks=index_qks,
+            search_qks=search_qks,
+            order_by=order_by,
+            limit=limit,
+            offset=offset,
+        )
+
+    def iter_query(
+        self,
+        credentials: SyftVerifyKey,
+        qks: QueryKey | QueryKeys,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> Result[Iterator[BaseStash.object_type], str]:
+        res = self._index_and_search_keys(qks)
+        if res.is_err():
+            return res
+        index_qks, search_qks = res.ok()
+
+        return self.partition.iter_query(
+            credentials=credentials,
+            index_qks=index_qks,
+            search_qks=search_qks,
+            batch_size=batch_size,
+        )
+
+    def count(
+        self,
+        credentials: SyftVerifyKey,
+        qks: QueryKey | QueryKeys | None = None,
+        has_permission: bool = False,
+    ) -> Result[int, str]:
+        res = self._index_and_search_keys(QueryKeys(qks=[]) if qks is None else qks)
+        if res.is_err():
+            return res
+        index_qks, search_qks = res.ok()
+
+        return self.partition.count(
+            credentials=credentials,
+            index_qks=index_qks,
+            search_qks=search_qks,
+            has_permission=has_permission,
+        )
+
+    def _index_and_search_keys(
+        self, qks: QueryKey | QueryKeys
+    ) -> Result[tuple[QueryKeys, QueryKeys], str]:
         if isinstance(qks, QueryKey):
             qks = QueryKeys(qks=qks)
 
@@ -669,15 +1176,7 @@ class BaseStash:
                     f"{qk} not in {type(self.partition)} unique or searchable keys"
                 )
 
-        index_qks = QueryKeys(qks=unique_keys)
-        search_qks = QueryKeys(qks=searchable_keys)
-
-        return self.partition.find_index_or_search_keys(
-            credentials=credentials,
-            index_qks=index_qks,
-            search_qks=search_qks,
-            order_by=order_by,
-        )
+        return Ok((QueryKeys(qks=unique_keys), QueryKeys(qks=searchable_keys)))
 
     def query_all_kwargs(
         self,
@@ -685,8 +1184,16 @@ class BaseStash:
         **kwargs: dict[str, Any],
     ) -> Result[list[BaseStash.object_type], str]:
         order_by = kwargs.pop("order_by", None)
+        limit = kwargs.pop("limit", None)
+        offset = kwargs.pop("offset", 0)
         qks = QueryKeys.from_dict(kwargs)
-        return self.query_all(credentials=credentials, qks=qks, order_by=order_by)
+        return self.query_all(
+            credentials=credentials,
+            qks=qks,
+            order_by=order_by,
+            limit=limit,
+            offset=offset,
+        )
 
     def query_one(
         self,
@@ -695,7 +1202,7 @@ class BaseStash:
         order_by: PartitionKey | None = None,
     ) -> Result[BaseStash.object_type | None, str]:
         return self.query_all(
-            credentials=credentials, qks=qks, order_by=order_by
+            credentials=credentials, qks=qks, order_by=order_by, limit=1
         ).and_then(first_or_none)
 
     def query_one_kwargs(
@@ -703,7 +1210,9 @@ class BaseStash:
         credentials: SyftVerifyKey,
         **kwargs: dict[str, Any],
     ) -> Result[BaseStash.object_type | None, str]:
-        return self.query_all_kwargs(credentials, **kwargs).and_then(first_or_none)
+        return self.query_all_kwargs(credentials, limit=1, **kwargs).and_then(
+            first_or_none
+        )
 
     def find_all(
         self, credentials: SyftVerifyKey, **kwargs: dict[str, Any]
@@ -747,6 +1256,26 @@ class BaseStash:
             credentials=credentials, qk=qk, obj=obj, has_permission=has_permission
         )
 
+    def delete_many(
+        self,
+        credentials: SyftVerifyKey,
+        qks: list[QueryKey],
+        has_permission: bool = False,
+    ) -> Result[list[Result[SyftSuccess, str]], str]:
+        return self.partition.delete_many(
+            credentials=credentials, qks=qks, has_permission=has_permission
+        )
+
+    def update_many(
+        self,
+        credentials: SyftVerifyKey,
+        objs: list[BaseStash.object_type],
+        has_permission: bool = False,
+    ) -> Result[list[Result[BaseStash.object_type, str]], str]:
+        return self.partition.update_many(
+            credentials=credentials, objs=objs, has_permission=has_permission
+        )
+
 
 @instrument
 class BaseUIDStoreStash(BaseStash):
@@ -785,6 +1314,34 @@ class BaseUIDStoreStash(BaseStash):
             add_storage_permission=add_storage_permission,
         )
 
+    def set_many(
+        self,
+        credentials: SyftVerifyKey,
+        objs: list[BaseUIDStoreStash.object_type],
+        add_permissions: list[ActionObjectPermission] | None = None,
+        add_storage_permission: bool = True,
+        ignore_duplicates: bool = False,
+    ) -> Result[list[Result[BaseUIDStoreStash.object_type, str]], str]:
+        checked = [self.check_type(obj, self.object_type) for obj in objs]
+        res = super().set_many(
+            credentials=credentials,
+            objs=[check.ok() for check in checked if check.is_ok()],
+            ignore_duplicates=ignore_duplicates,
+            add_permissions=add_permissions,
+            add_storage_permission=add_storage_permission,
+        )
+        if res.is_err():
+            return res
+        # objects with the wrong type keep their type error
+        results = iter(res.ok())
+        return Ok([next(results) if check.is_ok() else check for check in checked])
+
+    def delete_many_by_uid(
+        self, credentials: SyftVerifyKey, uids: list[UID]
+    ) -> Result[list[Result[SyftSuccess, str]], str]:
+        qks = [UIDPartitionKey.with_obj(uid) for uid in uids]
+        return super().delete_many(credentials=credentials, qks=qks)
+
 
 @serializable()
 class StoreConfig(SyftBaseObject):
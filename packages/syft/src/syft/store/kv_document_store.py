@@ -3,7 +3,13 @@ from __future__ import annotations
 
 # stdlib
 from collections import defaultdict
+from collections.abc import Callable
+from collections.abc import Iterable
+from collections.abc import Iterator
+from contextlib import AbstractContextManager
+from contextlib import nullcontext
 from enum import Enum
+import functools
 from typing import Any
 
 # third party
@@ -21,16 +27,32 @@ from ..service.action.action_permissions import ActionObjectPermission
 from ..service.action.action_permissions import ActionObjectREAD
 from ..service.action.action_permissions import ActionObjectWRITE
 from ..service.action.action_permissions import ActionPermission
+from ..service.action.action_permissions import COMPOUND_ACTION_PERMISSION
 from ..service.action.action_permissions import StoragePermission
 from ..service.context import AuthedServiceContext
 from ..service.response import SyftSuccess
 from ..types.syft_object import SyftObject
 from ..types.uid import UID
+from ..util.util import batched
 from .document_store import BaseStash
+from .document_store import DEFAULT_BATCH_SIZE
 from .document_store import PartitionKey
+from .document_store import PartitionKeys
 from .document_store import QueryKey
 from .document_store import QueryKeys
 from .document_store import StorePartition
+from .document_store import permissions_by_uid
+
+
+def write_batch(func: Callable) -> Callable:
+    """Runs all writes of a logical write in one `_write_batch`."""
+
+    @functools.wraps(func)
+    def wrapper(self: KeyValueStorePartition, *args: Any, **kwargs: Any) -> Any:
+        with self._write_batch():
+            return func(self, *args, **kwargs)
+
+    return wrapper
 
 
 @serializable()
@@ -76,7 +98,7 @@ class KeyValueBackingStore:
     def items(self) -> Any:
         raise NotImplementedError
 
-    def pop(self, *args: Any) -> Self:
+    def pop(self, *args: Any) -> Any:
         raise NotImplementedError
 
     def __contains__(self, item: Any) -> bool:
@@ -85,6 +107,68 @@ class KeyValueBackingStore:
     def __iter__(self) -> Any:
         raise NotImplementedError
 
+    def iter_keys(self, batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[Any]:
+        """Iterates over the keys, stores reading them lazily fetch `batch_size`
+        keys at a time."""
+        return iter(list(self.keys()))
+
+    def get_many(self, keys: list[Any]) -> dict[Any, Any]:
+        """The items of the stored keys out of `keys`, in the order of `keys`."""
+        return {key: self[key] for key in keys if key in self}
+
+    def transaction(self) -> AbstractContextManager:
+        """Groups the writes of the block, e.g. in one transaction."""
+        return nullcontext()
+
+    # Set values, stores keeping the items of a set apart override these to
+    # write only the items that change.
+
+    def add_items(self, key: Any, items: Iterable[Any]) -> None:
+        """Adds the items to the set stored at `key`."""
+        values = self[key]
+        values.update(items)
+        self[key] = values
+
+    def remove_items(self, key: Any, items: Iterable[Any]) -> None:
+        """Removes the items from the set stored at `key`."""
+        values = self[key]
+        values.difference_update(items)
+        self[key] = values
+
+    def keys_with_any(self, keys: Iterable[Any], items: set[Any]) -> set[Any]:
+        """The keys out of `keys` whose set holds any of the items."""
+        return {key for key in keys if key in self and not self[key].isdisjoint(items)}
+
+
+def _permission_string(
+    credentials: SyftVerifyKey | None, permission: ActionPermission
+) -> str:
+    # the permission string of every uid, see ActionObjectPermission, without
+    # credentials only the compound permissions can match
+    if permission in COMPOUND_ACTION_PERMISSION or credentials is None:
+        return permission.name
+    return f"{credentials.verify}_{permission.name}"
+
+
+def _is_migrated(stored: SyftObject, obj: SyftObject) -> bool:
+    # a lazily migrated object replaces its stored older version
+    return (
+        stored.__canonical_name__ == obj.__canonical_name__
+        and stored.__version__ != obj.__version__
+    )
+
+
+def _stored_keys(partition_keys: PartitionKeys, obj: SyftObject) -> QueryKeys:
+    # an object stored in an older version has no values for the keys added
+    # since, they aren't in the index either
+    stored = [pk for pk in partition_keys.all if hasattr(obj, pk.key)]
+    return PartitionKeys(pks=stored).with_obj(obj)
+
+
+def _search_items(items: Iterable[Any]) -> list[str]:
+    # the index values of a list key, the strings of its distinct items
+    return list(dict.fromkeys(str(item) for item in items))
+
 
 class KeyValueStorePartition(StorePartition):
     """Key-Value StorePartition
@@ -105,16 +189,9 @@ class KeyValueStorePartition(StorePartition):
             self.data = self.store_config.backing_store(
                 "data", self.settings, self.store_config
             )
-            self.unique_keys = self.store_config.backing_store(
-                "unique_keys", self.settings, self.store_config
-            )
-            self.searchable_keys = self.store_config.backing_store(
-                "searchable_keys", self.settings, self.store_config
-            )
+            self._init_keys()
             # uid -> set['<uid>_permission']
-            self.permissions: dict[UID, set[str]] = self.store_config.backing_store(
-                "permissions", self.settings, self.store_config, ddtype=set
-            )
+            self.permissions: KeyValueBackingStore = self._init_permissions()
 
             # uid -> set['<node_uid>']
             self.storage_permissions: dict[UID, set[UID]] = (
@@ -125,21 +202,96 @@ class KeyValueStorePartition(StorePartition):
                     ddtype=set,
                 )
             )
-
-            for partition_key in self.unique_cks:
-                pk_key = partition_key.key
-                if pk_key not in self.unique_keys:
-                    self.unique_keys[pk_key] = {}
-
-            for partition_key in self.searchable_cks:
-                pk_key = partition_key.key
-                if pk_key not in self.searchable_keys:
-                    self.searchable_keys[pk_key] = defaultdict(list)
         except BaseException as e:
             return Err(str(e))
 
         return Ok(True)
 
+    def _init_permissions(self) -> KeyValueBackingStore:
+        return self.store_config.backing_store(
+            "permissions", self.settings, self.store_config, ddtype=set
+        )
+
+    def _init_keys(self) -> None:
+        # pk_key -> {pk_value: uid}
+        self.unique_keys = self.store_config.backing_store(
+            "unique_keys", self.settings, self.store_config
+        )
+        # pk_key -> {pk_value: [uid, ...]}
+        self.searchable_keys = self.store_config.backing_store(
+            "searchable_keys", self.settings, self.store_config
+        )
+
+        for partition_key in self.unique_cks:
+            pk_key = partition_key.key
+            if pk_key not in self.unique_keys:
+                self.unique_keys[pk_key] = {}
+
+        for partition_key in self.searchable_cks:
+            pk_key = partition_key.key
+            if pk_key not in self.searchable_keys:
+                self.searchable_keys[pk_key] = defaultdict(list)
+
+    # Index primitives, the only methods reading or writing unique_keys and
+    # searchable_keys. Partitions with a native index override these.
+
+    def _get_unique_key(self, pk_key: str, pk_value: Any) -> UID | None:
+        return self.unique_keys[pk_key].get(pk_value)
+
+    def _set_unique_key(self, pk_key: str, pk_value: Any, uid: UID) -> None:
+        ck_col = self.unique_keys[pk_key]
+        ck_col[pk_value] = uid
+        self.unique_keys[pk_key] = ck_col
+
+    def _remove_unique_key(self, pk_key: str, pk_value: Any, uid: UID) -> None:
+        ck_col = self.unique_keys[pk_key]
+        if ck_col.get(pk_value) == uid:
+            del ck_col[pk_value]
+            self.unique_keys[pk_key] = ck_col
+
+    def _add_search_key(self, pk_key: str, pk_value: Any, uid: UID) -> None:
+        ck_col = self.searchable_keys[pk_key]
+        # check if key is present, then add to existing key
+        if pk_value in ck_col:
+            ck_col[pk_value].append(uid)
+        else:
+            # else create the key with a list
+            ck_col[pk_value] = [uid]
+        self.searchable_keys[pk_key] = ck_col
+
+    def _remove_search_key(self, pk_key: str, pk_value: Any, uid: UID) -> None:
+        ck_col = self.searchable_keys[pk_key]
+        uids = ck_col.get(pk_value)
+        if uids is not None and uid in uids:
+            uids.remove(uid)
+            if len(uids) == 0:
+                del ck_col[pk_value]
+            self.searchable_keys[pk_key] = ck_col
+
+    def _find_search_key(self, pk_key: str, pk_value: Any) -> set[UID]:
+        return set(self.searchable_keys[pk_key].get(pk_value, []))
+
+    def _find_search_key_items(self, pk_key: str, items: list) -> set[UID]:
+        matches = set()
+        for item in _search_items(items):
+            matches.update(self._find_search_key(pk_key, item))
+        return matches
+
+    def _add_search_keys(self, qk: QueryKey, uid: UID) -> None:
+        if qk.type_list:
+            # a list is indexed under each of its items, as strings
+            for item in _search_items(qk.value):
+                self._add_search_key(qk.key, item, uid)
+        else:
+            self._add_search_key(qk.key, qk.value, uid)
+
+    def _remove_search_keys(self, qk: QueryKey, uid: UID) -> None:
+        if qk.type_list:
+            for item in _search_items(qk.value):
+                self._remove_search_key(qk.key, item, uid)
+        else:
+            self._remove_search_key(qk.key, qk.value, uid)
+
     def __len__(self) -> int:
         return len(self.data)
 
@@ -166,6 +318,7 @@ class KeyValueStorePartition(StorePartition):
     #       * Do not call the public thread-safe methods here(with locking).
     # These methods are called from the public thread-safe API, and will hang the process.
 
+    @write_batch
     def _set(
         self,
         credentials: SyftVerifyKey,
@@ -211,7 +364,6 @@ class KeyValueStorePartition(StorePartition):
                     searchable_query_keys=searchable_query_keys,
                     obj=obj,
                 )
-                self.data[uid] = obj
 
                 # Add default permissions
                 if uid not in self.permissions:
@@ -253,18 +405,17 @@ class KeyValueStorePartition(StorePartition):
         return Err(f"UID: {uid} already owned.")
 
     def add_permission(self, permission: ActionObjectPermission) -> None:
-        permissions = self.permissions[permission.uid]
-        permissions.add(permission.permission_string)
-        self.permissions[permission.uid] = permissions
+        self.permissions.add_items(permission.uid, [permission.permission_string])
 
     def remove_permission(self, permission: ActionObjectPermission) -> None:
-        permissions = self.permissions[permission.uid]
-        permissions.remove(permission.permission_string)
-        self.permissions[permission.uid] = permissions
+        self.permissions.remove_items(permission.uid, [permission.permission_string])
 
     def add_permissions(self, permissions: list[ActionObjectPermission]) -> None:
-        for permission in permissions:
-            self.add_permission(permission)
+        # write the permissions of every uid once
+        for uid, uid_permissions in permissions_by_uid(permissions).items():
+            self.permissions.add_items(
+                uid, [p.permission_string for p in uid_permissions]
+            )
 
     def has_permission(self, permission: ActionObjectPermission) -> bool:
         if not isinstance(permission.permission, ActionPermission):
@@ -302,6 +453,22 @@ class KeyValueStorePartition(StorePartition):
 
         return False
 
+    def filter_permitted(
+        self,
+        credentials: SyftVerifyKey,
+        uids: Iterable[UID],
+        permission: ActionPermission,
+    ) -> list[UID]:
+        uids = list(uids)
+        # root can do everything, see has_permission
+        if credentials and self.root_verify_key.verify == credentials.verify:
+            return uids
+        granting = {_permission_string(credentials, permission)}
+        if permission == ActionPermission.READ:
+            granting.add(_permission_string(None, ActionPermission.ALL_READ))
+        permitted = self.permissions.keys_with_any(uids, granting)
+        return [uid for uid in uids if uid in permitted]
+
     def _get_permissions_for_uid(self, uid: UID) -> Result[set[str], Err]:
         if uid in self.permissions:
             return Ok(self.permissions[uid])
@@ -313,8 +480,13 @@ class KeyValueStorePartition(StorePartition):
         self.storage_permissions[permission.uid] = permissions
 
     def add_storage_permissions(self, permissions: list[StoragePermission]) -> None:
+        node_uids_by_uid: dict[UID, set[UID]] = defaultdict(set)
         for permission in permissions:
-            self.add_storage_permission(permission)
+            node_uids_by_uid[permission.uid].add(permission.node_uid)
+        for uid, node_uids in node_uids_by_uid.items():
+            storage_permissions = self.storage_permissions[uid]
+            storage_permissions.update(node_uids)
+            self.storage_permissions[uid] = storage_permissions
 
     def remove_storage_permission(self, permission: StoragePermission) -> None:
         permissions = self.storage_permissions[permission.uid]
@@ -334,13 +506,71 @@ class KeyValueStorePartition(StorePartition):
         credentials: SyftVerifyKey,
         order_by: PartitionKey | None = None,
         has_permission: bool | None = False,
+        limit: int | None = None,
+        offset: int = 0,
     ) -> Result[list[BaseStash.object_type], str]:
-        # this checks permissions
-        res = [self._get(uid, credentials, has_permission) for uid in self.data.keys()]
-        result = [x.ok() for x in res if x.is_ok()]
+        return self._read_page(
+            credentials,
+            uids=None,
+            order_by=order_by,
+            has_permission=has_permission,
+            limit=limit,
+            offset=offset,
+        )
+
+    def _read_page(
+        self,
+        credentials: SyftVerifyKey,
+        uids: list[UID] | None,
+        order_by: PartitionKey | None = None,
+        has_permission: bool | None = False,
+        limit: int | None = None,
+        offset: int = 0,
+    ) -> Result[list[SyftObject], str]:
+        """Reads the objects of `uids`, or all objects, the credentials can read.
+
+        For a page the uids are ordered first, so only the objects of the page are
+        read. Orderings the store can't do on the uids sort the objects instead.
+        """
+        paged = limit is not None or offset > 0
         if order_by is not None:
-            result = sorted(result, key=lambda x: getattr(x, order_by.key, ""))
-        return Ok(result)
+            ordered_uids = self._uids_ordered_by(order_by, uids) if paged else None
+            if ordered_uids is None:
+                if paged and uids is not None:
+                    # ties keep the order of the store, like in _all
+                    uids = self._uids_in_store_order(uids)
+                matches = self._read_page(credentials, uids, None, has_permission).ok()
+                matches = sorted(matches, key=lambda x: getattr(x, order_by.key, ""))
+                stop = None if limit is None else offset + limit
+                return Ok(matches[offset:stop])
+            uids = ordered_uids
+        elif uids is None:
+            uids = list(self.data.keys())
+        elif paged and len(uids) > 1:
+            # keep pages of the same query consistent
+            uids = self._uids_in_store_order(uids)
+
+        if not has_permission:
+            uids = self.filter_permitted(credentials, uids, ActionPermission.READ)
+        stop = None if limit is None else offset + limit
+        # uids of the page that aren't stored are left out
+        page = uids[offset:stop]
+        objs = self.data.get_many(page)
+        return Ok([objs[uid] for uid in page if uid in objs])
+
+    def _uids_in_store_order(self, uids: list[UID]) -> list[UID]:
+        """The stored uids out of `uids`, in the order of the store."""
+        uid_set = set(uids)
+        return [uid for uid in self.data.keys() if uid in uid_set]
+
+    def _uids_ordered_by(
+        self, order_by: PartitionKey, uids: list[UID] | None
+    ) -> list[UID] | None:
+        """The stored uids out of `uids`, or all of them, ordered by `order_by`.
+
+        None if the store can't order them without reading the objects.
+        """
+        return None
 
     def _get_storage_permissions_for_uid(self, uid: UID) -> Result[set[UID], Err]:
         if uid in self.storage_permissions:
@@ -355,18 +585,11 @@ class KeyValueStorePartition(StorePartition):
     ) -> None:
         uqks = unique_query_keys.all
         for qk in uqks:
-            pk_key, pk_value = qk.key, qk.value
-            ck_col = self.unique_keys[pk_key]
-            ck_col.pop(store_key.value, None)
-            self.unique_keys[pk_key] = ck_col
+            self._remove_unique_key(qk.key, qk.value, store_key.value)
 
         sqks = searchable_query_keys.all
         for qk in sqks:
-            pk_key, pk_value = qk.key, qk.value
-            ck_col = self.searchable_keys[pk_key]
-            if pk_value in ck_col and (store_key.value in ck_col[pk_value]):
-                ck_col[pk_value].remove(store_key.value)
-            self.searchable_keys[pk_key] = ck_col
+            self._remove_search_keys(qk, store_key.value)
 
     def _find_index_or_search_keys(
         self,
@@ -374,7 +597,30 @@ class KeyValueStorePartition(StorePartition):
         index_qks: QueryKeys,
         search_qks: QueryKeys,
         order_by: PartitionKey | None = None,
+        limit: int | None = None,
+        offset: int = 0,
     ) -> Result[list[SyftObject], str]:
+        res = self._find_uids(index_qks, search_qks)
+        if res.is_err():
+            return res
+        ids = res.ok()
+
+        if ids is None:
+            return Ok([])
+
+        qks: QueryKeys = self.store_query_keys(ids)
+        return self._get_all_from_store(
+            credentials=credentials,
+            qks=qks,
+            order_by=order_by,
+            limit=limit,
+            offset=offset,
+        )
+
+    def _find_uids(
+        self, index_qks: QueryKeys, search_qks: QueryKeys
+    ) -> Result[set[UID] | None, str]:
+        """The uids matching all query keys, None if there are no query keys."""
         ids: set | None = None
         errors = []
         # third party
@@ -401,14 +647,80 @@ class KeyValueStorePartition(StorePartition):
         if len(errors) > 0:
             return Err(" ".join(errors))
 
-        if ids is None:
-            return Ok([])
+        return Ok(ids)
 
-        qks: QueryKeys = self.store_query_keys(ids)
-        return self._get_all_from_store(
-            credentials=credentials, qks=qks, order_by=order_by
-        )
+    def _iter_all(
+        self,
+        credentials: SyftVerifyKey,
+        has_permission: bool | None = False,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> Result[Iterator[list[SyftObject]], str]:
+        uids = self.data.iter_keys(batch_size)
+        return Ok(self._iter_uids(credentials, uids, has_permission, batch_size))
+
+    def _iter_query(
+        self,
+        credentials: SyftVerifyKey,
+        index_qks: QueryKeys,
+        search_qks: QueryKeys,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> Result[Iterator[list[SyftObject]], str]:
+        res = self._find_uids(index_qks, search_qks)
+        if res.is_err():
+            return res
+        ids = res.ok()
 
+        uids = [] if ids is None else self._uids_in_store_order(list(ids))
+        return Ok(self._iter_uids(credentials, uids, False, batch_size))
+
+    def _iter_uids(
+        self,
+        credentials: SyftVerifyKey,
+        uids: Iterable[UID],
+        has_permission: bool | None,
+        batch_size: int,
+    ) -> Iterator[list[SyftObject]]:
+        for batch in batched(uids, batch_size):
+            if not has_permission:
+                batch = self.filter_permitted(credentials, batch, ActionPermission.READ)
+            objs = list(self.data.get_many(batch).values())
+            if len(objs) > 0:
+                yield objs
+
+    def _count(
+        self,
+        credentials: SyftVerifyKey,
+        index_qks: QueryKeys,
+        search_qks: QueryKeys,
+        has_permission: bool | None = False,
+    ) -> Result[int, str]:
+        # root can read everything, see has_permission
+        has_permission = has_permission or (
+            credentials is not None
+            and self.root_verify_key.verify == credentials.verify
+        )
+        if len(index_qks.all) == 0 and len(search_qks.all) == 0:
+            if has_permission:
+                return Ok(len(self.data))
+            uids = self.data.iter_keys()
+        elif has_permission:
+            return self._count_uids(index_qks, search_qks)
+        else:
+            res = self._find_uids(index_qks, search_qks)
+            if res.is_err():
+                return res
+            uids = res.ok()
+
+        return Ok(len(self.filter_permitted(credentials, uids, ActionPermission.READ)))
+
+    def _count_uids(
+        self, index_qks: QueryKeys, search_qks: QueryKeys
+    ) -> Result[int, str]:
+        """Number of uids matching all query keys, stores which can count in
+        their index override this."""
+        return self._find_uids(index_qks, search_qks).map(len)
+
+    @write_batch
     def _update(
         self,
         credentials: SyftVerifyKey,
@@ -425,11 +737,11 @@ class KeyValueStorePartition(StorePartition):
                 ActionObjectWRITE(uid=qk.value, credentials=credentials)
             ):
                 _original_obj = self.data[qk.value]
-                _original_unique_keys = self.settings.unique_keys.with_obj(
-                    _original_obj
+                _original_unique_keys = _stored_keys(
+                    self.settings.unique_keys, _original_obj
                 )
-                _original_searchable_keys = self.settings.searchable_keys.with_obj(
-                    _original_obj
+                _original_searchable_keys = _stored_keys(
+                    self.settings.searchable_keys, _original_obj
                 )
 
                 store_query_key = self.settings.store_key.with_obj(_original_obj)
@@ -442,7 +754,7 @@ class KeyValueStorePartition(StorePartition):
                 )
 
                 # update the object with new data
-                if overwrite:
+                if overwrite or _is_migrated(_original_obj, obj):
                     # Overwrite existing object and their values
                     _original_obj = obj
                 else:
@@ -477,21 +789,68 @@ class KeyValueStorePartition(StorePartition):
         credentials: SyftVerifyKey,
         qks: QueryKeys,
         order_by: PartitionKey | None = None,
+        limit: int | None = None,
+        offset: int = 0,
     ) -> Result[list[SyftObject], str]:
-        matches = []
-        for qk in qks.all:
-            if qk.value in self.data:
-                if self.has_permission(
-                    ActionObjectREAD(uid=qk.value, credentials=credentials)
-                ):
-                    matches.append(self.data[qk.value])
-        if order_by is not None:
-            matches = sorted(matches, key=lambda x: getattr(x, order_by.key, ""))
-        return Ok(matches)
+        return self._read_page(
+            credentials,
+            uids=[qk.value for qk in qks.all],
+            order_by=order_by,
+            limit=limit,
+            offset=offset,
+        )
 
     def create(self, obj: SyftObject) -> Result[SyftObject, str]:
         pass
 
+    def _write_batch(self) -> AbstractContextManager:
+        """Groups the writes of a bulk operation, e.g. in one transaction."""
+        return nullcontext()
+
+    def _set_many(
+        self,
+        credentials: SyftVerifyKey,
+        objs: list[SyftObject],
+        add_permissions: list[ActionObjectPermission] | None = None,
+        add_storage_permission: bool = True,
+        ignore_duplicates: bool = False,
+    ) -> Result[list[Result[SyftObject, str]], str]:
+        with self._write_batch():
+            return super()._set_many(
+                credentials=credentials,
+                objs=objs,
+                add_permissions=add_permissions,
+                add_storage_permission=add_storage_permission,
+                ignore_duplicates=ignore_duplicates,
+            )
+
+    def _update_many(
+        self,
+        credentials: SyftVerifyKey,
+        objs: list[SyftObject],
+        has_permission: bool = False,
+    ) -> Result[list[Result[SyftObject, str]], str]:
+        with self._write_batch():
+            return super()._update_many(
+                credentials=credentials, objs=objs, has_permission=has_permission
+            )
+
+    def _delete_many(
+        self,
+        credentials: SyftVerifyKey,
+        qks: list[QueryKey],
+        has_permission: bool = False,
+    ) -> Result[list[Result[SyftSuccess, str]], str]:
+        with self._write_batch():
+            return super()._delete_many(
+                credentials=credentials, qks=qks, has_permission=has_permission
+            )
+
+    def _write_back(self, objs: list[SyftObject]) -> Result[int, str]:
+        with self._write_batch():
+            return super()._write_back(objs)
+
+    @write_batch
     def _delete(
         self, credentials: SyftVerifyKey, qk: QueryKey, has_permission: bool = False
     ) -> Result[SyftSuccess, Err]:
@@ -513,35 +872,31 @@ class KeyValueStorePartition(StorePartition):
             return Err(f"Failed to delete with query key {qk} with error: {e}")
 
     def _delete_unique_keys_for(self, obj: SyftObject) -> Result[SyftSuccess, str]:
-        for _unique_ck in self.unique_cks:
-            qk = _unique_ck.with_obj(obj)
-            unique_keys = self.unique_keys[qk.key]
-            unique_keys.pop(qk.value, None)
-            self.unique_keys[qk.key] = unique_keys
+        uid = self.settings.store_key.with_obj(obj).value
+        for qk in _stored_keys(PartitionKeys(pks=self.unique_cks), obj).all:
+            self._remove_unique_key(qk.key, qk.value, uid)
         return Ok(SyftSuccess(message="Deleted"))
 
     def _delete_search_keys_for(self, obj: SyftObject) -> Result[SyftSuccess, str]:
-        for _search_ck in self.searchable_cks:
-            qk = _search_ck.with_obj(obj)
-            search_keys = self.searchable_keys[qk.key]
-            search_keys.pop(qk.value, None)
-            self.searchable_keys[qk.key] = search_keys
+        uid = self.settings.store_key.with_obj(obj).value
+        for qk in _stored_keys(PartitionKeys(pks=self.searchable_cks), obj).all:
+            self._remove_search_keys(qk, uid)
         return Ok(SyftSuccess(message="Deleted"))
 
     def _get_keys_index(self, qks: QueryKeys) -> Result[set[Any], str]:
         try:
             # match AND
             subsets: list = []
+            unique_pk_keys = {ck.key for ck in self.unique_cks}
             for qk in qks.all:
                 subset: set = set()
                 pk_key, pk_value = qk.key, qk.value
-                if pk_key not in self.unique_keys:
+                if pk_key not in unique_pk_keys:
                     return Err(f"Failed to query index with {qk}")
-                ck_col = self.unique_keys[pk_key]
-                if pk_value not in ck_col.keys():
+                store_value = self._get_unique_key(pk_key, pk_value)
+                if store_value is None:
                     # must be at least one in all query keys
                     continue
-                store_value = ck_col[pk_value]
                 subsets.append({store_value})
 
             if len(subsets) == 0:
@@ -559,35 +914,18 @@ class KeyValueStorePartition(StorePartition):
         try:
             # match AND
             subsets = []
+            searchable_pk_keys = {ck.key for ck in self.searchable_cks}
             for qk in qks.all:
                 subset: set = set()
                 pk_key, pk_value = qk.key, qk.value
-                if pk_key not in self.searchable_keys:
+                if pk_key not in searchable_pk_keys:
                     return Err(f"Failed to search with {qk}")
-                ck_col = self.searchable_keys[pk_key]
                 if qk.type_list:
-                    # 🟡 TODO: change this hacky way to do on to many relationships
-                    # this is when you search a QueryKey which is a list of items
-                    # at the moment its mostly just a List[UID]
-                    # match OR against all keys for this col
-                    # the values of the list will be turned into strings in a single key
-                    matches = set()
-                    for item in pk_value:
-                        for col_key in ck_col.keys():
-                            if str(item) in col_key:
-                                store_values = ck_col[col_key]
-                                for value in store_values:
-                                    matches.add(value)
-                    if len(matches):
-                        subsets.append(matches)
+                    # match OR against the items of the list
+                    subsets.append(self._find_search_key_items(pk_key, pk_value))
                 else:
-                    # this is the normal path
-                    if pk_value not in ck_col.keys():
-                        # must be at least one in all query keys
-                        subsets.append(set())
-                        continue
-                    store_values = ck_col[pk_value]
-                    subsets.append(set(store_values))
+                    # this is the normal path, must be at least one in all query keys
+                    subsets.append(self._find_search_key(pk_key, pk_value))
 
             if len(subsets) == 0:
                 return Ok(set())
@@ -609,14 +947,14 @@ class KeyValueStorePartition(StorePartition):
             if x.partition_key != self.settings.store_key
         ]
         matches = []
+        unique_pk_keys = {ck.key for ck in self.unique_cks}
         for qk in qks:
             pk_key, pk_value = qk.key, qk.value
-            if pk_key not in self.unique_keys:
+            if pk_key not in unique_pk_keys:
                 raise Exception(
-                    f"pk_key: {pk_key} not in unique_keys: {self.unique_keys.keys()}"
+                    f"pk_key: {pk_key} not in unique_keys: {unique_pk_keys}"
                 )
-            ck_col = self.unique_keys[pk_key]
-            if pk_value in ck_col:
+            if self._get_unique_key(pk_key, pk_value) is not None:
                 matches.append(pk_key)
 
         if len(matches) == 0:
@@ -635,58 +973,56 @@ class KeyValueStorePartition(StorePartition):
     ) -> None:
         uqks = unique_query_keys.all
 
+        # the store key is one of the unique keys
         for qk in uqks:
-            pk_key, pk_value = qk.key, qk.value
-            ck_col = self.unique_keys[pk_key]
-            ck_col[pk_value] = store_query_key.value
-            self.unique_keys[pk_key] = ck_col
-
-        self.unique_keys[store_query_key.key][store_query_key.value] = (
-            store_query_key.value
-        )
+            self._set_unique_key(qk.key, qk.value, store_query_key.value)
 
         sqks = searchable_query_keys.all
         for qk in sqks:
-            pk_key, pk_value = qk.key, qk.value
-            ck_col = self.searchable_keys[pk_key]
-            if qk.type_list:
-                # coerce the list of objects to strings for a single key
-                pk_value = " ".join([str(obj) for obj in pk_value])
-
-            # check if key is present, then add to existing key
-            if pk_value in ck_col:
-                ck_col[pk_value].append(store_query_key.value)
-            else:
-                # else create the key with a list
-                ck_col[pk_value] = [store_query_key.value]
-
-            self.searchable_keys[pk_key] = ck_col
+            self._add_search_keys(qk, store_query_key.value)
 
         self.data[store_query_key.value] = obj
 
     def _migrate_data(
-        self, to_klass: SyftObject, context: AuthedServiceContext, has_permission: bool
+        self,
+        to_klass: SyftObject,
+        context: AuthedServiceContext,
+        has_permission: bool,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        progress: Callable[[int, int], None] | None = None,
     ) -> Result[bool, str]:
         credentials = context.credentials
         has_permission = (credentials == self.root_verify_key) or has_permission
-        if has_permission:
-            for key, value in self.data.items():
-                try:
-                    migrated_value = value.migrate_to(to_klass.__version__, context)
-                except Exception:
-                    return Err(f"Failed to migrate data to {to_klass} for qk: {key}")
-                qk = self.settings.store_key.with_obj(key)
-                result = self._update(
-                    credentials,
-                    qk=qk,
-                    obj=migrated_value,
-                    has_permission=has_permission,
-                    overwrite=True,
-                )
-
-                if result.is_err():
-                    return result.err()
+        if not has_permission:
+            return Err("You don't have permissions to migrate data.")
+
+        total = len(self.data)
+        done = 0
+        batches = self._iter_uids(
+            credentials,
+            self.data.iter_keys(batch_size),
+            has_permission=True,
+            batch_size=batch_size,
+        )
+        for batch in batches:
+            migrated = self._migrate_batch(batch, to_klass, context)
+            if migrated.is_err():
+                return migrated
+
+            with self._write_batch():
+                for migrated_value in migrated.ok():
+                    result = self._update(
+                        credentials,
+                        qk=self.settings.store_key.with_obj(migrated_value.id),
+                        obj=migrated_value,
+                        has_permission=has_permission,
+                        overwrite=True,
+                    )
+                    if result.is_err():
+                        return result
 
-            return Ok(True)
+            done += len(batch)
+            if progress is not None:
+                progress(done, total)
 
-        return Err("You don't have permissions to migrate data.")
+        return Ok(True)
@@ -27,6 +27,7 @@ class LinkedObject(SyftObject):
     object_uid: UID
 
     __exclude_sync_diff_attrs__ = ["node_uid"]
+    __serde_intern__ = True
 
     def __str__(self) -> str:
         resolved_obj_type = (
@@ -1,9 +1,24 @@
 # stdlib
 from collections import defaultdict
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+import os
+from pathlib import Path
+import tempfile
 import threading
 import time
 from typing import Any
 
+try:
+    # stdlib
+    import fcntl
+
+    HAS_FCNTL = True
+except ImportError:
+    # Windows, FileLockingConfig is not supported
+    HAS_FCNTL = False
+
 # third party
 from pydantic import BaseModel
 from sherlock.lock import BaseLock
@@ -29,7 +44,7 @@ class LockingConfig(BaseModel):
         timeout: Optional[int]
              Timeout to acquire lock(seconds)
         retry_interval: float
-            Retry interval to retry acquiring a lock if previous attempts failed.
+            Unused, waiters are woken up as soon as the lock is released.
     """
 
     lock_name: str = "syft_lock"
@@ -57,15 +72,54 @@ class ThreadingLockingConfig(LockingConfig):
     pass
 
 
+@serializable()
+class FileLockingConfig(LockingConfig):
+    """
+    File-based locking policy, shared between processes
+
+    Args:
+        client_path: Optional[Path]
+            Directory of the lock file, defaults to the temp directory.
+    """
+
+    client_path: Path | None = None
+
+
 class ThreadingLock(BaseLock):
     """
     Threading-based Lock. Used to provide the same API as the rest of the locks.
+
+    Waiters block on a condition and are woken as soon as the lock is released
+    or expires, instead of polling for it. They get the lock in the order they
+    started waiting, so a thread releasing and acquiring again in a loop can't
+    starve them.
+
+    The lock can also be held shared by any number of readers. Writers are
+    preferred: once a writer waits, new readers wait behind it. Shared holds
+    don't expire and are not reentrant.
     """
 
-    def __init__(self, expire: int, **kwargs: Any) -> None:
+    def __init__(self, expire: int | None, **kwargs: Any) -> None:
         self.expire = expire
         self.locked_timestamp: float = 0.0
-        self.lock = threading.Lock()
+        self.owned = False
+        self.readers = 0
+        self.condition = threading.Condition(threading.Lock())
+        self.waiters: deque[object] = deque()
+
+    def _expired(self) -> bool:
+        return (
+            self.owned
+            and self.expire is not None
+            and self.expire != -1
+            and time.time() - self.locked_timestamp >= self.expire
+        )
+
+    def _expires_in(self) -> float | None:
+        """Seconds until the lock held now expires, None if it doesn't."""
+        if not self.owned or self.expire is None or self.expire == -1:
+            return None
+        return max(self.locked_timestamp + self.expire - time.time(), 0.0)
 
     @property
     def _locked(self) -> bool:
@@ -74,15 +128,11 @@ class ThreadingLock(BaseLock):
         :returns: if the lock is acquired or not
         :rtype: bool
         """
-        locked = self.lock.locked()
-        if (
-            locked
-            and time.time() - self.locked_timestamp >= self.expire
-            and self.expire != -1
-        ):
-            self._release()
-
-        return self.lock.locked()
+        with self.condition:
+            if self._expired():
+                self.owned = False
+                self.condition.notify_all()
+            return self.owned or self.readers > 0
 
     def _acquire(self) -> bool:
         """
@@ -90,30 +140,255 @@ class ThreadingLock(BaseLock):
         :returns: if the lock was successfully acquired or not
         :rtype: bool
         """
-        locked = self.lock.locked()
-        if (
-            locked
-            and time.time() - self.locked_timestamp > self.expire
-            and self.expire != -1
-        ):
-            self._release()
-
-        status = self.lock.acquire(
-            blocking=False
-        )  # timeout/retries handle in the `acquire` method
-        if status:
+        with self.condition:
+            if self._expired():
+                self.owned = False
+            if self.owned or self.readers or self.waiters:
+                return False
+            self.owned = True
             self.locked_timestamp = time.time()
-        return status
+            return True
+
+    def _acquire_blocking(self, timeout: float | None) -> bool:
+        """
+        Acquire the lock, waiting at most `timeout` seconds, or forever if None.
+        :returns: if the lock was successfully acquired or not
+        :rtype: bool
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self.condition:
+            ticket = object()
+            self.waiters.append(ticket)
+            try:
+                while True:
+                    if self._expired():
+                        self.owned = False
+                    if (
+                        not self.owned
+                        and not self.readers
+                        and self.waiters[0] is ticket
+                    ):
+                        self.owned = True
+                        self.locked_timestamp = time.time()
+                        return True
+
+                    if not self._wait(deadline):
+                        return False
+            finally:
+                self.waiters.remove(ticket)
+                if not self.owned:
+                    # the next waiter, or the readers behind this one, may
+                    # take the lock now
+                    self.condition.notify_all()
+
+    def _wait(self, deadline: float | None) -> bool:
+        """
+        Wait on the condition until notified, the held lock expires or the
+        deadline passes. Must be called with the condition held.
+        :returns: False if the deadline has passed
+        :rtype: bool
+        """
+        wait_time = self._expires_in()
+        if deadline is not None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            wait_time = remaining if wait_time is None else min(wait_time, remaining)
+        self.condition.wait(wait_time)
+        return True
+
+    def _acquire_shared(self) -> bool:
+        """
+        Acquire the lock shared, in a non-blocking fashion.
+        :returns: if the lock was successfully acquired or not
+        :rtype: bool
+        """
+        with self.condition:
+            if self._expired():
+                self.owned = False
+            if self.owned or self.waiters:
+                return False
+            self.readers += 1
+            return True
+
+    def _acquire_shared_blocking(self, timeout: float | None) -> bool:
+        """
+        Acquire the lock shared, waiting at most `timeout` seconds, or forever
+        if None. Waits while a writer holds the lock or is waiting for it.
+        :returns: if the lock was successfully acquired or not
+        :rtype: bool
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self.condition:
+            while True:
+                if self._expired():
+                    self.owned = False
+                if not self.owned and not self.waiters:
+                    self.readers += 1
+                    return True
+                if not self._wait(deadline):
+                    return False
+
+    def _release_shared(self) -> None:
+        """
+        Release a shared hold of the lock.
+        """
+        with self.condition:
+            if self.readers:
+                self.readers -= 1
+                if not self.readers:
+                    self.condition.notify_all()
 
     def _release(self) -> None:
         """
         Implementation of releasing an acquired lock.
         """
+        with self.condition:
+            # releasing an unlocked lock is a no-op
+            if self.owned:
+                self.owned = False
+                self.condition.notify_all()
+
+    def _renew(self) -> bool:
+        """
+        Implementation of renewing an acquired lock.
+        """
+        return True
 
+
+class FileLock(BaseLock):
+    """
+    File-based Lock, shared by all processes using the same lock file.
+
+    The file is locked with `flock`, which the OS releases when the holding
+    process dies, so the lock doesn't expire. Threads of the same process
+    first take a `ThreadingLock` and then wait on the file lock in a helper
+    thread, so waiting can time out but still wakes up as soon as the lock
+    is free.
+
+    Shared holds are taken exclusively, readers don't run concurrently.
+    """
+
+    def __init__(
+        self,
+        lock_name: str,
+        namespace: str | None = None,
+        client_path: Path | None = None,
+        **kwargs: Any,
+    ) -> None:
+        self.lock_name = lock_name
+        self.namespace = namespace
+        directory = Path(tempfile.gettempdir()) if client_path is None else client_path
+        file_name = lock_name if namespace is None else f"{namespace}_{lock_name}"
+        self.lock_file_path = directory / f"{file_name}.lock"
+        self.thread_lock = ThreadingLock(expire=None)
+        self._fd: int | None = None
+
+    def _open(self) -> int:
+        self.lock_file_path.parent.mkdir(parents=True, exist_ok=True)
+        return os.open(self.lock_file_path, os.O_RDWR | os.O_CREAT, 0o600)
+
+    def _try_flock(self, fd: int) -> bool:
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            return False
+        return True
+
+    @property
+    def _locked(self) -> bool:
+        """
+        Implementation of method to check if lock has been acquired.
+        :returns: if the lock is acquired or not
+        :rtype: bool
+        """
+        if self.thread_lock.locked():
+            return True
+        fd = self._open()
         try:
-            return self.lock.release()
-        except RuntimeError:  # already unlocked
-            pass
+            if not self._try_flock(fd):
+                return True
+            fcntl.flock(fd, fcntl.LOCK_UN)
+            return False
+        finally:
+            os.close(fd)
+
+    def _acquire(self) -> bool:
+        """
+        Implementation of acquiring a lock in a non-blocking fashion.
+        :returns: if the lock was successfully acquired or not
+        :rtype: bool
+        """
+        if not self.thread_lock._acquire():
+            return False
+        fd = self._open()
+        if not self._try_flock(fd):
+            os.close(fd)
+            self.thread_lock._release()
+            return False
+        self._fd = fd
+        return True
+
+    def _acquire_blocking(self, timeout: float | None) -> bool:
+        """
+        Acquire the lock, waiting at most `timeout` seconds, or forever if None.
+        :returns: if the lock was successfully acquired or not
+        :rtype: bool
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        if not self.thread_lock._acquire_blocking(timeout):
+            return False
+
+        fd = self._open()
+        if self._try_flock(fd):
+            self._fd = fd
+            return True
+
+        # another process holds the lock, flock can only wait without a
+        # timeout, so it waits in a helper thread
+        state = {"acquired": False, "cancelled": False}
+        state_lock = threading.Lock()
+        acquired = threading.Event()
+
+        def wait_for_flock() -> None:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            with state_lock:
+                if state["cancelled"]:
+                    fcntl.flock(fd, fcntl.LOCK_UN)
+                    os.close(fd)
+                    return
+                state["acquired"] = True
+            acquired.set()
+
+        threading.Thread(target=wait_for_flock, daemon=True).start()
+        remaining = None if deadline is None else max(deadline - time.monotonic(), 0)
+        acquired.wait(remaining)
+        with state_lock:
+            if not state["acquired"]:
+                state["cancelled"] = True
+                self.thread_lock._release()
+                return False
+        self._fd = fd
+        return True
+
+    def _release(self) -> None:
+        """
+        Implementation of releasing an acquired lock.
+        """
+        fd, self._fd = self._fd, None
+        if fd is not None:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+            os.close(fd)
+        self.thread_lock._release()
+
+    def _acquire_shared(self) -> bool:
+        return self._acquire()
+
+    def _acquire_shared_blocking(self, timeout: float | None) -> bool:
+        return self._acquire_blocking(timeout)
+
+    def _release_shared(self) -> None:
+        self._release()
 
     def _renew(self) -> bool:
         """
@@ -154,6 +429,10 @@ class SyftLock(BaseLock):
             self.passthrough = True
         elif isinstance(config, ThreadingLockingConfig):
             self._lock = ThreadingLock(**base_params)
+        elif isinstance(config, FileLockingConfig):
+            if not HAS_FCNTL:
+                raise ValueError("FileLockingConfig is not supported on this platform")
+            self._lock = FileLock(client_path=config.client_path, **base_params)
         else:
             raise ValueError("Unsupported config type")
 
@@ -180,22 +459,75 @@ class SyftLock(BaseLock):
 
         if not blocking:
             return self._acquire()
+        if self.passthrough:
+            return True
 
-        timeout: float = float(self.timeout)
-        start_time = time.time()
-        elapsed: float = 0.0
-        while timeout >= elapsed:
-            if not self._acquire():
-                time.sleep(self.retry_interval)
-                elapsed = time.time() - start_time
-            else:
+        timeout = None if self.timeout is None else float(self.timeout)
+        try:
+            if self._lock and self._lock._acquire_blocking(timeout):
                 return True
+        except BaseException:
+            return False
         print(
             f"Timeout elapsed after {self.timeout} seconds while trying to acquiring lock."
         )
         # third party
         return False
 
+    def acquire_shared(self, blocking: bool = True) -> bool:
+        """
+        Acquire the lock shared with other readers, blocking or non-blocking.
+        Readers wait for the writer holding the lock and for the writers
+        already waiting for it.
+        :param bool blocking: acquire a lock in a blocking or non-blocking
+                              fashion. Defaults to True.
+        :returns: if the lock was successfully acquired or not
+        :rtype: bool
+        """
+        if self.passthrough:
+            return True
+        if not self._lock:
+            return False
+
+        try:
+            if not blocking:
+                return self._lock._acquire_shared()
+            timeout = None if self.timeout is None else float(self.timeout)
+            if self._lock._acquire_shared_blocking(timeout):
+                return True
+        except BaseException:
+            return False
+        print(
+            f"Timeout elapsed after {self.timeout} seconds while trying to acquiring shared lock."
+        )
+        return False
+
+    def release_shared(self) -> None:
+        """
+        Release a lock acquired with `acquire_shared`.
+        """
+        if self.passthrough or not self._lock:
+            return None
+        try:
+            self._lock._release_shared()
+        except BaseException:
+            return None
+
+    @contextmanager
+    def shared(self) -> Iterator[None]:
+        """
+        Hold the lock shared for the duration of the block.
+        :raises TimeoutError: if the lock could not be acquired
+        """
+        if not self.acquire_shared(blocking=True):
+            raise TimeoutError(
+                f"Failed to acquire shared lock for the operation {self.lock_name} ({self._lock})"
+            )
+        try:
+            yield
+        finally:
+            self.release_shared()
+
     def _acquire(self) -> bool:
         """
         Implementation of acquiring a lock in a non-blocking fashion.
@@ -22,7 +22,7 @@ class SyftMongoBinaryDecoder(TypeDecoder):
 
     def transform_bson(self, value: Any) -> Any:
         if value.subtype == USER_DEFINED_SUBTYPE:
-            return _deserialize(value, from_bytes=True)
+            return _deserialize(value, from_bytes=True, trusted=True)
         return value
 
 
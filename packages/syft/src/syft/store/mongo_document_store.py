@@ -1,11 +1,14 @@
 # stdlib
 from collections.abc import Callable
+from collections.abc import Iterator
 from typing import Any
 from typing import Set  # noqa: UP035
 
 # third party
 from pydantic import Field
 from pymongo import ASCENDING
+from pymongo import InsertOne
+from pymongo import UpdateOne
 from pymongo.collection import Collection as MongoCollection
 from result import Err
 from result import Ok
@@ -34,6 +37,8 @@ from ..types.transforms import TransformContext
 from ..types.transforms import transform
 from ..types.transforms import transform_method
 from ..types.uid import UID
+from ..util.util import batched
+from .document_store import DEFAULT_BATCH_SIZE
 from .document_store import DocumentStore
 from .document_store import PartitionKey
 from .document_store import PartitionSettings
@@ -41,6 +46,7 @@ from .document_store import QueryKey
 from .document_store import QueryKeys
 from .document_store import StoreConfig
 from .document_store import StorePartition
+from .document_store import permissions_by_uid
 from .kv_document_store import KeyValueBackingStore
 from .locks import LockingConfig
 from .locks import NoLockingConfig
@@ -115,7 +121,7 @@ def syft_obj_to_mongo() -> list[Callable]:
 def from_mongo(
     storage_obj: dict, context: TransformContext | None = None
 ) -> SyftObject:
-    return _deserialize(storage_obj["__blob__"], from_bytes=True)
+    return _deserialize(storage_obj["__blob__"], from_bytes=True, trusted=True)
 
 
 @serializable(attrs=["storage_type"])
@@ -163,7 +169,26 @@ class MongoStorePartition(StorePartition):
         self._permissions = collection_permissions_status.ok()
         self._storage_permissions = collection_storage_permissions_status.ok()
 
-        return self._create_update_index()
+        self._convert_permission_sets()
+        index_status = self._create_update_index()
+        if index_status.is_err():
+            return index_status
+        return self._create_list_indexes()
+
+    def _convert_permission_sets(self) -> None:
+        """Permissions used to be stored as sets, which the codec stores as opaque
+        binaries. Rewrite them as arrays, so queries can filter by permission."""
+        ops = [
+            UpdateOne(
+                {"_id": doc["_id"]},
+                {"$set": {"permissions": sorted(doc["permissions"])}},
+            )
+            for doc in self._permissions.find(
+                {"permissions": {"$not": {"$type": "array"}}}
+            )
+        ]
+        if len(ops) > 0:
+            self._permissions.bulk_write(ops)
 
     # Potentially thread-unsafe methods.
     #
@@ -227,6 +252,31 @@ class MongoStorePartition(StorePartition):
 
         return Ok(True)
 
+    def _create_list_indexes(self) -> Result[Ok, Err]:
+        """Create multikey indexes for the searchable keys holding lists, so
+        `$in` queries on them look up the index of the items"""
+        collection_status = self.collection
+        if collection_status.is_err():
+            return collection_status
+        collection: MongoCollection = collection_status.ok()
+
+        object_name = self.settings.object_type.__canonical_name__
+        for partition_key in self.searchable_cks:
+            if not partition_key.type_list:
+                continue
+            index_name = f"{object_name}_{partition_key.key}_index_name"
+            try:
+                # a no-op if the index exists already
+                collection.create_index(
+                    [(partition_key.key, ASCENDING)], name=index_name
+                )
+            except Exception:
+                return Err(
+                    f"Failed to create index for {object_name} with key: {partition_key.key}"
+                )
+
+        return Ok(True)
+
     @property
     def collection(self) -> Result[MongoCollection, Err]:
         if not hasattr(self, "_collection"):
@@ -380,17 +430,244 @@ class MongoStorePartition(StorePartition):
         else:
             return Err(f"Failed to update obj {obj}, you have no permission")
 
+    def _existing_unique_keys(
+        self, collection: MongoCollection, objs: list[SyftObject]
+    ) -> Set[tuple[str, Any]]:  # noqa: UP006
+        """(key, value) pairs of the unique keys of the objs which are taken."""
+        unique_qks = [self.settings.unique_keys.with_obj(obj) for obj in objs]
+        query = {
+            "$or": [{k: v} for qks in unique_qks for k, v in qks.as_dict_mongo.items()]
+        }
+        existing_keys = set()
+        for storage_obj in collection.find(query):
+            obj = self.storage_type(storage_obj)
+            transform_context = TransformContext(output={}, obj=obj)
+            syft_obj = obj.to(self.settings.object_type, transform_context)
+            for qk in self.settings.unique_keys.with_obj(syft_obj).all:
+                existing_keys.add((qk.key, qk.value))
+        return existing_keys
+
+    def _set_many(
+        self,
+        credentials: SyftVerifyKey,
+        objs: list[SyftObject],
+        add_permissions: list[ActionObjectPermission] | None = None,
+        add_storage_permission: bool = True,
+        ignore_duplicates: bool = False,
+    ) -> Result[list[Result[SyftObject, str]], str]:
+        if len(objs) == 0:
+            return Ok([])
+
+        collection_status = self.collection
+        if collection_status.is_err():
+            return collection_status
+        collection: MongoCollection = collection_status.ok()
+
+        collection_permissions_status = self.permissions
+        if collection_permissions_status.is_err():
+            return collection_permissions_status
+        collection_permissions: MongoCollection = collection_permissions_status.ok()
+
+        storage_permissions_or_err = self.storage_permissions
+        if storage_permissions_or_err.is_err():
+            return storage_permissions_or_err
+        storage_permissions_collection: MongoCollection = (
+            storage_permissions_or_err.ok()
+        )
+
+        uids = [obj.id for obj in objs]
+        owned_uids = {
+            doc["_id"] for doc in collection_permissions.find({"_id": {"$in": uids}})
+        }
+        node_uids_by_uid = {
+            doc["_id"]: doc["node_uids"]
+            for doc in storage_permissions_collection.find({"_id": {"$in": uids}})
+        }
+        taken_keys = self._existing_unique_keys(collection, objs)
+        permissions_dict = permissions_by_uid(add_permissions)
+
+        results: list[Result[SyftObject, str]] = []
+        storage_objs = []
+        permission_docs = []
+        storage_permission_ops: list[InsertOne | UpdateOne] = []
+        for obj in objs:
+            unique_query_keys: QueryKeys = self.settings.unique_keys.with_obj(obj)
+            keys = [(qk.key, qk.value) for qk in unique_query_keys.all]
+            if any(key in taken_keys for key in keys):
+                if ignore_duplicates:
+                    results.append(Ok(obj))
+                else:
+                    keys_str = ", ".join(
+                        f"`{key.key}`" for key in unique_query_keys.all
+                    )
+                    results.append(
+                        Err(
+                            f"Duplication Key Error for {obj}.\n"
+                            f"The fields that should be unique are {keys_str}."
+                        )
+                    )
+                continue
+            if obj.id in owned_uids:
+                # the first one using the UID owns it, see take_ownership
+                results.append(Err(f"No permission to write object with id {obj.id}"))
+                continue
+
+            taken_keys.update(keys)
+            owned_uids.add(obj.id)
+            storage_objs.append(obj.to(self.storage_type))
+            permissions = [
+                ActionObjectOWNER(uid=obj.id, credentials=credentials),
+                ActionObjectWRITE(uid=obj.id, credentials=credentials),
+                ActionObjectREAD(uid=obj.id, credentials=credentials),
+                ActionObjectEXECUTE(uid=obj.id, credentials=credentials),
+                *permissions_dict.get(obj.id, []),
+            ]
+            permission_docs.append(
+                {
+                    "_id": obj.id,
+                    "permissions": sorted({p.permission_string for p in permissions}),
+                }
+            )
+            if add_storage_permission:
+                if obj.id in node_uids_by_uid:
+                    node_uids = node_uids_by_uid[obj.id] | {self.node_uid}
+                    storage_permission_ops.append(
+                        UpdateOne({"_id": obj.id}, {"$set": {"node_uids": node_uids}})
+                    )
+                else:
+                    storage_permission_ops.append(
+                        InsertOne({"_id": obj.id, "node_uids": {self.node_uid}})
+                    )
+            results.append(Ok(obj))
+
+        if len(storage_objs) > 0:
+            collection.insert_many(storage_objs)
+            collection_permissions.insert_many(permission_docs)
+        if len(storage_permission_ops) > 0:
+            storage_permissions_collection.bulk_write(storage_permission_ops)
+        return Ok(results)
+
+    def _update_many(
+        self,
+        credentials: SyftVerifyKey,
+        objs: list[SyftObject],
+        has_permission: bool = False,
+    ) -> Result[list[Result[SyftObject, str]], str]:
+        if len(objs) == 0:
+            return Ok([])
+
+        collection_status = self.collection
+        if collection_status.is_err():
+            return collection_status
+        collection: MongoCollection = collection_status.ok()
+
+        collection_permissions_status = self.permissions
+        if collection_permissions_status.is_err():
+            return collection_permissions_status
+        collection_permissions: MongoCollection = collection_permissions_status.ok()
+
+        uids = [obj.id for obj in objs]
+        existing_uids = {doc["_id"] for doc in collection.find({"_id": {"$in": uids}})}
+        permissions_by_doc = {
+            doc["_id"]: doc
+            for doc in collection_permissions.find({"_id": {"$in": uids}})
+        }
+
+        results: list[Result[SyftObject, str]] = []
+        ops = []
+        for obj in objs:
+            qk = self.settings.store_key.with_obj(obj)
+            write_permission = ActionObjectWRITE(uid=obj.id, credentials=credentials)
+            if obj.id not in existing_uids:
+                results.append(Err(f"Missing values for query key: {qk}"))
+            elif not (
+                has_permission
+                or self._permission_granted(
+                    write_permission, permissions_by_doc.get(obj.id)
+                )
+            ):
+                results.append(
+                    Err(f"Failed to update obj {obj}, you have no permission")
+                )
+            else:
+                storage_obj = obj.to(self.storage_type)
+                ops.append(UpdateOne(qk.as_dict_mongo, {"$set": storage_obj}))
+                results.append(Ok(obj))
+
+        if len(ops) > 0:
+            collection.bulk_write(ops)
+        return Ok(results)
+
+    def _delete_many(
+        self,
+        credentials: SyftVerifyKey,
+        qks: list[QueryKey],
+        has_permission: bool = False,
+    ) -> Result[list[Result[SyftSuccess, str]], str]:
+        if len(qks) == 0:
+            return Ok([])
+
+        collection_status = self.collection
+        if collection_status.is_err():
+            return collection_status
+        collection: MongoCollection = collection_status.ok()
+
+        collection_permissions_status = self.permissions
+        if collection_permissions_status.is_err():
+            return collection_permissions_status
+        collection_permissions: MongoCollection = collection_permissions_status.ok()
+
+        uids = [qk.value for qk in qks]
+        existing_uids = {doc["_id"] for doc in collection.find({"_id": {"$in": uids}})}
+        permissions_by_doc = {
+            doc["_id"]: doc
+            for doc in collection_permissions.find({"_id": {"$in": uids}})
+        }
+
+        results: list[Result[SyftSuccess, str]] = []
+        deleted_uids = []
+        for qk in qks:
+            write_permission = ActionObjectWRITE(uid=qk.value, credentials=credentials)
+            if not (
+                has_permission
+                or self._permission_granted(
+                    write_permission, permissions_by_doc.get(qk.value)
+                )
+            ):
+                results.append(
+                    Err(f"You don't have permission to delete object with qk: {qk}")
+                )
+            elif qk.value not in existing_uids:
+                results.append(Err(f"Failed to delete object with qk: {qk}"))
+            else:
+                existing_uids.remove(qk.value)
+                deleted_uids.append(qk.value)
+                results.append(
+                    Ok(SyftSuccess(message="Object and its permission are deleted"))
+                )
+
+        if len(deleted_uids) > 0:
+            collection.delete_many({"_id": {"$in": deleted_uids}})
+            collection_permissions.delete_many({"_id": {"$in": deleted_uids}})
+        return Ok(results)
+
     def _find_index_or_search_keys(
         self,
         credentials: SyftVerifyKey,
         index_qks: QueryKeys,
         search_qks: QueryKeys,
         order_by: PartitionKey | None = None,
+        limit: int | None = None,
+        offset: int = 0,
     ) -> Result[list[SyftObject], str]:
         # TODO: pass index as hint to find method
         qks = QueryKeys(qks=(list(index_qks.all) + list(search_qks.all)))
         return self._get_all_from_store(
-            credentials=credentials, qks=qks, order_by=order_by
+            credentials=credentials,
+            qks=qks,
+            order_by=order_by,
+            limit=limit,
+            offset=offset,
         )
 
     @property
@@ -403,6 +680,9 @@ class MongoStorePartition(StorePartition):
         credentials: SyftVerifyKey,
         qks: QueryKeys,
         order_by: PartitionKey | None = None,
+        limit: int | None = None,
+        offset: int = 0,
+        *,
         has_permission: bool | None = False,
     ) -> Result[list[SyftObject], str]:
         collection_status = self.collection
@@ -410,26 +690,147 @@ class MongoStorePartition(StorePartition):
             return collection_status
         collection: MongoCollection = collection_status.ok()
 
-        if order_by is not None:
-            storage_objs = collection.find(filter=qks.as_dict_mongo).sort(order_by.key)
-        else:
-            _default_key = "_id"
-            storage_objs = collection.find(filter=qks.as_dict_mongo).sort(_default_key)
-        syft_objs = []
-        for storage_obj in storage_objs:
-            obj = self.storage_type(storage_obj)
-            transform_context = TransformContext(output={}, obj=obj)
-            syft_objs.append(obj.to(self.settings.object_type, transform_context))
+        collection_permissions_status = self.permissions
+        if collection_permissions_status.is_err():
+            return collection_permissions_status
+        collection_permissions: MongoCollection = collection_permissions_status.ok()
+
+        # one aggregation selects the readable page, instead of checking the
+        # permissions of every object with its own query
+        sort_key = order_by.key if order_by is not None else "_id"
+        pipeline: list[dict[str, Any]] = [
+            {"$match": qks.as_dict_mongo},
+            {"$sort": {sort_key: 1}},
+        ]
+        if not has_permission:
+            pipeline += self._readable_stages(credentials, collection_permissions)
+        if offset > 0:
+            pipeline.append({"$skip": offset})
+        if limit is not None:
+            pipeline.append({"$limit": limit})
 
-        # TODO: maybe do this in loop before this
         res = []
-        for s in syft_objs:
-            if has_permission or self.has_permission(
-                ActionObjectREAD(uid=s.id, credentials=credentials)
-            ):
-                res.append(s)
+        for storage_obj in collection.aggregate(pipeline):
+            obj = self.storage_type(storage_obj)
+            transform_context = TransformContext(output={}, obj=obj)
+            res.append(obj.to(self.settings.object_type, transform_context))
         return Ok(res)
 
+    def _iter_all(
+        self,
+        credentials: SyftVerifyKey,
+        has_permission: bool | None = False,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> Result[Iterator[list[SyftObject]], str]:
+        return self._iter_from_store(
+            credentials, QueryKeys(qks=()), has_permission, batch_size
+        )
+
+    def _iter_query(
+        self,
+        credentials: SyftVerifyKey,
+        index_qks: QueryKeys,
+        search_qks: QueryKeys,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> Result[Iterator[list[SyftObject]], str]:
+        qks = QueryKeys(qks=(list(index_qks.all) + list(search_qks.all)))
+        return self._iter_from_store(credentials, qks, False, batch_size)
+
+    def _iter_from_store(
+        self,
+        credentials: SyftVerifyKey,
+        qks: QueryKeys,
+        has_permission: bool | None,
+        batch_size: int,
+    ) -> Result[Iterator[list[SyftObject]], str]:
+        collection_status = self.collection
+        if collection_status.is_err():
+            return collection_status
+        collection: MongoCollection = collection_status.ok()
+
+        collection_permissions_status = self.permissions
+        if collection_permissions_status.is_err():
+            return collection_permissions_status
+        collection_permissions: MongoCollection = collection_permissions_status.ok()
+
+        # the query only runs once the cursor is iterated
+        pipeline: list[dict[str, Any]] = [
+            {"$match": qks.as_dict_mongo},
+            {"$sort": {"_id": 1}},
+        ]
+        if not has_permission:
+            pipeline += self._readable_stages(credentials, collection_permissions)
+        storage_objs = collection.aggregate(pipeline, batchSize=batch_size)
+        return Ok(self._iter_storage_objs(storage_objs, batch_size))
+
+    def _iter_storage_objs(
+        self, storage_objs: Iterator[dict], batch_size: int
+    ) -> Iterator[list[SyftObject]]:
+        for batch in batched(storage_objs, batch_size):
+            res = []
+            for storage_obj in batch:
+                obj = self.storage_type(storage_obj)
+                transform_context = TransformContext(output={}, obj=obj)
+                res.append(obj.to(self.settings.object_type, transform_context))
+            yield res
+
+    def _readable_stages(
+        self, credentials: SyftVerifyKey, collection_permissions: MongoCollection
+    ) -> list[dict[str, Any]]:
+        """Aggregation stages keeping the objects the credentials can read, with
+        the same rules as `_permission_granted`: the root key reads every object
+        with permissions, others need their READ or the ALL_READ permission."""
+        if credentials and self.root_verify_key.verify == credentials.verify:
+            readable: dict[str, Any] = {"_permissions": {"$ne": []}}
+        else:
+            permission_strings = [
+                ActionObjectREAD(uid=None, credentials=credentials).permission_string,
+                ActionPermission.ALL_READ.name,
+            ]
+            readable = {"_permissions.permissions": {"$in": permission_strings}}
+        return [
+            {
+                "$lookup": {
+                    "from": collection_permissions.name,
+                    "localField": "_id",
+                    "foreignField": "_id",
+                    "as": "_permissions",
+                }
+            },
+            {"$match": readable},
+            {"$project": {"_permissions": 0}},
+        ]
+
+    def _count(
+        self,
+        credentials: SyftVerifyKey,
+        index_qks: QueryKeys,
+        search_qks: QueryKeys,
+        has_permission: bool | None = False,
+    ) -> Result[int, str]:
+        collection_status = self.collection
+        if collection_status.is_err():
+            return collection_status
+        collection: MongoCollection = collection_status.ok()
+
+        qks = QueryKeys(qks=(list(index_qks.all) + list(search_qks.all)))
+        if has_permission:
+            return Ok(collection.count_documents(filter=qks.as_dict_mongo))
+
+        collection_permissions_status = self.permissions
+        if collection_permissions_status.is_err():
+            return collection_permissions_status
+        collection_permissions: MongoCollection = collection_permissions_status.ok()
+
+        pipeline: list[dict[str, Any]] = [
+            {"$match": qks.as_dict_mongo},
+            {"$project": {"_id": 1}},
+        ]
+        pipeline += self._readable_stages(credentials, collection_permissions)
+        pipeline.append({"$count": "count"})
+        counts = list(collection.aggregate(pipeline))
+        return Ok(counts[0]["count"] if counts else 0)
+
     def _delete(
         self, credentials: SyftVerifyKey, qk: QueryKey, has_permission: bool = False
     ) -> Result[SyftSuccess, Err]:
@@ -475,7 +876,12 @@ class MongoStorePartition(StorePartition):
         permissions: dict | None = collection_permissions.find_one(
             {"_id": permission.uid}
         )
+        return self._permission_granted(permission, permissions)
 
+    def _permission_granted(
+        self, permission: ActionObjectPermission, permissions: dict | None
+    ) -> bool:
+        """Check the permission against the permission document of its object"""
         if permissions is None:
             return False
 
@@ -522,7 +928,7 @@ class MongoStorePartition(StorePartition):
 
         # find the permissions for the given permission.uid
         # e.g. permissions = {"_id": "7b88fdef6bff42a8991d294c3d66f757",
-        #                      "permissions": set(["permission_str_1", "permission_str_2"]}}
+        #                      "permissions": ["permission_str_1", "permission_str_2"]}
         permissions: dict | None = collection_permissions.find_one(
             {"_id": permission.uid}
         )
@@ -531,15 +937,16 @@ class MongoStorePartition(StorePartition):
             collection_permissions.insert_one(
                 {
                     "_id": permission.uid,
-                    "permissions": {permission.permission_string},
+                    "permissions": [permission.permission_string],
                 }
             )
         else:
             # update the permissions with the new permission string
-            permission_strings: set = permissions["permissions"]
+            permission_strings: set = set(permissions["permissions"])
             permission_strings.add(permission.permission_string)
             collection_permissions.update_one(
-                {"_id": permission.uid}, {"$set": {"permissions": permission_strings}}
+                {"_id": permission.uid},
+                {"$set": {"permissions": sorted(permission_strings)}},
             )
 
     def add_permissions(self, permissions: list[ActionObjectPermission]) -> None:
@@ -558,13 +965,13 @@ class MongoStorePartition(StorePartition):
         )
         if permissions is None:
             return Err(f"permission with UID {permission.uid} not found!")
-        permissions_strings: set = permissions["permissions"]
+        permissions_strings: set = set(permissions["permissions"])
         if permission.permission_string in permissions_strings:
             permissions_strings.remove(permission.permission_string)
             if len(permissions_strings) > 0:
                 collection_permissions.update_one(
                     {"_id": permission.uid},
-                    {"$set": {"permissions": permissions_strings}},
+                    {"$set": {"permissions": sorted(permissions_strings)}},
                 )
             else:
                 collection_permissions.delete_one({"_id": permission.uid})
@@ -699,6 +1106,8 @@ class MongoStorePartition(StorePartition):
         credentials: SyftVerifyKey,
         order_by: PartitionKey | None = None,
         has_permission: bool | None = False,
+        limit: int | None = None,
+        offset: int = 0,
     ) -> Result[list[SyftObject], str]:
         qks = QueryKeys(qks=())
         return self._get_all_from_store(
@@ -706,6 +1115,8 @@ class MongoStorePartition(StorePartition):
             qks=qks,
             order_by=order_by,
             has_permission=has_permission,
+            limit=limit,
+            offset=offset,
         )
 
     def __len__(self) -> int:
@@ -716,40 +1127,51 @@ class MongoStorePartition(StorePartition):
         return collection.count_documents(filter={})
 
     def _migrate_data(
-        self, to_klass: SyftObject, context: AuthedServiceContext, has_permission: bool
+        self,
+        to_klass: SyftObject,
+        context: AuthedServiceContext,
+        has_permission: bool,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        progress: Callable[[int, int], None] | None = None,
     ) -> Result[bool, str]:
         credentials = context.credentials
         has_permission = (credentials == self.root_verify_key) or has_permission
+        if not has_permission:
+            return Err("You don't have permissions to migrate data.")
+
         collection_status = self.collection
         if collection_status.is_err():
             return collection_status
         collection: MongoCollection = collection_status.ok()
 
-        if has_permission:
-            storage_objs = collection.find({})
-            for storage_obj in storage_objs:
+        total = collection.count_documents(filter={})
+        done = 0
+        storage_objs = collection.find({}).batch_size(batch_size)
+        for batch in batched(storage_objs, batch_size):
+            values = []
+            for storage_obj in batch:
                 obj = self.storage_type(storage_obj)
                 transform_context = TransformContext(output={}, obj=obj)
-                value = obj.to(self.settings.object_type, transform_context)
-                key = obj.get("_id")
-                try:
-                    migrated_value = value.migrate_to(to_klass.__version__, context)
-                except Exception:
-                    return Err(f"Failed to migrate data to {to_klass} for qk: {key}")
-                qk = self.settings.store_key.with_obj(key)
-                result = self._update(
-                    credentials,
-                    qk=qk,
-                    obj=migrated_value,
-                    has_permission=has_permission,
-                )
+                values.append(obj.to(self.settings.object_type, transform_context))
 
+            migrated = self._migrate_batch(values, to_klass, context)
+            if migrated.is_err():
+                return migrated
+
+            results = self._update_many(
+                credentials, migrated.ok(), has_permission=has_permission
+            )
+            if results.is_err():
+                return results
+            for result in results.ok():
                 if result.is_err():
-                    return result.err()
+                    return result
 
-            return Ok(True)
+            done += len(batch)
+            if progress is not None:
+                progress(done, total)
 
-        return Err("You don't have permissions to migrate data.")
+        return Ok(True)
 
 
 @serializable()
@@ -878,7 +1300,7 @@ class MongoBackingStore(KeyValueBackingStore):
 
         result: dict | None = collection.find_one({"_id": key})
         if result is not None:
-            return _deserialize(result[f"{key}"], from_bytes=True)
+            return _deserialize(result[f"{key}"], from_bytes=True, trusted=True)
         else:
             # raise KeyError(f"{key} does not exist")
             # return an empty set which is the same with SQLiteBackingStore
@@ -932,7 +1354,9 @@ class MongoBackingStore(KeyValueBackingStore):
         keys, values = [], []
         for row in result:
             keys.append(row["_id"])
-            values.append(_deserialize(row[f"{row['_id']}"], from_bytes=True))
+            values.append(
+                _deserialize(row[f"{row['_id']}"], from_bytes=True, trusted=True)
+            )
         return dict(zip(keys, values))
 
     def keys(self) -> Any:
@@ -2,11 +2,17 @@
 from __future__ import annotations
 
 # stdlib
-from collections import defaultdict
+from collections.abc import Iterable
+from collections.abc import Iterator
+from contextlib import AbstractContextManager
+from contextlib import contextmanager
 from copy import deepcopy
+from enum import Enum
+import json
 from pathlib import Path
 import sqlite3
 import tempfile
+import threading
 from typing import Any
 
 # third party
@@ -18,33 +24,175 @@ from result import Result
 from typing_extensions import Self
 
 # relative
+from ..node.credentials import SyftVerifyKey
 from ..serde.deserialize import _deserialize
 from ..serde.serializable import serializable
 from ..serde.serialize import _serialize
+from ..service.action.action_permissions import ActionPermission
+from ..service.action.action_permissions import COMPOUND_ACTION_PERMISSION
 from ..types.uid import UID
-from ..util.util import thread_ident
+from ..util.util import batched
+from .document_store import DEFAULT_BATCH_SIZE
 from .document_store import DocumentStore
+from .document_store import PartitionKey
+from .document_store import PartitionKeys
 from .document_store import PartitionSettings
+from .document_store import QueryKey
+from .document_store import QueryKeys
 from .document_store import StoreClientConfig
 from .document_store import StoreConfig
 from .kv_document_store import KeyValueBackingStore
 from .kv_document_store import KeyValueStorePartition
+from .kv_document_store import _search_items
+from .kv_document_store import _stored_keys
 from .locks import LockingConfig
 from .locks import NoLockingConfig
 from .locks import SyftLock
 
-# here we can create a single connection per cache_key
-# since pytest is concurrent processes, we need to isolate each connection
-# by its filename and optionally the thread that its running in
-# we keep track of each SQLiteBackingStore init in REF_COUNTS
-# when it hits 0 we can close the connection and release the file descriptor
-SQLITE_CONNECTION_POOL_DB: dict[str, sqlite3.Connection] = {}
-SQLITE_CONNECTION_POOL_CUR: dict[str, sqlite3.Cursor] = {}
-REF_COUNTS: dict[str, int] = defaultdict(int)
 
+class SQLiteConnectionPool:
+    """Connections to one SQLite database file.
 
-def cache_key(db_name: str) -> str:
-    return f"{db_name}_{thread_ident()}"
+    SQLite allows a single writer at a time, so all writes go through one
+    connection guarded by `write_lock`. Reads go through a read-only
+    connection per thread, in WAL mode they neither block each other nor the
+    writer. A thread inside a transaction reads through the writer to see its
+    uncommitted writes.
+    """
+
+    def __init__(self, file_path: Path, timeout: float) -> None:
+        self.file_path = file_path
+        self.timeout = timeout
+        self.ref_count = 0
+        self.write_lock = threading.RLock()
+        self.transaction_depth = 0
+        self._transaction_thread: int | None = None
+        self._writer: sqlite3.Connection | None = None
+        # thread ident -> connection
+        self._readers: dict[int, sqlite3.Connection] = {}
+        self._readers_lock = threading.Lock()
+
+    def _connect(self, read_only: bool) -> sqlite3.Connection:
+        self.file_path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(
+            self.file_path,
+            timeout=self.timeout,
+            # readers are closed by the thread closing the pool, the writer
+            # is shared behind write_lock
+            check_same_thread=False,
+        )
+        # Set journal mode to WAL.
+        connection.execute("PRAGMA journal_mode = WAL")
+        connection.execute("PRAGMA busy_timeout = 5000")
+        connection.execute("PRAGMA temp_store = 2")
+        connection.execute("PRAGMA synchronous = 1")
+        if read_only:
+            connection.execute("PRAGMA query_only = 1")
+        return connection
+
+    @property
+    def writer(self) -> sqlite3.Connection:
+        if self._writer is None:
+            with self.write_lock:
+                if self._writer is None:
+                    self._writer = self._connect(read_only=False)
+        return self._writer
+
+    @property
+    def reader(self) -> sqlite3.Connection:
+        ident = threading.get_ident()
+        if self._transaction_thread == ident:
+            return self.writer
+
+        connection = self._readers.get(ident)
+        if connection is None:
+            with self._readers_lock:
+                self._close_dead_readers()
+                connection = self._connect(read_only=True)
+                self._readers[ident] = connection
+        return connection
+
+    def _close_dead_readers(self) -> None:
+        alive = {thread.ident for thread in threading.enumerate()}
+        for ident in self._readers.keys() - alive:
+            self._readers.pop(ident).close()
+
+    def write(self, sql: str, *args: list[Any] | None) -> sqlite3.Cursor:
+        with self.write_lock:
+            try:
+                cursor = self.writer.execute(sql, *args)
+            except Exception:
+                # don't leave the implicit transaction of the statement open
+                if self.transaction_depth == 0:
+                    self.writer.rollback()
+                raise
+            if self.transaction_depth == 0:
+                self.writer.commit()
+            return cursor
+
+    def read(self, sql: str, *args: list[Any] | None) -> sqlite3.Cursor:
+        return self.reader.execute(sql, *args)
+
+    def commit(self) -> None:
+        with self.write_lock:
+            if self.transaction_depth == 0 and self._writer is not None:
+                self._writer.commit()
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Commits all writes of the block at once, or rolls them back.
+
+        Holds the write lock for the whole block. Transactions nest.
+        """
+        with self.write_lock:
+            self.transaction_depth += 1
+            self._transaction_thread = threading.get_ident()
+            try:
+                yield
+            except BaseException:
+                self._end_transaction(commit=False)
+                raise
+            self._end_transaction(commit=True)
+
+    def _end_transaction(self, commit: bool) -> None:
+        self.transaction_depth -= 1
+        if self.transaction_depth > 0:
+            return
+        self._transaction_thread = None
+        if commit:
+            self.writer.commit()
+        else:
+            self.writer.rollback()
+
+    def close(self) -> None:
+        with self.write_lock:
+            if self._writer is not None:
+                self._writer.commit()
+                self._writer.close()
+                self._writer = None
+        with self._readers_lock:
+            for connection in self._readers.values():
+                connection.close()
+            self._readers.clear()
+
+
+# One pool per database file and process. We keep track of each
+# SQLiteBackingStore init in the ref_count of its pool, when it hits 0 we
+# close the connections and release the file descriptors
+SQLITE_CONNECTION_POOLS: dict[str, SQLiteConnectionPool] = {}
+SQLITE_CONNECTION_POOLS_LOCK = threading.Lock()
+
+
+def get_connection_pool(file_path: Path, timeout: float) -> SQLiteConnectionPool:
+    key = str(file_path)
+    pool = SQLITE_CONNECTION_POOLS.get(key)
+    if pool is None:
+        with SQLITE_CONNECTION_POOLS_LOCK:
+            pool = SQLITE_CONNECTION_POOLS.get(key)
+            if pool is None:
+                pool = SQLiteConnectionPool(file_path, timeout)
+                SQLITE_CONNECTION_POOLS[key] = pool
+    return pool
 
 
 def _repr_debug_(value: Any) -> str:
@@ -103,76 +251,59 @@ class SQLiteBackingStore(KeyValueBackingStore):
 
         self.lock = SyftLock(NoLockingConfig())
         self.create_table()
-        REF_COUNTS[cache_key(self.db_filename)] += 1
+        self.pool.ref_count += 1
 
     @property
     def table_name(self) -> str:
         return f"{self.settings.name}_{self.index_name}"
 
-    def _connect(self) -> None:
-        # SQLite is not thread safe by default so we ensure that each connection
-        # comes from a different thread. In cases of Uvicorn and other AWSGI servers
-        # there will be many threads handling incoming requests so we need to ensure
-        # that different connections are used in each thread. By using a dict for the
-        # _db and _cur we can ensure they are never shared
-
-        path = Path(self.file_path)
-        if not path.exists():
-            path.parent.mkdir(parents=True, exist_ok=True)
-
-        if self.store_config.client_config:
-            connection = sqlite3.connect(
-                self.file_path,
-                timeout=self.store_config.client_config.timeout,
-                check_same_thread=False,  # do we need this if we use the lock?
-                # check_same_thread=self.store_config.client_config.check_same_thread,
-            )
-            # Set journal mode to WAL.
-            connection.execute("PRAGMA journal_mode = WAL")
-            connection.execute("PRAGMA busy_timeout = 5000")
-            connection.execute("PRAGMA temp_store = 2")
-            connection.execute("PRAGMA synchronous = 1")
-            SQLITE_CONNECTION_POOL_DB[cache_key(self.db_filename)] = connection
+    @property
+    def pool(self) -> SQLiteConnectionPool:
+        client_config = self.store_config.client_config
+        if client_config is None:
+            raise ValueError(f"No client config for the SQLite table {self.table_name}")
+        return get_connection_pool(Path(self.file_path), client_config.timeout)
 
     def create_table(self) -> None:
         try:
             with self.lock:
-                self.cur.execute(
+                self.pool.write(
                     f"create table {self.table_name} (uid VARCHAR(32) NOT NULL PRIMARY KEY, "  # nosec
                     + "repr TEXT NOT NULL, value BLOB NOT NULL, "  # nosec
                     + "sqltime TIMESTAMP DEFAULT CURRENT_TIMESTAMP NOT NULL)"  # nosec
                 )
-                self.db.commit()
         except Exception as e:
             raise_exception(self.table_name, e)
 
     @property
     def db(self) -> sqlite3.Connection:
-        if cache_key(self.db_filename) not in SQLITE_CONNECTION_POOL_DB:
-            self._connect()
-        return SQLITE_CONNECTION_POOL_DB[cache_key(self.db_filename)]
-
-    @property
-    def cur(self) -> sqlite3.Cursor:
-        if cache_key(self.db_filename) not in SQLITE_CONNECTION_POOL_CUR:
-            SQLITE_CONNECTION_POOL_CUR[cache_key(self.db_filename)] = self.db.cursor()
-
-        return SQLITE_CONNECTION_POOL_CUR[cache_key(self.db_filename)]
+        return self.pool.writer
 
     def _close(self) -> None:
-        self._commit()
-        REF_COUNTS[cache_key(self.db_filename)] -= 1
-        if REF_COUNTS[cache_key(self.db_filename)] <= 0:
+        pool = self.pool
+        pool.commit()
+        pool.ref_count -= 1
+        if pool.ref_count <= 0:
             # once you close it seems like other object references can't re-use the
             # same connection
-            self.db.close()
-            del SQLITE_CONNECTION_POOL_DB[cache_key(self.db_filename)]
+            pool.close()
+            with SQLITE_CONNECTION_POOLS_LOCK:
+                if SQLITE_CONNECTION_POOLS.get(str(pool.file_path)) is pool:
+                    del SQLITE_CONNECTION_POOLS[str(pool.file_path)]
         else:
             # don't close yet because another SQLiteBackingStore is probably still open
             pass
 
     def _commit(self) -> None:
-        self.db.commit()
+        self.pool.commit()
+
+    def transaction(self) -> AbstractContextManager:
+        """Commits all statements of the block at once, or rolls them back.
+
+        Every store on the same file shares the writer connection, so their
+        statements are part of the transaction too. Transactions nest.
+        """
+        return self.pool.transaction()
 
     def _execute(
         self, sql: str, *args: list[Any] | None
@@ -181,7 +312,7 @@ class SQLiteBackingStore(KeyValueBackingStore):
             cursor: sqlite3.Cursor | None = None
             # err = None
             try:
-                cursor = self.cur.execute(sql, *args)
+                cursor = self.pool.write(sql, *args)
             except Exception as e:
                 raise_exception(self.table_name, e)
 
@@ -190,24 +321,34 @@ class SQLiteBackingStore(KeyValueBackingStore):
             # rather than halting the program like disk I/O error etc
             # self.db.rollback()  # Roll back all changes if an exception occurs.
             # err = Err(str(e))
-            self.db.commit()  # Commit if everything went ok
 
             # if err is not None:
             #     return err
 
             return Ok(cursor)
 
+    def _query(
+        self, sql: str, *args: list[Any] | None
+    ) -> Result[Ok[sqlite3.Cursor], Err[str]]:
+        """Like _execute, for statements which only read."""
+        cursor: sqlite3.Cursor | None = None
+        try:
+            cursor = self.pool.read(sql, *args)
+        except Exception as e:
+            raise_exception(self.table_name, e)
+        return Ok(cursor)
+
     def _set(self, key: UID, value: Any) -> None:
-        if self._exists(key):
-            self._update(key, value)
-        else:
-            insert_sql = (
-                f"insert into {self.table_name} (uid, repr, value) VALUES (?, ?, ?)"  # nosec
-            )
-            data = _serialize(value, to_bytes=True)
-            res = self._execute(insert_sql, [str(key), _repr_debug_(value), data])
-            if res.is_err():
-                raise ValueError(res.err())
+        # one statement instead of checking for the row first, an existing row
+        # keeps its sqltime like with _update
+        upsert_sql = (
+            f"insert into {self.table_name} (uid, repr, value) VALUES (?, ?, ?) "  # nosec
+            + "on conflict (uid) do update set repr = excluded.repr, value = excluded.value"
+        )
+        data = _serialize(value, to_bytes=True)
+        res = self._execute(upsert_sql, [str(key), _repr_debug_(value), data])
+        if res.is_err():
+            raise ValueError(res.err())
 
     def _update(self, key: UID, value: Any) -> None:
         insert_sql = (
@@ -220,7 +361,7 @@ class SQLiteBackingStore(KeyValueBackingStore):
 
     def _get(self, key: UID) -> Any:
         select_sql = f"select * from {self.table_name} where uid = ? order by sqltime"  # nosec
-        res = self._execute(select_sql, [str(key)])
+        res = self._query(select_sql, [str(key)])
         if res.is_err():
             raise KeyError(f"Query {select_sql} failed")
         cursor = res.ok()
@@ -229,12 +370,12 @@ class SQLiteBackingStore(KeyValueBackingStore):
         if row is None or len(row) == 0:
             raise KeyError(f"{key} not in {type(self)}")
         data = row[2]
-        return _deserialize(data, from_bytes=True)
+        return _deserialize(data, from_bytes=True, trusted=True)
 
     def _exists(self, key: UID) -> bool:
         select_sql = f"select uid from {self.table_name} where uid = ?"  # nosec
 
-        res = self._execute(select_sql, [str(key)])
+        res = self._query(select_sql, [str(key)])
         if res.is_err():
             return False
         cursor = res.ok()
@@ -246,11 +387,11 @@ class SQLiteBackingStore(KeyValueBackingStore):
         return bool(row)
 
     def _get_all(self) -> Any:
-        select_sql = f"select * from {self.table_name} order by sqltime"  # nosec
+        select_sql = f"select * from {self.table_name} order by sqltime, rowid"  # nosec
         keys = []
         data = []
 
-        res = self._execute(select_sql)
+        res = self._query(select_sql)
         if res.is_err():
             return {}
         cursor = res.ok()
@@ -261,14 +402,14 @@ class SQLiteBackingStore(KeyValueBackingStore):
 
         for row in rows:
             keys.append(UID(row[0]))
-            data.append(_deserialize(row[2], from_bytes=True))
+            data.append(_deserialize(row[2], from_bytes=True, trusted=True))
         return dict(zip(keys, data))
 
     def _get_all_keys(self) -> Any:
-        select_sql = f"select uid from {self.table_name} order by sqltime"  # nosec
+        select_sql = f"select uid from {self.table_name} order by sqltime, rowid"  # nosec
         keys = []
 
-        res = self._execute(select_sql)
+        res = self._query(select_sql)
         if res.is_err():
             return []
         cursor = res.ok()
@@ -281,6 +422,51 @@ class SQLiteBackingStore(KeyValueBackingStore):
             keys.append(UID(row[0]))
         return keys
 
+    def _get_keys_in(self, keys: list[UID]) -> list[UID]:
+        """The stored keys out of `keys`, in the order of `_get_all_keys`."""
+        select_sql = (
+            f"select uid from {self.table_name} "  # nosec
+            + "where uid in (select value from json_each(?)) order by sqltime, rowid"
+        )
+        res = self._query(select_sql, [json.dumps([str(key) for key in keys])])
+        if res.is_err():
+            return []
+        return [UID(row[0]) for row in res.ok().fetchall()]
+
+    def _iter_keys(self, batch_size: int) -> Iterator[UID]:
+        # every batch is a query of its own, a cursor left open between batches
+        # would pin the snapshot of the reader while the keys are consumed
+        select_sql = (
+            f"select uid, sqltime, rowid from {self.table_name} "  # nosec
+            + "where (sqltime, rowid) > (?, ?) order by sqltime, rowid limit ?"
+        )
+        last: list[Any] = ["", 0]
+        while True:
+            res = self._query(select_sql, [*last, batch_size])
+            if res.is_err():
+                raise ValueError(res.err())
+            rows = res.ok().fetchall()
+            for row in rows:
+                yield UID(row[0])
+            if len(rows) < batch_size:
+                return
+            last = list(rows[-1][1:])
+
+    def _get_many(self, keys: list[UID]) -> dict[UID, Any]:
+        select_sql = (
+            f"select uid, value from {self.table_name} "  # nosec
+            + "where uid in (select value from json_each(?))"
+        )
+        res = self._query(select_sql, [json.dumps([str(key) for key in keys])])
+        if res.is_err():
+            raise ValueError(res.err())
+        data = dict(res.ok().fetchall())
+        return {
+            key: _deserialize(data[str(key)], from_bytes=True, trusted=True)
+            for key in keys
+            if str(key) in data
+        }
+
     def _delete(self, key: UID) -> None:
         select_sql = f"delete from {self.table_name} where uid = ?"  # nosec
         res = self._execute(select_sql, [str(key)])
@@ -295,7 +481,7 @@ class SQLiteBackingStore(KeyValueBackingStore):
 
     def _len(self) -> int:
         select_sql = f"select count(uid) from {self.table_name}"  # nosec
-        res = self._execute(select_sql)
+        res = self._query(select_sql)
         if res.is_err():
             raise ValueError(res.err())
         cursor = res.ok()
@@ -337,7 +523,13 @@ class SQLiteBackingStore(KeyValueBackingStore):
     def items(self) -> Any:
         return self._get_all().items()
 
-    def pop(self, key: Any) -> Self:
+    def iter_keys(self, batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[UID]:
+        return self._iter_keys(batch_size)
+
+    def get_many(self, keys: list[UID]) -> dict[UID, Any]:
+        return self._get_many(keys)
+
+    def pop(self, key: Any) -> Any:
         value = self._get(key)
         self._delete(key)
         return value
@@ -356,6 +548,334 @@ class SQLiteBackingStore(KeyValueBackingStore):
             pass
 
 
+def _index_value(value: Any) -> str | int | float | bytes:
+    # index values don't depend on the serializer: ids, verify keys and enums
+    # are stored as their text or number, only values without a stable plain
+    # form fall back to their serialized bytes. sqlite stores bools as 0 and 1,
+    # they are serialized so they don't match the equal ints
+    if isinstance(value, Enum):
+        value = value.value
+    if isinstance(value, bool):
+        return _serialize(value, to_bytes=True, for_hashing=True)
+    if isinstance(value, str | int | float):
+        return value
+    if isinstance(value, UID):
+        return str(value)
+    if isinstance(value, SyftVerifyKey):
+        return value.verify
+    return _serialize(value, to_bytes=True, for_hashing=True)
+
+
+@serializable(attrs=["index_name", "settings", "store_config", "unique"])
+class SQLiteIndexStore(SQLiteBackingStore):
+    """Index table mapping the values of unique or searchable keys to uids.
+
+    Every (key_name, key_value, uid) is one row in a table with a B-tree index,
+    so writes and lookups don't touch the entries of other objects.
+
+    Parameters:
+        `unique`: bool
+            Whether a key value maps to a single uid
+        `outdated_index_names`: list[str], optional
+            Tables of older index formats, like the dicts of the KeyValue
+            index. They are dropped when the index table is created, and the
+            partition indexes its data again.
+    """
+
+    def __init__(
+        self,
+        index_name: str,
+        settings: PartitionSettings,
+        store_config: StoreConfig,
+        unique: bool,
+        outdated_index_names: list[str] | None = None,
+    ) -> None:
+        self.unique = unique
+        self.outdated_index_names = outdated_index_names or []
+        super().__init__(index_name, settings, store_config)
+
+    def create_table(self) -> None:
+        self.created = False
+        primary_key = (
+            "key_name, key_value" if self.unique else "key_name, key_value, uid"
+        )
+        try:
+            with self.lock, self.pool.transaction():
+                self.db.execute(
+                    f"create table {self.table_name} (key_name TEXT NOT NULL, "  # nosec
+                    + "key_value BLOB NOT NULL, uid VARCHAR(32) NOT NULL, "  # nosec
+                    + f"PRIMARY KEY ({primary_key}))"  # nosec
+                )
+                self.created = True
+                for outdated_index_name in self.outdated_index_names:
+                    self.db.execute(
+                        "drop table if exists "  # nosec
+                        + f"{self.settings.name}_{outdated_index_name}"
+                    )
+        except Exception as e:
+            raise_exception(self.table_name, e)
+
+    def add(self, key_name: str, key_value: Any, uid: UID) -> None:
+        # a unique key value moves to the new uid, like assigning in a dict
+        insert_sql = (
+            f"insert or replace into {self.table_name} (key_name, key_value, uid) "  # nosec
+            + "VALUES (?, ?, ?)"
+        )
+        self._execute(insert_sql, [key_name, _index_value(key_value), str(uid)])
+
+    def remove(self, key_name: str, key_value: Any, uid: UID) -> None:
+        delete_sql = (
+            f"delete from {self.table_name} "  # nosec
+            + "where key_name = ? and key_value = ? and uid = ?"
+        )
+        self._execute(delete_sql, [key_name, _index_value(key_value), str(uid)])
+
+    def find(self, key_name: str, key_value: Any) -> set[UID]:
+        select_sql = (
+            f"select uid from {self.table_name} "  # nosec
+            + "where key_name = ? and key_value = ?"
+        )
+        res = self._query(select_sql, [key_name, _index_value(key_value)])
+        return {UID(row[0]) for row in res.ok().fetchall()}
+
+    def find_any(self, key_name: str, key_values: list[str]) -> set[UID]:
+        """Uids with any of the text values of the key."""
+        select_sql = (
+            f"select uid from {self.table_name} where key_name = ? "  # nosec
+            + "and key_value in (select value from json_each(?))"
+        )
+        res = self._query(select_sql, [key_name, json.dumps(key_values)])
+        return {UID(row[0]) for row in res.ok().fetchall()}
+
+    def remove_keys(self, key_names: list[str]) -> None:
+        """Removes all values of the keys."""
+        delete_sql = (
+            f"delete from {self.table_name} "  # nosec
+            + "where key_name in (select value from json_each(?))"
+        )
+        self._execute(delete_sql, [json.dumps(key_names)])
+
+    def count(self, key_values: list[tuple[str, Any]]) -> int:
+        """Number of uids with all of the (key_name, key_value) pairs."""
+        select_sql = (
+            f"select uid from {self.table_name} "  # nosec
+            + "where key_name = ? and key_value = ?"
+        )
+        count_sql = f"select count(*) from ({' intersect '.join([select_sql] * len(key_values))})"  # nosec
+        args = [
+            arg
+            for key_name, key_value in key_values
+            for arg in (key_name, _index_value(key_value))
+        ]
+        res = self._query(count_sql, args)
+        return res.ok().fetchone()[0]
+
+    def ordered_uids(
+        self, key_name: str, data_table_name: str, uids: list[UID] | None = None
+    ) -> list[UID]:
+        """Uids of the rows in the data table ordered by their value of the key."""
+        select_sql = (
+            f"select i.uid from {self.table_name} i join {data_table_name} d "  # nosec
+            + "on d.uid = i.uid where i.key_name = ?"
+        )
+        args = [key_name]
+        if uids is not None:
+            select_sql += " and i.uid in (select value from json_each(?))"
+            args.append(json.dumps([str(uid) for uid in uids]))
+        # ties keep the order of the data table
+        select_sql += " order by i.key_value, d.sqltime, d.rowid"
+        res = self._query(select_sql, args)
+        return [UID(row[0]) for row in res.ok().fetchall()]
+
+    def __repr__(self) -> str:
+        res = self._query(f"select key_name, key_value, uid from {self.table_name}")  # nosec
+        return repr(res.ok().fetchall())
+
+
+def _permission_row(permission_string: str) -> tuple[str, int]:
+    # "<verify_key>_<PERMISSION>" or a compound "ALL_<PERMISSION>"
+    if permission_string in {p.name for p in COMPOUND_ACTION_PERMISSION}:
+        credentials, name = "", permission_string
+    else:
+        credentials, _, name = permission_string.rpartition("_")
+    return credentials, ActionPermission[name].value
+
+
+# permission of the row every uid has, so a uid without permissions still
+# maps to an empty set
+_NO_PERMISSION = 0
+
+
+def _permission_string(credentials: str, permission: int) -> str:
+    name = ActionPermission(permission).name
+    return f"{credentials}_{name}" if credentials else name
+
+
+@serializable(attrs=["index_name", "settings", "store_config"])
+class SQLitePermissionStore(SQLiteBackingStore):
+    """Permissions of the objects, as a mapping of uid to permission strings.
+
+    Every permission is one (uid, credentials, permission) row with the enum
+    value of the permission, indexed by uid and by credentials. Adding or
+    checking a permission only touches its own rows, and the uids permitted to
+    some credentials are selected in one query. Every uid also has a row
+    without a permission, it stays when all permissions are removed.
+
+    Parameters:
+        `legacy_index_name`: str, optional
+            Table of the older store, which kept one serialized set per uid.
+            It is imported and dropped when the table is created.
+    """
+
+    def __init__(
+        self,
+        index_name: str,
+        settings: PartitionSettings,
+        store_config: StoreConfig,
+        legacy_index_name: str | None = None,
+    ) -> None:
+        self.legacy_index_name = legacy_index_name
+        super().__init__(index_name, settings, store_config, ddtype=set)
+
+    def create_table(self) -> None:
+        try:
+            with self.lock, self.pool.transaction():
+                self.db.execute(
+                    f"create table {self.table_name} (uid VARCHAR(32) NOT NULL, "  # nosec
+                    + "credentials TEXT NOT NULL, permission INTEGER NOT NULL, "  # nosec
+                    + "PRIMARY KEY (uid, credentials, permission))"
+                )
+                self.db.execute(
+                    f"create index {self.table_name}_credentials on {self.table_name} "  # nosec
+                    + "(credentials, permission)"
+                )
+                self._import_legacy_index()
+        except Exception as e:
+            raise_exception(self.table_name, e)
+
+    def _import_legacy_index(self) -> None:
+        if self.legacy_index_name is None:
+            return
+        legacy_table_name = f"{self.settings.name}_{self.legacy_index_name}"
+        exists = self.db.execute(
+            "select name from sqlite_master where type = 'table' and name = ?",
+            [legacy_table_name],
+        ).fetchone()
+        if exists is None:
+            return
+
+        rows = self.db.execute(
+            f"select uid, value from {legacy_table_name}"  # nosec
+        ).fetchall()
+        for uid, data in rows:
+            permission_rows = [
+                _permission_row(permission_string)
+                for permission_string in _deserialize(data, from_bytes=True)
+            ]
+            for permission_row in [("", _NO_PERMISSION), *permission_rows]:
+                self.db.execute(
+                    f"insert or ignore into {self.table_name} "  # nosec
+                    + "(uid, credentials, permission) VALUES (?, ?, ?)",
+                    [uid, *permission_row],
+                )
+        self.db.execute(f"drop table {legacy_table_name}")  # nosec
+
+    def add_items(self, key: UID, items: Iterable[str]) -> None:
+        insert_sql = (
+            f"insert or ignore into {self.table_name} (uid, credentials, permission) "  # nosec
+            + "select ?, json_extract(value, '$[0]'), json_extract(value, '$[1]') "
+            + "from json_each(?)"
+        )
+        rows = [("", _NO_PERMISSION), *(_permission_row(item) for item in items)]
+        self._execute(insert_sql, [str(key), json.dumps(rows)])
+
+    def remove_items(self, key: UID, items: Iterable[str]) -> None:
+        delete_sql = (
+            f"delete from {self.table_name} "  # nosec
+            + "where uid = ? and credentials = ? and permission = ?"
+        )
+        for item in items:
+            self._execute(delete_sql, [str(key), *_permission_row(item)])
+
+    def keys_with_any(self, keys: Iterable[UID], items: set[str]) -> set[UID]:
+        if len(items) == 0:
+            return set()
+        conditions = " or ".join(["(credentials = ? and permission = ?)"] * len(items))
+        select_sql = (
+            f"select distinct uid from {self.table_name} "  # nosec
+            + f"where uid in (select value from json_each(?)) and ({conditions})"
+        )
+        keys = list(keys)
+        args = [json.dumps([str(key) for key in keys])]
+        for item in items:
+            args.extend(_permission_row(item))
+        res = self._query(select_sql, args)
+        permitted = {row[0] for row in res.ok().fetchall()}
+        return {key for key in keys if str(key) in permitted}
+
+    def _set(self, key: UID, value: set[str]) -> None:
+        with self.pool.transaction():
+            self._delete(key)
+            self.add_items(key, value)
+
+    def _update(self, key: UID, value: set[str]) -> None:
+        self._set(key, value)
+
+    def _get(self, key: UID) -> set[str]:
+        select_sql = (
+            f"select credentials, permission from {self.table_name} "  # nosec
+            + "where uid = ? and permission != ?"
+        )
+        res = self._query(select_sql, [str(key), _NO_PERMISSION])
+        return {_permission_string(*row) for row in res.ok().fetchall()}
+
+    def _get_many(self, keys: list[UID]) -> dict[UID, set[str]]:
+        select_sql = (
+            f"select uid, credentials, permission from {self.table_name} "  # nosec
+            + "where uid in (select value from json_each(?))"
+        )
+        res = self._query(select_sql, [json.dumps([str(key) for key in keys])])
+        permissions: dict[str, set[str]] = {}
+        for uid, credentials, permission in res.ok().fetchall():
+            uid_permissions = permissions.setdefault(uid, set())
+            if permission != _NO_PERMISSION:
+                uid_permissions.add(_permission_string(credentials, permission))
+        return {key: permissions[str(key)] for key in keys if str(key) in permissions}
+
+    def _get_all(self) -> dict[UID, set[str]]:
+        return self._get_many(self._get_all_keys())
+
+    def _get_all_keys(self) -> list[UID]:
+        select_sql = (
+            f"select uid from {self.table_name} group by uid order by min(rowid)"  # nosec
+        )
+        res = self._query(select_sql)
+        return [UID(row[0]) for row in res.ok().fetchall()]
+
+    def _get_keys_in(self, keys: list[UID]) -> list[UID]:
+        keys_with_rows = set(self._get_many(keys))
+        return [key for key in self._get_all_keys() if key in keys_with_rows]
+
+    def _iter_keys(self, batch_size: int) -> Iterator[UID]:
+        yield from self._get_all_keys()
+
+    def _exists(self, key: UID) -> bool:
+        select_sql = f"select 1 from {self.table_name} where uid = ? limit 1"  # nosec
+        res = self._query(select_sql, [str(key)])
+        return res.ok().fetchone() is not None
+
+    def _len(self) -> int:
+        select_sql = f"select count(distinct uid) from {self.table_name}"  # nosec
+        res = self._query(select_sql)
+        return res.ok().fetchone()[0]
+
+    def pop(self, key: Any) -> set[str]:
+        with self.pool.transaction():
+            value = self._get(key)
+            self._delete(key)
+        return value
+
+
 @serializable()
 class SQLiteStorePartition(KeyValueStorePartition):
     """SQLite StorePartition
@@ -385,10 +905,134 @@ class SQLiteStorePartition(KeyValueStorePartition):
             self.data._commit()
             self.unique_keys._commit()
             self.searchable_keys._commit()
+            self.searchable_items._commit()
         except BaseException:
             pass
         self.lock.release()
 
+    def _write_batch(self) -> AbstractContextManager:
+        return self.data.transaction()
+
+    def _init_permissions(self) -> SQLitePermissionStore:
+        return SQLitePermissionStore(
+            "permission_index",
+            self.settings,
+            self.store_config,
+            legacy_index_name="permissions",
+        )
+
+    def _init_keys(self) -> None:
+        # the version in the table names is the format of the index values
+        self.unique_keys = SQLiteIndexStore(
+            "unique_index_v2",
+            self.settings,
+            self.store_config,
+            unique=True,
+            outdated_index_names=["unique_keys", "unique_index"],
+        )
+        self.searchable_keys = SQLiteIndexStore(
+            "searchable_index_v2",
+            self.settings,
+            self.store_config,
+            unique=False,
+            outdated_index_names=["searchable_keys", "searchable_index"],
+        )
+        # list keys, indexed under each of their items
+        self.searchable_items = SQLiteIndexStore(
+            "searchable_items_index_v2",
+            self.settings,
+            self.store_config,
+            unique=False,
+            outdated_index_names=["searchable_items_index"],
+        )
+        index_stores = [self.unique_keys, self.searchable_keys, self.searchable_items]
+        if any(index_store.created for index_store in index_stores):
+            self._reindex(index_stores)
+
+    def _reindex(self, index_stores: list[SQLiteIndexStore]) -> None:
+        # a new index table replaces one of an older format, all keys are
+        # indexed again from the data so the tables stay consistent
+        unique_pks = PartitionKeys(pks=self.unique_cks)
+        searchable_pks = PartitionKeys(pks=self.searchable_cks)
+        with self.data.transaction():
+            for index_store in index_stores:
+                index_store.clear()
+            for uids in batched(self.data.iter_keys(), DEFAULT_BATCH_SIZE):
+                for uid, obj in self.data.get_many(uids).items():
+                    for qk in _stored_keys(unique_pks, obj).all:
+                        self._set_unique_key(qk.key, qk.value, uid)
+                    for qk in _stored_keys(searchable_pks, obj).all:
+                        self._add_search_keys(qk, uid)
+
+    def _get_unique_key(self, pk_key: str, pk_value: Any) -> UID | None:
+        uids = self.unique_keys.find(pk_key, pk_value)
+        return uids.pop() if uids else None
+
+    def _set_unique_key(self, pk_key: str, pk_value: Any, uid: UID) -> None:
+        self.unique_keys.add(pk_key, pk_value, uid)
+
+    def _remove_unique_key(self, pk_key: str, pk_value: Any, uid: UID) -> None:
+        self.unique_keys.remove(pk_key, pk_value, uid)
+
+    def _add_search_key(self, pk_key: str, pk_value: Any, uid: UID) -> None:
+        self.searchable_keys.add(pk_key, pk_value, uid)
+
+    def _remove_search_key(self, pk_key: str, pk_value: Any, uid: UID) -> None:
+        self.searchable_keys.remove(pk_key, pk_value, uid)
+
+    def _find_search_key(self, pk_key: str, pk_value: Any) -> set[UID]:
+        return self.searchable_keys.find(pk_key, pk_value)
+
+    def _find_search_key_items(self, pk_key: str, items: list) -> set[UID]:
+        return self.searchable_items.find_any(pk_key, _search_items(items))
+
+    def _add_search_keys(self, qk: QueryKey, uid: UID) -> None:
+        if not qk.type_list:
+            return super()._add_search_keys(qk, uid)
+        for item in _search_items(qk.value):
+            self.searchable_items.add(qk.key, item, uid)
+
+    def _remove_search_keys(self, qk: QueryKey, uid: UID) -> None:
+        if not qk.type_list:
+            return super()._remove_search_keys(qk, uid)
+        for item in _search_items(qk.value):
+            self.searchable_items.remove(qk.key, item, uid)
+
+    def _count_uids(
+        self, index_qks: QueryKeys, search_qks: QueryKeys
+    ) -> Result[int, str]:
+        searchable_pk_keys = {ck.key for ck in self.searchable_cks}
+        if (
+            len(index_qks.all) > 0
+            or len(search_qks.all) == 0
+            or any(
+                qk.type_list or qk.key not in searchable_pk_keys
+                for qk in search_qks.all
+            )
+        ):
+            return super()._count_uids(index_qks, search_qks)
+        return Ok(
+            self.searchable_keys.count([(qk.key, qk.value) for qk in search_qks.all])
+        )
+
+    def _uids_in_store_order(self, uids: list[UID]) -> list[UID]:
+        return self.data._get_keys_in(uids)
+
+    def _uids_ordered_by(
+        self, order_by: PartitionKey, uids: list[UID] | None
+    ) -> list[UID] | None:
+        # only text sorts the same in SQLite and Python, other values are
+        # stored serialized
+        if order_by.type_ is not str:
+            return None
+        if order_by.key in {ck.key for ck in self.unique_cks}:
+            index = self.unique_keys
+        elif order_by.key in {ck.key for ck in self.searchable_cks}:
+            index = self.searchable_keys
+        else:
+            return None
+        return index.ordered_uids(order_by.key, self.data.table_name, uids)
+
 
 # the base document store is already a dict but we can change it later
 @serializable()
@@ -9,6 +9,7 @@ from collections.abc import MutableMapping
 from collections.abc import MutableSequence
 from collections.abc import Sequence
 from collections.abc import Set
+from functools import cache
 from hashlib import sha256
 import inspect
 from inspect import Signature
@@ -107,14 +108,21 @@ def _get_optional_inner_type(x: Any) -> Any:
     return non_none[0] if len(non_none) == 1 else x
 
 
+@cache
+def _hash_exclude_set(cls: type) -> frozenset[str]:
+    return frozenset(getattr(cls, "__hash_exclude_attrs__", [])).union(
+        DYNAMIC_SYFT_ATTRIBUTES
+    )
+
+
 class SyftHashableObject:
+    # DYNAMIC_SYFT_ATTRIBUTES are always excluded from hashing
     __hash_exclude_attrs__: list = []
 
     def __hash__(self) -> int:
         return int.from_bytes(self.__sha256__(), byteorder="big")
 
     def __sha256__(self) -> bytes:
-        self.__hash_exclude_attrs__.extend(DYNAMIC_SYFT_ATTRIBUTES)
         _bytes = serialize(self, to_bytes=True, for_hashing=True)
         return sha256(_bytes).digest()
 
@@ -125,6 +133,9 @@ class SyftHashableObject:
 class SyftBaseObject(pydantic.BaseModel, SyftHashableObject):
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
+    # memoized content hash, a slot so it stays out of __dict__ and copies
+    __slots__ = ("__syft_hash_cache__",)
+
     # the name which doesn't change even when there are multiple classes
     __canonical_name__: str
     __version__: int  # data is always versioned
@@ -136,6 +147,30 @@ class SyftBaseObject(pydantic.BaseModel, SyftHashableObject):
         self.syft_node_location = node_uid
         self.syft_client_verify_key = credentials
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        self._syft_invalidate_hash_(name)
+        super().__setattr__(name, value)
+
+    def _syft_invalidate_hash_(self, name: str) -> None:
+        # attributes excluded from hashing don't change the content hash
+        if name not in _hash_exclude_set(type(self)):
+            object.__setattr__(self, "__syft_hash_cache__", None)
+
+    def __sha256__(self) -> bytes:
+        """Content hash, memoized until an attribute used for hashing is set.
+
+        In-place changes to attribute values, like appending to a list or setting
+        an attribute of a nested object, are not tracked.
+        """
+        try:
+            digest = object.__getattribute__(self, "__syft_hash_cache__")
+        except AttributeError:
+            digest = None
+        if digest is None:
+            digest = super().__sha256__()
+            object.__setattr__(self, "__syft_hash_cache__", digest)
+        return digest
+
 
 class Context(SyftBaseObject):
     __canonical_name__ = "Context"
@@ -596,6 +631,25 @@ class SyftObject(SyftBaseObject, SyftObjectRegistry, SyftMigrationRegistry):
         self._syft_set_validate_private_attrs_(**kwargs)
         self.__post_init__()
 
+    @classmethod
+    def _syft_construct_trusted_(cls, kwargs: dict[str, Any]) -> Self:
+        """Builds an instance from already validated data without running the
+        pydantic validators, see `_deserialize(..., trusted=True)`.
+
+        Classes with their own `__init__` are still constructed through it.
+        """
+        if cls.__init__ is not SyftObject.__init__:
+            return cls(**kwargs)
+        obj = cls.model_construct(
+            **{k: v for k, v in kwargs.items() if k in cls.model_fields}
+        )
+        # private attributes already have their defaults, only set passed values
+        if cls.__validate_private_attrs__:
+            for attr in cls.__private_attributes__.keys() & kwargs.keys():
+                setattr(obj, attr, kwargs[attr])
+        obj.__post_init__()
+        return obj
+
     # TODO: Check why Pydantic is removing the __hash__ method during inheritance
     def __hash__(self) -> int:
         return int.from_bytes(self.__sha256__(), byteorder="big")
@@ -10,6 +10,7 @@ import uuid
 from uuid import UUID as uuid_type
 
 # relative
+from ..serde.recursive_primitives import register_packed_type
 from ..serde.serializable import serializable
 from ..util.logger import critical
 from ..util.logger import traceback_and_raise
@@ -217,6 +218,16 @@ class UID:
             )
 
 
+# lists of ids are stored as concatenated 16 byte uuids
+register_packed_type(
+    UID,
+    pack=lambda uids: b"".join(uid.value.bytes for uid in uids),
+    unpack=lambda blob: [
+        UID(uuid.UUID(bytes=bytes(blob[i : i + 16]))) for i in range(0, len(blob), 16)
+    ],
+)
+
+
 @serializable(attrs=["syft_history_hash"])
 class LineageID(UID):
     """Extended UID containing a history hash as well, which is used for comparisons."""
@@ -2,6 +2,7 @@
 import asyncio
 from asyncio.selector_events import BaseSelectorEventLoop
 from collections.abc import Callable
+from collections.abc import Iterable
 from collections.abc import Iterator
 from collections.abc import Sequence
 from concurrent.futures import ProcessPoolExecutor
@@ -9,6 +10,7 @@ from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 import functools
 import hashlib
+from itertools import islice
 from itertools import repeat
 import multiprocessing
 import multiprocessing as mp
@@ -243,6 +245,13 @@ def split_rows(rows: Sequence, cpu_count: int) -> list:
     return output
 
 
+def batched(iterable: Iterable, n: int) -> Iterator[list]:
+    """Splits `iterable` into lists of `n` items, the last one may be shorter."""
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, n)):
+        yield batch
+
+
 def list_sum(*inp_lst: list[Any]) -> Any:
     s = inp_lst[0]
     for i in inp_lst[1:]:
@@ -265,6 +265,30 @@ def test_networkx_backing_store_edge_related_methods(
     assert len(networkx_store.nodes()) == 3
 
 
+def test_networkx_backing_store_read_lock_timeout(
+    networkx_store: NetworkXBackingStore,
+    in_mem_graph_store: InMemoryActionGraphStore,
+    verify_key: SyftVerifyKey,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    action_node: NodeActionData = create_action_node(verify_key)
+    networkx_store.set(uid=action_node.id, data=action_node)
+    assert networkx_store.exists(uid=action_node.id) is True
+
+    # reads raise instead of returning a truthy Err
+    monkeypatch.setattr(networkx_store.lock, "acquire_shared", lambda **kwargs: False)
+    with pytest.raises(TimeoutError):
+        networkx_store.exists(uid=action_node.id)
+    with pytest.raises(TimeoutError):
+        networkx_store.is_parent(parent=action_node.id, child=action_node.id)
+
+    in_mem_graph_store.set(action_node, verify_key)
+    graph = in_mem_graph_store.graph
+    monkeypatch.setattr(graph.lock, "acquire_shared", lambda **kwargs: False)
+    with pytest.raises(TimeoutError):
+        in_mem_graph_store.get(action_node.id, verify_key)
+
+
 @pytest.mark.xfail(
     sys.platform == "win32",
     reason="Fails on Windows. capnp\lib\capnp.pyx:3323: KjException Message did not contain a root pointer.",
@@ -2,6 +2,7 @@
 from uuid import uuid4
 
 # syft absolute
+import syft as sy
 from syft.serde.serializable import serializable
 from syft.types.syft_object import SYFT_OBJECT_VERSION_2
 from syft.types.syft_object import SyftBaseObject
@@ -52,3 +53,26 @@ def test_nested_hashing():
     )
 
     assert obj1.hash() == obj2.hash()
+
+
+def test_cached_hashing():
+    obj = MockWrapper(id=str(uuid4()), data=None)
+    obj_hash = obj.hash()
+    assert obj.__syft_hash_cache__ is not None
+
+    # excluded attributes keep the cached hash
+    obj.syft_node_location = sy.UID()
+    assert obj.__syft_hash_cache__ is not None
+    assert obj.hash() == obj_hash
+
+    obj.data = MockObject(key="key", value="value")
+    assert obj.__syft_hash_cache__ is None
+    assert obj.hash() != obj_hash
+    assert obj.hash() == MockWrapper(id=obj.id, data=obj.data).hash()
+
+    # the exclusion list doesn't grow with every hash
+    exclude_attrs = list(MockWrapper.__hash_exclude_attrs__)
+    obj.hash()
+    MockObject(key="key", value="value").hash()
+    assert MockWrapper.__hash_exclude_attrs__ == exclude_attrs
+    assert MockObject.__hash_exclude_attrs__ == ["flag"]
@@ -3,12 +3,14 @@ from pathlib import Path
 from secrets import token_hex
 import tempfile
 from threading import Thread
+from threading import Timer
 import time
 
 # third party
 import pytest
 
 # syft absolute
+from syft.store.locks import FileLockingConfig
 from syft.store.locks import LockingConfig
 from syft.store.locks import NoLockingConfig
 from syft.store.locks import SyftLock
@@ -34,11 +36,18 @@ def locks_threading_config(request):
     yield ThreadingLockingConfig(**def_params)
 
 
+@pytest.fixture(scope="function")
+def locks_file_config(tmp_path):
+    def_params["lock_name"] = token_hex(8)
+    yield FileLockingConfig(client_path=tmp_path, **def_params)
+
+
 @pytest.mark.parametrize(
     "config",
     [
         pytest.lazy_fixture("locks_nop_config"),
         pytest.lazy_fixture("locks_threading_config"),
+        pytest.lazy_fixture("locks_file_config"),
     ],
 )
 def test_sanity(config: LockingConfig):
@@ -72,6 +81,7 @@ def test_acquire_nop(config: LockingConfig):
     "config",
     [
         pytest.lazy_fixture("locks_threading_config"),
+        pytest.lazy_fixture("locks_file_config"),
     ],
 )
 @pytest.mark.flaky(reruns=3, reruns_delay=3)
@@ -139,6 +149,7 @@ def test_acquire_expire(config: LockingConfig):
     "config",
     [
         pytest.lazy_fixture("locks_threading_config"),
+        pytest.lazy_fixture("locks_file_config"),
     ],
 )
 @pytest.mark.flaky(reruns=3, reruns_delay=3)
@@ -185,6 +196,7 @@ def test_acquire_double_aqcuire_timeout_ok(config: LockingConfig):
     "config",
     [
         pytest.lazy_fixture("locks_threading_config"),
+        pytest.lazy_fixture("locks_file_config"),
     ],
 )
 @pytest.mark.flaky(reruns=3, reruns_delay=3)
@@ -223,17 +235,162 @@ def test_acquire_double_aqcuire_retry_interval(config: LockingConfig):
     acq_ok = lock.acquire(blocking=True)
     assert acq_ok
 
-    not_acq = lock.acquire(blocking=True)
+    # the waiter is woken up when the lock expires, not after retry_interval
+    start = time.time()
+    also_acq = lock.acquire(blocking=True)
+    elapsed = time.time() - start
 
     lock.release()
 
-    assert not not_acq
+    assert also_acq
+    assert elapsed < config.retry_interval
+
+
+@pytest.mark.parametrize(
+    "config",
+    [
+        pytest.lazy_fixture("locks_threading_config"),
+        pytest.lazy_fixture("locks_file_config"),
+    ],
+)
+def test_acquire_wakes_up_on_release(config: LockingConfig):
+    config.timeout = 5
+    config.retry_interval = 3
+    lock = SyftLock(config)
+    # a second lock on the same file only shares the lock through flock
+    other_lock = SyftLock(config) if isinstance(config, FileLockingConfig) else lock
+
+    assert lock.acquire(blocking=True)
+    Timer(0.2, lock.release).start()
+
+    start = time.time()
+    acq_ok = other_lock.acquire(blocking=True)
+    elapsed = time.time() - start
+    other_lock.release()
+
+    assert acq_ok
+    assert 0.1 < elapsed < 1
+
+
+@pytest.mark.parametrize(
+    "config",
+    [
+        pytest.lazy_fixture("locks_file_config"),
+    ],
+)
+def test_file_lock_between_locks(config: LockingConfig):
+    config.timeout = 1
+    lock = SyftLock(config)
+    other_lock = SyftLock(config)
+
+    assert lock.acquire(blocking=True)
+    assert other_lock.locked()
+    assert not other_lock.acquire(blocking=False)
+    assert not other_lock.acquire(blocking=True)
+
+    lock.release()
+    assert not other_lock.locked()
+    assert other_lock.acquire(blocking=True)
+    assert not lock.acquire(blocking=False)
+    other_lock.release()
+
+
+@pytest.mark.parametrize(
+    "config",
+    [
+        pytest.lazy_fixture("locks_threading_config"),
+    ],
+)
+def test_acquire_shared(config: LockingConfig):
+    lock = SyftLock(config)
+
+    assert lock.acquire_shared(blocking=True)
+    assert lock.acquire_shared(blocking=False)
+    assert lock.locked()
+    # writers wait for all readers
+    assert not lock.acquire(blocking=False)
+
+    lock.release_shared()
+    assert not lock.acquire(blocking=False)
+    lock.release_shared()
+    assert not lock.locked()
+
+    assert lock.acquire(blocking=True)
+    assert not lock.acquire_shared(blocking=False)
+    assert not lock.acquire_shared(blocking=True)
+    lock.release()
+    assert lock.acquire_shared(blocking=False)
+    lock.release_shared()
+
+
+@pytest.mark.parametrize(
+    "config",
+    [
+        pytest.lazy_fixture("locks_threading_config"),
+    ],
+)
+def test_acquire_shared_writer_preferring(config: LockingConfig):
+    config.timeout = 5
+    lock = SyftLock(config)
+    order = []
+
+    assert lock.acquire_shared(blocking=True)
+
+    def write() -> None:
+        assert lock.acquire(blocking=True)
+        order.append("writer")
+        lock.release()
+
+    def read() -> None:
+        assert lock.acquire_shared(blocking=True)
+        order.append("reader")
+        lock.release_shared()
+
+    writer = Thread(target=write)
+    writer.start()
+    while not lock._lock.waiters:
+        time.sleep(0.01)
+
+    # a waiting writer keeps new readers out
+    assert not lock.acquire_shared(blocking=False)
+    reader = Thread(target=read)
+    reader.start()
+    time.sleep(0.1)
+    assert order == []
+
+    lock.release_shared()
+    writer.join()
+    reader.join()
+    assert order == ["writer", "reader"]
+
+
+@pytest.mark.parametrize(
+    "config",
+    [
+        pytest.lazy_fixture("locks_threading_config"),
+    ],
+)
+def test_acquire_shared_timeout(config: LockingConfig):
+    lock = SyftLock(config)
+
+    assert lock.acquire_shared(blocking=True)
+    start = time.time()
+    assert not lock.acquire(blocking=True)
+    assert time.time() - start >= config.timeout
+
+    # the writer gave up, readers are let in again
+    assert lock.acquire_shared(blocking=False)
+    lock.release_shared()
+    lock.release_shared()
+    assert lock.acquire(blocking=False)
+    lock.release()
 
 
 @pytest.mark.parametrize(
     "config",
     [
         pytest.lazy_fixture("locks_threading_config"),
+        pytest.lazy_fixture("locks_file_config"),
     ],
 )
 @pytest.mark.flaky(reruns=3, reruns_delay=3)
@@ -250,6 +407,7 @@ def test_acquire_double_release(config: LockingConfig):
     "config",
     [
         pytest.lazy_fixture("locks_threading_config"),
+        pytest.lazy_fixture("locks_file_config"),
     ],
 )
 @pytest.mark.flaky(reruns=3, reruns_delay=3)
@@ -0,0 +1,93 @@
+# stdlib
+from io import BytesIO
+
+# stdlib
+from typing import Any
+from typing import ClassVar
+
+# third party
+import numpy as np
+from pydantic import field_validator
+import pytest
+
+# syft absolute
+import syft as sy
+from syft.serde.deserialize import _deserialize
+from syft.serde.recursive import combine_bytes
+from syft.serde.serializable import serializable
+from syft.types.syft_object import SyftObject
+from syft.types.uid import UID
+
+DATA = {"ints": [1, 2, 3], "array": np.arange(10), "text": "syft" * 10}
+
+
+@serializable()
+class ValidatedObject(SyftObject):
+    __canonical_name__ = "deserialize_test_validated_object"
+    __version__ = 1
+
+    id: UID
+    name: str
+    tags: list[str] = []
+
+    validations: ClassVar[int] = 0
+
+    @field_validator("name", mode="before")
+    @classmethod
+    def count_validations(cls, v: Any) -> Any:
+        cls.validations += 1
+        return v
+
+
+def assert_data_equal(result: dict) -> None:
+    assert result["ints"] == DATA["ints"]
+    assert np.array_equal(result["array"], DATA["array"])
+    assert result["text"] == DATA["text"]
+
+
+def test_combine_bytes() -> None:
+    single = b"single chunk"
+    assert combine_bytes([single]) is single
+    assert combine_bytes([b"first ", b"second ", b"third"]) == b"first second third"
+
+
+def test_deserialize_from_file(tmp_path) -> None:
+    file_path = tmp_path / "data.bin"
+    file_path.write_bytes(sy.serialize(DATA, to_bytes=True))
+
+    assert_data_equal(sy.deserialize(file_path, from_file=True))
+    assert_data_equal(sy.deserialize(str(file_path), from_file=True))
+    with open(file_path, "rb") as f:
+        assert_data_equal(sy.deserialize(f, from_file=True))
+
+
+def test_deserialize_from_buffer() -> None:
+    blob = sy.serialize(DATA, to_bytes=True)
+
+    assert_data_equal(sy.deserialize(memoryview(blob), from_bytes=True))
+    assert_data_equal(sy.deserialize(bytearray(blob), from_bytes=True))
+    assert_data_equal(sy.deserialize(BytesIO(blob), from_file=True))
+
+
+def test_deserialize_from_empty_file(tmp_path) -> None:
+    file_path = tmp_path / "empty.bin"
+    file_path.touch()
+
+    # same error as deserializing an empty blob
+    with pytest.raises(Exception, match="root pointer"):
+        sy.deserialize(file_path, from_file=True)
+
+
+def test_deserialize_trusted() -> None:
+    obj = ValidatedObject(id=UID(), name="syft", tags=["a"])
+    blob = sy.serialize(obj, to_bytes=True)
+
+    ValidatedObject.validations = 0
+    untrusted = _deserialize(blob, from_bytes=True)
+    assert ValidatedObject.validations == 1
+
+    trusted = _deserialize(blob, from_bytes=True, trusted=True)
+    assert ValidatedObject.validations == 1
+    assert trusted == untrusted == obj
+    assert trusted.model_fields_set == untrusted.model_fields_set
+    assert trusted.hash() == obj.hash()
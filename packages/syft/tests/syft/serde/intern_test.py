@@ -0,0 +1,83 @@
+# third party
+import pytest
+
+# syft absolute
+import syft as sy
+from syft.node.credentials import SyftSigningKey
+from syft.serde.recursive import recursive_scheme
+from syft.serde.recursive import rs_proto2object
+from syft.serde.serialize import INTERN_TABLE
+from syft.serde.serialize import InternTable
+from syft.service.user.user import User
+from syft.service.user.user_service import UserService
+from syft.store.linked_obj import LinkedObject
+from syft.types.uid import UID
+
+
+def test_intern_shared_values() -> None:
+    verify_key = SyftSigningKey.generate().verify_key
+    # equal but distinct instances share an entry as well
+    copy = sy.deserialize(sy.serialize(verify_key, to_bytes=True), from_bytes=True)
+    data = {"keys": [verify_key] * 10, "copy": copy}
+
+    proto = sy.serialize(data, to_proto=True)
+    assert len(proto.internTable) == 1
+
+    result = sy.deserialize(proto.to_bytes(), from_bytes=True)
+    assert result == data
+    # every occurrence is its own object
+    assert len({id(key) for key in [*result["keys"], result["copy"]]}) == 11
+
+
+def test_intern_mutable_values() -> None:
+    linked_obj = LinkedObject(
+        node_uid=UID(),
+        service_type=UserService,
+        object_type=User,
+        object_uid=UID(),
+    )
+    proto = sy.serialize([linked_obj, linked_obj], to_proto=True)
+    assert len(proto.internTable) == 1
+
+    first, second = sy.deserialize(proto.to_bytes(), from_bytes=True)
+    first.object_uid = UID()
+    assert second == linked_obj
+
+
+def test_intern_root_and_hashing() -> None:
+    verify_key = SyftSigningKey.generate().verify_key
+
+    # the outermost object is never replaced by a reference
+    proto = sy.serialize(verify_key, to_proto=True)
+    assert len(proto.internTable) == 0
+    assert sy.deserialize(proto.to_bytes(), from_bytes=True) == verify_key
+
+    # hashes cover the values themselves
+    hash_blob = sy.serialize([verify_key, verify_key], to_bytes=True, for_hashing=True)
+    with recursive_scheme.from_bytes(hash_blob) as msg:
+        assert len(msg.internTable) == 0
+
+
+def test_intern_nested_message() -> None:
+    verify_key = SyftSigningKey.generate().verify_key
+
+    # a message serialized on its own carries its own table
+    inner = sy.serialize([verify_key, verify_key], to_bytes=True)
+    data = {"inner": inner, "key": verify_key}
+    result = sy.deserialize(sy.serialize(data, to_bytes=True), from_bytes=True)
+
+    assert result["key"] == verify_key
+    assert sy.deserialize(result["inner"], from_bytes=True) == [verify_key] * 2
+
+
+def test_intern_reference_without_table() -> None:
+    verify_key = SyftSigningKey.generate().verify_key
+
+    token = INTERN_TABLE.set(InternTable(root=None))
+    try:
+        reference = sy.serialize(verify_key, to_proto=True)
+    finally:
+        INTERN_TABLE.reset(token)
+
+    with pytest.raises(ValueError):
+        rs_proto2object(reference)
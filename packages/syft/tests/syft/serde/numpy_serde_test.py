@@ -0,0 +1,102 @@
+# third party
+import numpy as np
+import pytest
+
+# syft absolute
+import syft as sy
+from syft.serde.arrow import OUT_OF_BAND_MIN_SIZE
+from syft.serde.arrow import numpy_deserialize
+from syft.serde.serialize import _serialize
+from syft.serde.serialize import OUT_OF_BAND_SINK
+from syft.serde.serialize import OutOfBandBuffers
+
+
+def test_numpy_out_of_band_buffers() -> None:
+    array = np.arange(OUT_OF_BAND_MIN_SIZE, dtype=np.float64).reshape(-1, 8)
+    small_array = np.arange(8)
+
+    buffers: list = []
+    blob = sy.serialize(
+        {"array": array, "small_array": small_array},
+        to_bytes=True,
+        buffer_callback=buffers.append,
+    )
+
+    # only the large array travels out-of-band
+    assert len(buffers) == 1
+    assert buffers[0].nbytes == array.nbytes
+    assert len(blob) < array.nbytes
+
+    result = sy.deserialize(blob, from_bytes=True, buffers=buffers)
+    assert np.array_equal(result["array"], array)
+    assert result["array"].dtype == array.dtype
+    assert np.array_equal(result["small_array"], small_array)
+    # the deserialized array wraps the buffer without copying
+    assert np.shares_memory(result["array"], array)
+
+
+def test_numpy_out_of_band_non_contiguous() -> None:
+    array = np.arange(OUT_OF_BAND_MIN_SIZE * 2, dtype=np.int32).reshape(-1, 2).T
+
+    buffers: list = []
+    blob = sy.serialize(array, to_bytes=True, buffer_callback=buffers.append)
+    result = sy.deserialize(blob, from_bytes=True, buffers=buffers)
+
+    assert len(buffers) == 1
+    assert np.array_equal(result, array)
+
+
+def test_numpy_out_of_band_missing_buffers() -> None:
+    array = np.zeros(OUT_OF_BAND_MIN_SIZE, dtype=np.uint8)
+
+    buffers: list = []
+    blob = sy.serialize(array, to_bytes=True, buffer_callback=buffers.append)
+
+    with pytest.raises(ValueError):
+        sy.deserialize(blob, from_bytes=True)
+
+
+def test_numpy_out_of_band_not_used_for_hashing() -> None:
+    array = np.ones(OUT_OF_BAND_MIN_SIZE, dtype=np.uint8)
+
+    # hashing inside an out-of-band serialization must still see the data
+    buffers: list = []
+    token = OUT_OF_BAND_SINK.set(OutOfBandBuffers(buffers.append))
+    try:
+        blob = sy.serialize(array, to_bytes=True, for_hashing=True)
+    finally:
+        OUT_OF_BAND_SINK.reset(token)
+
+    assert len(buffers) == 0
+    assert np.array_equal(sy.deserialize(blob, from_bytes=True), array)
+
+
+@pytest.mark.parametrize(
+    "array",
+    [
+        np.array(["a", "bb", ""]),
+        np.array([["héllo", "wörld"], ["日本", "🙂"]]),
+        np.array("scalar"),
+        np.array([], dtype="U3"),
+        np.array(["a\x00b", "c"]),
+        np.array(["a", "b"], dtype="U10"),
+        np.array([["a", "b"], ["c", "d"]]).T,
+        np.array(["x" * 300, "y"]),
+    ],
+)
+def test_numpy_string_array(array: np.ndarray) -> None:
+    result = sy.deserialize(sy.serialize(array, to_bytes=True), from_bytes=True)
+
+    assert result.dtype == array.dtype
+    assert result.shape == array.shape
+    assert np.array_equal(result, array)
+
+
+def test_numpy_string_array_legacy_format() -> None:
+    # arrays used to be stored as uint64 code units followed by the end
+    # offsets, their count, the shape and its length
+    encoded = [ord(c) for c in "ab"] + list("ñ".encode()) + [2, 4, 2, 2, 1, 2]
+    blob = _serialize(np.array(encoded, dtype=np.uint64), to_bytes=True)
+
+    result = numpy_deserialize(blob)
+    assert np.array_equal(result, np.array([["ab"], ["ñ"]]))
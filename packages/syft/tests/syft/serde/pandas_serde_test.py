@@ -0,0 +1,78 @@
+# third party
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+# syft absolute
+import syft as sy
+from syft.serde.third_party import dataframe_columns
+from syft.serde.third_party import deserialize_dataframe
+from syft.serde.third_party import deserialize_series
+
+
+def roundtrip(obj: object) -> object:
+    return sy.deserialize(sy.serialize(obj, to_bytes=True), from_bytes=True)
+
+
+@pytest.mark.parametrize(
+    "df",
+    [
+        pd.DataFrame(
+            {
+                "int": [1, 2, 3],
+                "str": ["a", None, "c"],
+                "time": pd.date_range("2020", periods=3, freq="ns"),
+                "category": pd.Categorical(["x", "y", "x"]),
+            }
+        ),
+        pd.DataFrame(np.random.rand(3, 3)),
+        pd.DataFrame({"a": [1, 2]}, index=pd.Index(["r1", "r2"], name="row")),
+        pd.DataFrame(),
+    ],
+)
+def test_dataframe_serde(df: pd.DataFrame) -> None:
+    pd.testing.assert_frame_equal(roundtrip(df), df)
+
+
+@pytest.mark.parametrize(
+    "series",
+    [
+        pd.Series([1, 2, 3]),
+        pd.Series([1.0, None], name="values", index=["a", "b"]),
+        pd.Series(["a", "b"], name=("tuple", 1)),
+        pd.Series(pd.date_range("2020", periods=2, tz="UTC")),
+    ],
+)
+def test_series_serde(series: pd.Series) -> None:
+    pd.testing.assert_series_equal(roundtrip(series), series)
+
+
+def test_dataframe_columns() -> None:
+    df = pd.DataFrame(
+        {"a": [1, 2], "b": [3.0, 4.0], "c": ["x", "y"]},
+        index=pd.Index(["r1", "r2"], name="row"),
+    )
+    blob = sy.serialize({"df": df, "series": df["c"]}, to_bytes=True)
+
+    with dataframe_columns(["a", "c"]):
+        result = sy.deserialize(blob, from_bytes=True)
+
+    pd.testing.assert_frame_equal(result["df"], df[["a", "c"]])
+    # series are always loaded completely
+    pd.testing.assert_series_equal(result["series"], df["c"])
+
+
+def test_legacy_formats() -> None:
+    df = pd.DataFrame({"a": [1, 2], "b": ["x", "y"]})
+
+    sink = pa.BufferOutputStream()
+    pq.write_table(pa.Table.from_pandas(df), sink)
+    parquet_bytes = sink.getvalue().to_pybytes()
+    pd.testing.assert_frame_equal(deserialize_dataframe(parquet_bytes), df)
+    with dataframe_columns(["b"]):
+        pd.testing.assert_frame_equal(deserialize_dataframe(parquet_bytes), df[["b"]])
+
+    series_dict = sy.serialize(pd.DataFrame(df["a"]).to_dict(), to_bytes=True)
+    pd.testing.assert_series_equal(deserialize_series(series_dict), df["a"])
@@ -0,0 +1,91 @@
+# third party
+import pytest
+
+# syft absolute
+import syft as sy
+from syft.serde.recursive import combine_bytes
+from syft.serde.recursive_primitives import iterable_schema
+from syft.serde.recursive_primitives import kv_iterable_schema
+from syft.types.uid import LineageID
+from syft.types.uid import UID
+
+
+def roundtrip(obj: object) -> object:
+    return sy.deserialize(sy.serialize(obj, to_bytes=True), from_bytes=True)
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        [1, -2, 2**63 - 1],
+        [1.5, -0.0, float("inf")],
+        [True, False, True],
+        ["syft", "", "ünïcode"],
+        [b"syft", b"", b"\x00\xff"],
+        [UID(), UID()],
+    ],
+)
+def test_packed_iterable(values: list) -> None:
+    blob = sy.serialize(values, to_bytes=True)
+    obj_blob = sy.serialize(values, to_proto=True).nonrecursiveBlob
+    with iterable_schema.from_bytes(b"".join(obj_blob)) as msg:
+        assert (
+            msg.packedType == f"{type(values[0]).__module__}.{type(values[0]).__name__}"
+        )
+        assert len(msg.values) == 1
+
+    result = sy.deserialize(blob, from_bytes=True)
+    assert result == values
+    assert [type(value) for value in result] == [type(value) for value in values]
+
+    assert roundtrip(tuple(values)) == tuple(values)
+    assert roundtrip(set(values)) == set(values)
+
+
+@pytest.mark.parametrize(
+    "values",
+    [[1, True], [2**64, 1], [UID(), LineageID(UID(), 1)], [1, 1.0], [[1], [2]]],
+)
+def test_unpacked_iterable(values: list) -> None:
+    obj_blob = sy.serialize(values, to_proto=True).nonrecursiveBlob
+    with iterable_schema.from_bytes(b"".join(obj_blob)) as msg:
+        assert msg.packedType == ""
+
+    result = roundtrip(values)
+    assert result == values
+    assert [type(value) for value in result] == [type(value) for value in values]
+
+
+def test_packed_old_reader() -> None:
+    # readers without the packed fields fail instead of reading empty containers
+    obj_blob = sy.serialize([1, 2, 3], to_proto=True).nonrecursiveBlob
+    with iterable_schema.from_bytes(b"".join(obj_blob)) as msg:
+        with pytest.raises(Exception, match="PackedValues not in TYPE_BANK"):
+            [
+                sy.deserialize(combine_bytes(value), from_bytes=True)
+                for value in msg.values
+            ]
+
+    obj_blob = sy.serialize({"a": [1], "b": [2]}, to_proto=True).nonrecursiveBlob
+    with kv_iterable_schema.from_bytes(b"".join(obj_blob)) as msg:
+        with pytest.raises(Exception, match="PackedValues not in TYPE_BANK"):
+            [sy.deserialize(key, from_bytes=True) for key in msg.keys]
+
+
+def test_packed_kv() -> None:
+    mapping = {str(i): UID() for i in range(10)}
+    obj_blob = sy.serialize(mapping, to_proto=True).nonrecursiveBlob
+    with kv_iterable_schema.from_bytes(b"".join(obj_blob)) as msg:
+        assert msg.packedKeysType == "builtins.str"
+        assert msg.packedValuesType == "syft.types.uid.UID"
+
+    assert roundtrip(mapping) == mapping
+
+    mixed = {1: [1, 2], 2: "a"}
+    obj_blob = sy.serialize(mixed, to_proto=True).nonrecursiveBlob
+    with kv_iterable_schema.from_bytes(b"".join(obj_blob)) as msg:
+        assert msg.packedKeysType == "builtins.int"
+        assert msg.packedValuesType == ""
+
+    assert roundtrip(mixed) == mixed
+    assert roundtrip({}) == {}
@@ -0,0 +1,70 @@
+# stdlib
+from io import BytesIO
+import socket
+
+# third party
+import numpy as np
+import pytest
+
+# syft absolute
+import syft as sy
+
+DATA = {"ints": [1, 2, 3], "array": np.arange(10), "text": "syft" * 10}
+
+
+def assert_data_equal(result: dict) -> None:
+    assert result["ints"] == DATA["ints"]
+    assert np.array_equal(result["array"], DATA["array"])
+    assert result["text"] == DATA["text"]
+
+
+@pytest.fixture(params=[False, True], ids=["in_memory", "large_message"])
+def large_message(request, monkeypatch) -> bool:
+    # large messages are written by capnp directly or spooled to disk
+    if request.param:
+        monkeypatch.setattr(
+            "syft.serde.serialize.compatible_with_large_file_writes_capnp",
+            lambda _: True,
+        )
+    return request.param
+
+
+def test_serialize_to_path(tmp_path, large_message) -> None:
+    file_path = tmp_path / "data.bin"
+    size = sy.serialize(DATA, to_file=file_path)
+
+    assert size == file_path.stat().st_size
+    assert file_path.read_bytes() == sy.serialize(DATA, to_bytes=True)
+    assert_data_equal(sy.deserialize(file_path, from_file=True))
+
+
+def test_serialize_to_file(tmp_path, large_message) -> None:
+    file_path = tmp_path / "data.bin"
+    with open(file_path, "wb") as f:
+        f.write(b"header")
+        size = sy.serialize(DATA, to_file=f)
+        f.write(b"footer")
+
+    content = file_path.read_bytes()
+    assert content.startswith(b"header") and content.endswith(b"footer")
+    assert len(content) == size + len(b"headerfooter")
+    assert_data_equal(sy.deserialize(content[6:-6], from_bytes=True))
+
+
+def test_serialize_to_buffer(large_message) -> None:
+    buffer = BytesIO()
+    size = sy.serialize(DATA, to_file=buffer)
+
+    assert size == len(buffer.getvalue())
+    assert_data_equal(sy.deserialize(buffer.getvalue(), from_bytes=True))
+
+
+def test_serialize_to_socket(large_message) -> None:
+    sender, receiver = socket.socketpair()
+    with sender, receiver:
+        size = sy.serialize(DATA, to_file=sender)
+        received = b""
+        while len(received) < size:
+            received += receiver.recv(size - len(received))
+
+    assert_data_equal(sy.deserialize(received, from_bytes=True))
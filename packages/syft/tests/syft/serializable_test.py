@@ -7,6 +7,7 @@ from pydantic import BaseModel
 
 # syft absolute
 import syft as sy
+from syft.serde.recursive import TYPE_BANK
 from syft.serde.serializable import serializable
 
 
@@ -165,6 +166,23 @@ def test_derived_without_base_attrs():
     assert de.status == data.status
 
 
+def test_serde_plan():
+    plan = TYPE_BANK[get_fqn_for_class(DerivedWithoutAttrs)]
+
+    assert plan.cls is DerivedWithoutAttrs
+    assert [attr_name for attr_name, _ in plan.fields] == ["status", "value"]
+
+    # the plan still unpacks like the legacy TYPE_BANK tuple
+    nonrecursive, *_, cls, attribute_types, version = plan
+    assert not nonrecursive
+    assert cls is DerivedWithoutAttrs
+
+    data = DerivedWithoutAttrs(uid=str(time()), value=2, status=1)
+    de = sy.deserialize(sy.serialize(data, to_bytes=True), from_bytes=True)
+    assert (de.value, de.status) == (data.value, data.status)
+    assert plan.class_type() is DerivedWithoutAttrs
+
+
 # ------------------------------ Pydantic classes ------------------------------
 
 
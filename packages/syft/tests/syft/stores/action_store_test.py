@@ -11,6 +11,7 @@ from syft.service.action.action_store import ActionObjectEXECUTE
 from syft.service.action.action_store import ActionObjectOWNER
 from syft.service.action.action_store import ActionObjectREAD
 from syft.service.action.action_store import ActionObjectWRITE
+from syft.service.action.action_store import ActionPermission
 from syft.types.uid import UID
 
 # relative
@@ -142,3 +143,36 @@ def test_action_store_test_data_set_get(store: Any):
     assert res.is_ok()
     res = store.delete(data_uid, client_key)
     assert res.is_err()
+
+
+@pytest.mark.parametrize(
+    "store",
+    [
+        pytest.lazy_fixture("dict_action_store"),
+        pytest.lazy_fixture("sqlite_action_store"),
+        pytest.lazy_fixture("mongo_action_store"),
+    ],
+)
+def test_action_store_filter_permitted(store: Any):
+    client_key = SyftVerifyKey.from_string(TEST_VERIFY_KEY_STRING_CLIENT)
+    root_key = SyftVerifyKey.from_string(TEST_VERIFY_KEY_STRING_ROOT)
+    hacker_key = SyftVerifyKey.from_string(TEST_VERIFY_KEY_STRING_HACKER)
+
+    uids = [UID() for _ in range(4)]
+    store.add_permissions(
+        [ActionObjectREAD(uid=uid, credentials=client_key) for uid in uids[:3]]
+        + [ActionObjectWRITE(uid=uids[3], credentials=client_key)]
+    )
+
+    assert store.filter_permitted(client_key, uids, ActionPermission.READ) == uids[:3]
+    assert store.filter_permitted(hacker_key, uids, ActionPermission.READ) == []
+    assert store.filter_permitted(root_key, uids, ActionPermission.READ) == uids
+    # without credentials nothing is permitted
+    assert store.filter_permitted(None, uids, ActionPermission.READ) == []
+
+    reads = [ActionObjectREAD(uid=uid, credentials=client_key) for uid in uids]
+    assert store.has_permissions(reads[:3])
+    assert not store.has_permissions(reads)
+    assert store.has_permissions(
+        reads[:3] + [ActionObjectWRITE(uid=uids[3], credentials=client_key)]
+    )
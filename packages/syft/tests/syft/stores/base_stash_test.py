@@ -11,18 +11,32 @@ import pytest
 from typing_extensions import ParamSpec
 
 # syft absolute
+from syft.node.credentials import SyftSigningKey
 from syft.serde.serializable import serializable
+from syft.service.action.action_permissions import ActionObjectREAD
+from syft.service.context import AuthedServiceContext
 from syft.service.response import SyftSuccess
 from syft.store.dict_document_store import DictDocumentStore
+from syft.store.document_store import BaseStash
 from syft.store.document_store import BaseUIDStoreStash
+from syft.store.document_store import DocumentStore
 from syft.store.document_store import PartitionKey
 from syft.store.document_store import PartitionSettings
 from syft.store.document_store import QueryKey
 from syft.store.document_store import QueryKeys
+from syft.store.document_store import StorePartition
 from syft.store.document_store import UIDPartitionKey
+from syft.store.mongo_document_store import MongoDocumentStore
+from syft.types.syft_migration import migrate
+from syft.types.syft_object import SYFT_OBJECT_VERSION_1
+from syft.types.syft_object import SYFT_OBJECT_VERSION_2
 from syft.types.syft_object import SyftObject
+from syft.types.transforms import TransformContext
 from syft.types.uid import UID
 
+# relative
+from .store_fixtures_test import sqlite_document_store_fn
+
 
 @serializable()
 class MockObject(SyftObject):
@@ -49,6 +63,100 @@ class MockStash(BaseUIDStoreStash):
     )
 
 
+@serializable()
+class MockTaggedObject(SyftObject):
+    __canonical_name__ = "base_stash_mock_tagged_object"
+    id: UID
+    name: str
+    tags: list[str]
+
+    __attr_searchable__ = ["name", "tags"]
+
+
+TagsPartitionKey = PartitionKey(key="tags", type_=list[str])
+
+
+class MockTaggedStash(BaseUIDStoreStash):
+    object_type = MockTaggedObject
+    settings = PartitionSettings(
+        name=MockTaggedObject.__canonical_name__, object_type=MockTaggedObject
+    )
+
+
+@serializable()
+class MockMigrationObjectV1(SyftObject):
+    __canonical_name__ = "base_stash_mock_migration_object"
+    __version__ = SYFT_OBJECT_VERSION_1
+    id: UID
+    value: int
+
+
+@serializable()
+class MockMigrationObject(SyftObject):
+    __canonical_name__ = "base_stash_mock_migration_object"
+    __version__ = SYFT_OBJECT_VERSION_2
+    id: UID
+    value: str
+
+
+def value_to_str(context: TransformContext) -> TransformContext:
+    if context.output["value"] < 0:
+        raise ValueError("negative values can't be migrated")
+    context.output["value"] = str(context.output["value"])
+    return context
+
+
+@migrate(MockMigrationObjectV1, MockMigrationObject)
+def upgrade_mock_migration_object() -> list[Callable]:
+    return [value_to_str]
+
+
+class MockMigrationStash(BaseUIDStoreStash):
+    object_type = MockMigrationObject
+    settings = PartitionSettings(
+        name=MockMigrationObject.__canonical_name__, object_type=MockMigrationObject
+    )
+
+
+@serializable()
+class MockKeyedObjectV1(SyftObject):
+    __canonical_name__ = "base_stash_mock_keyed_object"
+    __version__ = SYFT_OBJECT_VERSION_1
+    id: UID
+    value: int
+
+
+@serializable()
+class MockKeyedObject(SyftObject):
+    __canonical_name__ = "base_stash_mock_keyed_object"
+    __version__ = SYFT_OBJECT_VERSION_2
+    id: UID
+    value: int
+    label: str
+
+    __attr_searchable__ = ["label"]
+
+
+def value_to_label(context: TransformContext) -> TransformContext:
+    context.output["label"] = str(context.output["value"])
+    return context
+
+
+@migrate(MockKeyedObjectV1, MockKeyedObject)
+def upgrade_mock_keyed_object() -> list[Callable]:
+    return [value_to_label]
+
+
+LabelPartitionKey = PartitionKey(key="label", type_=str)
+
+
+class MockKeyedStash(BaseUIDStoreStash):
+    object_type = MockKeyedObject
+    settings = PartitionSettings(
+        name=MockKeyedObject.__canonical_name__, object_type=MockKeyedObject
+    )
+
+
 def get_object_values(obj: SyftObject) -> tuple[Any]:
     return tuple(obj.to_dict().values())
 
@@ -60,6 +168,15 @@ def add_mock_object(root_verify_key, stash: MockStash, obj: MockObject) -> MockO
     return result.ok()
 
 
+def add_mock_objects(
+    root_verify_key, stash: BaseStash | StorePartition, objs: list[SyftObject]
+) -> list[SyftObject]:
+    results = [stash.set(root_verify_key, obj) for obj in objs]
+    assert all(result.is_ok() for result in results)
+
+    return [result.ok() for result in results]
+
+
 T = TypeVar("T")
 P = ParamSpec("P")
 
@@ -80,6 +197,21 @@ def base_stash(root_verify_key) -> MockStash:
     yield MockStash(store=DictDocumentStore(UID(), root_verify_key))
 
 
+@pytest.fixture(
+    params=[
+        pytest.lazy_fixture("dict_document_store"),
+        pytest.lazy_fixture("sqlite_document_store"),
+    ]
+)
+def document_store(request) -> DocumentStore:
+    yield request.param
+
+
+@pytest.fixture
+def mock_stash(document_store: DocumentStore) -> MockStash:
+    yield MockStash(store=document_store)
+
+
 def random_sentence(faker: Faker) -> str:
     return faker.paragraph(nb_sentences=1)
 
@@ -444,3 +576,322 @@ def test_basestash_cannot_query_non_searchable(
     assert base_stash.query_all(
         root_verify_key, QueryKeys(qks=[qk, UIDPartitionKey.with_obj(obj.id)])
     ).is_err()
+
+
+def test_basestash_paged_queries(
+    root_verify_key, mock_stash: MockStash, faker: Faker
+) -> None:
+    stash = mock_stash
+    objs = [
+        MockObject(**object_kwargs(faker, name=f"{faker.name()} {i}", desc="paged"))
+        for i in range(10)
+    ]
+    add_mock_objects(root_verify_key, stash, objs)
+
+    def pages(query: Callable, **kwargs: Any) -> list[list[MockObject]]:
+        return [
+            query(root_verify_key, limit=4, offset=offset, **kwargs).ok()
+            for offset in range(0, 12, 4)
+        ]
+
+    # pages follow the order of the unpaged query
+    assert [len(page) for page in pages(stash.get_all)] == [4, 4, 2]
+    assert sum(pages(stash.get_all), []) == stash.get_all(root_verify_key).ok()
+    assert sum(pages(stash.query_all_kwargs, desc="paged"), []) == objs
+
+    for order_by in [NamePartitionKey, ImportancePartitionKey]:
+        ordered = sorted(objs, key=lambda obj: getattr(obj, order_by.key))
+        assert sum(pages(stash.get_all, order_by=order_by), []) == ordered
+        paged = pages(stash.query_all_kwargs, order_by=order_by, desc="paged")
+        assert sum(paged, []) == ordered
+
+    assert stash.query_one_kwargs(root_verify_key, desc="paged").ok() in objs
+    assert stash.get_all(root_verify_key, limit=0).ok() == []
+
+
+def test_basestash_iter(root_verify_key, mock_stash: MockStash, faker: Faker) -> None:
+    stash = mock_stash
+    objs = [
+        MockObject(**object_kwargs(faker, name=f"{faker.name()} {i}", desc="iter"))
+        for i in range(10)
+    ]
+    add_mock_objects(root_verify_key, stash, objs)
+
+    all_objs = stash.get_all(root_verify_key).ok()
+    for batch_size in [1, 3, 10, 100]:
+        res = stash.iter_all(root_verify_key, batch_size=batch_size)
+        assert list(res.ok()) == all_objs
+        res = stash.iter_query(root_verify_key, DescPartitionKey.with_obj("iter"))
+        assert list(res.ok()) == objs
+
+    assert list(stash.iter_query(root_verify_key, QueryKeys(qks=[])).ok()) == []
+    assert stash.iter_query(
+        root_verify_key, PartitionKey(key="value", type_=int).with_obj(1)
+    ).is_err()
+
+    # only readable objects are yielded
+    guest_verify_key = SyftSigningKey.generate().verify_key
+    assert list(stash.iter_all(guest_verify_key, batch_size=3).ok()) == []
+    stash.add_permissions(
+        [
+            ActionObjectREAD(uid=obj.id, credentials=guest_verify_key)
+            for obj in objs[::4]
+        ]
+    )
+    res = stash.iter_query(
+        guest_verify_key, DescPartitionKey.with_obj("iter"), batch_size=2
+    )
+    assert list(res.ok()) == objs[::4]
+    assert list(stash.iter_all(guest_verify_key, has_permission=True).ok()) == all_objs
+
+    # objects written while iterating don't break the iteration
+    seen = []
+    for obj in stash.iter_all(root_verify_key, batch_size=4).ok():
+        seen.append(obj.id)
+        obj.value += 1
+        assert stash.update(root_verify_key, obj).is_ok()
+    assert seen == [obj.id for obj in all_objs]
+
+
+def test_basestash_count(root_verify_key, mock_stash: MockStash, faker: Faker) -> None:
+    stash = mock_stash
+    objs = [
+        MockObject(
+            **object_kwargs(
+                faker,
+                name=f"{faker.name()} {i}",
+                desc="even" if i % 2 == 0 else "odd",
+                importance=i % 3,
+            )
+        )
+        for i in range(12)
+    ]
+    add_mock_objects(root_verify_key, stash, objs)
+
+    def query_keys(**kwargs: Any) -> QueryKeys:
+        return QueryKeys.from_dict(kwargs)
+
+    guest_verify_key = SyftSigningKey.generate().verify_key
+    stash.add_permissions(
+        [ActionObjectREAD(uid=obj.id, credentials=guest_verify_key) for obj in objs[:5]]
+    )
+
+    assert stash.count(root_verify_key).ok() == len(objs)
+    assert stash.count(guest_verify_key).ok() == 5
+    assert stash.count(guest_verify_key, has_permission=True).ok() == len(objs)
+
+    for kwargs in [
+        {"desc": "even"},
+        {"desc": "odd", "importance": 1},
+        {"desc": "none"},
+        {"name": objs[3].name},
+        {"name": objs[3].name, "desc": "odd"},
+    ]:
+        qks = query_keys(**kwargs)
+        for credentials in [root_verify_key, guest_verify_key]:
+            expected = len(stash.query_all(credentials, qks).ok())
+            assert stash.count(credentials, qks).ok() == expected
+    assert stash.count(guest_verify_key, query_keys(desc="even")).ok() == 3
+
+    assert stash.count(root_verify_key, query_keys(value=1)).is_err()
+
+    stash.delete_by_uid(root_verify_key, objs[0].id)
+    assert stash.count(root_verify_key).ok() == len(objs) - 1
+    assert stash.count(root_verify_key, query_keys(desc="even")).ok() == 5
+
+
+@pytest.mark.parametrize(
+    "document_store",
+    [
+        pytest.lazy_fixture("dict_document_store"),
+        pytest.lazy_fixture("sqlite_document_store"),
+        pytest.lazy_fixture("mongo_document_store"),
+    ],
+)
+def test_basestash_query_list_key(
+    root_verify_key, document_store: DocumentStore
+) -> None:
+    stash = MockTaggedStash(store=document_store)
+    objs = [
+        MockTaggedObject(name="first", tags=["ab", "c"]),
+        MockTaggedObject(name="second", tags=["a"]),
+        MockTaggedObject(name="third", tags=["b", "a", "a"]),
+        MockTaggedObject(name="fourth", tags=[]),
+    ]
+    add_mock_objects(root_verify_key, stash, objs)
+
+    def find(*qks: QueryKey) -> set[UID]:
+        res = stash.query_all(root_verify_key, QueryKeys(qks=list(qks)))
+        return {obj.id for obj in res.ok()}
+
+    # an object matches if its list holds any of the items exactly
+    assert find(TagsPartitionKey.with_obj(["a"])) == {objs[1].id, objs[2].id}
+    assert find(TagsPartitionKey.with_obj(["c", "b"])) == {objs[0].id, objs[2].id}
+    assert find(TagsPartitionKey.with_obj(["x"])) == set()
+    assert find(NamePartitionKey.with_obj("first")) == {objs[0].id}
+    assert (
+        find(NamePartitionKey.with_obj("first"), TagsPartitionKey.with_obj(["a"]))
+        == set()
+    )
+
+    updated = MockTaggedObject(id=objs[2].id, name="third", tags=["d"])
+    assert stash.update(root_verify_key, updated).is_ok()
+    assert find(TagsPartitionKey.with_obj(["b"])) == set()
+    assert find(TagsPartitionKey.with_obj(["d"])) == {objs[2].id}
+    assert stash.delete_by_uid(root_verify_key, objs[1].id).is_ok()
+    assert find(TagsPartitionKey.with_obj(["a"])) == set()
+
+    if isinstance(document_store, MongoDocumentStore):
+        collection = stash.partition.collection.ok()
+        index_name = f"{MockTaggedObject.__canonical_name__}_tags_index_name"
+        assert index_name in collection.index_information()
+
+
+def test_basestash_migrate(
+    root_verify_key, worker, document_store: DocumentStore, monkeypatch
+) -> None:
+    partition = MockMigrationStash(store=document_store).partition
+    objs = [MockMigrationObjectV1(value=value) for value in range(9)]
+    # the third batch can't be migrated
+    objs[7].value = -1
+    add_mock_objects(root_verify_key, partition, objs)
+
+    context = AuthedServiceContext(node=worker, credentials=root_verify_key)
+    res = partition.migrate_data(MockMigrationObject, context, batch_size=3)
+    assert res.is_err()
+
+    # the batches before the failure are migrated
+    versions = [obj.__version__ for obj in partition.all(root_verify_key).ok()]
+    assert versions == [SYFT_OBJECT_VERSION_2] * 6 + [SYFT_OBJECT_VERSION_1] * 3
+
+    objs[7].value = 7
+    assert partition.update(
+        root_verify_key, UIDPartitionKey.with_obj(objs[7].id), objs[7]
+    ).is_ok()
+
+    updates = []
+    update = partition._update
+
+    def count_updates(*args: Any, **kwargs: Any) -> Any:
+        updates.append(kwargs["obj"].id)
+        return update(*args, **kwargs)
+
+    monkeypatch.setattr(partition, "_update", count_updates)
+    progress = []
+    res = partition.migrate_data(
+        MockMigrationObject,
+        context,
+        batch_size=3,
+        progress=lambda done, total: progress.append((done, total)),
+    )
+    assert res.is_ok()
+
+    # the migration resumes with the objects that weren't migrated
+    assert updates == [obj.id for obj in objs[6:]]
+    assert progress == [(3, 9), (6, 9), (9, 9)]
+    migrated = partition.all(root_verify_key).ok()
+    assert all(isinstance(obj, MockMigrationObject) for obj in migrated)
+    assert [obj.value for obj in migrated] == [str(value) for value in range(9)]
+
+
+def test_basestash_lazy_migration(
+    root_verify_key, worker, document_store: DocumentStore
+) -> None:
+    stash = MockMigrationStash(store=document_store)
+    objs = [MockMigrationObjectV1(value=value) for value in range(5)]
+    add_mock_objects(root_verify_key, stash.partition, objs)
+
+    def stored_versions() -> list[int]:
+        return [obj.__version__ for obj in stash.partition.data.values()]
+
+    context = AuthedServiceContext(node=worker, credentials=root_verify_key)
+    document_store.enable_lazy_migration(context)
+
+    # objects are migrated when read, but stored as they are
+    read = stash.get_by_uid(root_verify_key, objs[0].id).ok()
+    assert isinstance(read, MockMigrationObject)
+    assert read.value == "0"
+    everything = stash.get_all(root_verify_key).ok()
+    assert [obj.value for obj in everything] == [str(value) for value in range(5)]
+    assert list(stash.partition.iter_all(root_verify_key).ok()) == everything
+    assert stored_versions() == [SYFT_OBJECT_VERSION_1] * 5
+
+    # an object updated after being read is not overwritten by the sweep
+    read.value = "updated"
+    assert stash.update(root_verify_key, read).is_ok()
+    assert stash.partition.sweep_migrations(batch_size=2).ok() == 4
+    assert stored_versions() == [SYFT_OBJECT_VERSION_2] * 5
+    assert stash.get_by_uid(root_verify_key, objs[0].id).ok().value == "updated"
+    assert stash.partition.sweep_migrations().ok() == 0
+
+    # with write back the objects read are stored migrated
+    store = DictDocumentStore(UID(), root_verify_key)
+    store.enable_lazy_migration(context, write_back=True)
+    stash = MockMigrationStash(store=store)
+    add_mock_objects(root_verify_key, stash.partition, objs)
+    stash.get_by_uid(root_verify_key, objs[0].id)
+    assert sorted(stored_versions()) == [SYFT_OBJECT_VERSION_1] * 4 + [
+        SYFT_OBJECT_VERSION_2
+    ]
+
+    # objects that can't be migrated fail the read
+    broken = MockMigrationObjectV1(value=-1)
+    assert stash.partition.set(root_verify_key, broken).is_ok()
+    assert stash.get_by_uid(root_verify_key, broken.id).is_err()
+    assert stash.partition.sweep_migrations().is_err()
+
+
+def test_basestash_lazy_migration_new_keys(
+    worker, sqlite_workspace, monkeypatch
+) -> None:
+    credentials = worker.verify_key
+    # objects stored before the upgrade, when the type had no label key
+    store = sqlite_document_store_fn(credentials, sqlite_workspace)
+    old_partition = store.partition(
+        PartitionSettings(
+            name=MockKeyedObject.__canonical_name__, object_type=MockKeyedObjectV1
+        )
+    )
+    add_mock_objects(
+        credentials,
+        old_partition,
+        [MockKeyedObjectV1(value=value) for value in range(3)],
+    )
+
+    store = sqlite_document_store_fn(credentials, sqlite_workspace)
+    keyed_stash = MockKeyedStash(store=store)
+    stash = MockMigrationStash(store=store)
+    add_mock_objects(
+        credentials,
+        stash.partition,
+        [MockMigrationObjectV1(value=value) for value in range(3)],
+    )
+    for partition in [keyed_stash.partition, stash.partition]:
+        monkeypatch.setitem(
+            worker.document_store.partitions, partition.settings.name, partition
+        )
+
+    context = AuthedServiceContext(node=worker, credentials=credentials)
+    store.enable_lazy_migration(context)
+    monkeypatch.setattr(worker, "lazy_migrate", True)
+    pending = [MockKeyedObject, MockMigrationObject]
+    monkeypatch.setattr(
+        worker,
+        "_find_klasses_pending_for_migration",
+        lambda object_types: [t for t in pending if t in object_types],
+    )
+    sweeps = []
+    monkeypatch.setattr(
+        worker,
+        "_sweep_migrations",
+        lambda object_types, context: sweeps.append(object_types),
+    )
+    worker.find_and_migrate_data()
+
+    # a type with a new index key is migrated on startup, so queries on the
+    # key find all objects, the others are left to the sweep
+    qks = QueryKeys(qks=[LabelPartitionKey.with_obj("1")])
+    assert [obj.value for obj in keyed_stash.query_all(credentials, qks).ok()] == [1]
+    assert sweeps == [[MockMigrationObject]]
+    versions = [obj.__version__ for obj in stash.partition.data.values()]
+    assert versions == [SYFT_OBJECT_VERSION_1] * 3
@@ -18,6 +18,7 @@ from syft.service.action.action_store import ActionObjectWRITE
 from syft.store.document_store import PartitionSettings
 from syft.store.document_store import QueryKey
 from syft.store.document_store import QueryKeys
+from syft.store.document_store import UIDPartitionKey
 from syft.store.mongo_client import MongoStoreClientConfig
 from syft.store.mongo_document_store import MongoStoreConfig
 from syft.store.mongo_document_store import MongoStorePartition
@@ -628,7 +629,7 @@ def test_mongo_store_partition_add_remove_permission(
     find_res_1 = permissions_collection.find_one({"_id": obj_read_permission.uid})
     assert find_res_1 is not None
     assert len(find_res_1["permissions"]) == 1
-    assert find_res_1["permissions"] == {
+    assert set(find_res_1["permissions"]) == {
         obj_read_permission.permission_string,
     }
 
@@ -641,7 +642,7 @@ def test_mongo_store_partition_add_remove_permission(
     find_res_2 = permissions_collection.find_one({"_id": obj.id})
     assert find_res_2 is not None
     assert len(find_res_2["permissions"]) == 2
-    assert find_res_2["permissions"] == {
+    assert set(find_res_2["permissions"]) == {
         obj_read_permission.permission_string,
         obj_write_permission.permission_string,
     }
@@ -656,7 +657,7 @@ def test_mongo_store_partition_add_remove_permission(
     mongo_store_partition.remove_permission(obj_write_permission)
     find_res_4 = permissions_collection.find_one({"_id": obj.id})
     assert len(find_res_4["permissions"]) == 1
-    assert find_res_1["permissions"] == {
+    assert set(find_res_1["permissions"]) == {
         obj_read_permission.permission_string,
     }
 
@@ -669,7 +670,7 @@ def test_mongo_store_partition_add_remove_permission(
     assert isinstance(remove_res, Err)
     find_res_5 = permissions_collection.find_one({"_id": obj.id})
     assert len(find_res_5["permissions"]) == 1
-    assert find_res_1["permissions"] == {
+    assert set(find_res_1["permissions"]) == {
         obj_read_permission.permission_string,
     }
 
@@ -903,7 +904,7 @@ def test_mongo_store_partition_permissions_set(
     assert isinstance(pemissions_collection, MongoCollection)
     permissions = pemissions_collection.find_one({"_id": obj.id})
     assert permissions is not None
-    assert isinstance(permissions["permissions"], set)
+    assert isinstance(permissions["permissions"], list)
     assert len(permissions["permissions"]) == 4
     for permission in PERMISSIONS:
         assert mongo_store_partition.has_permission(
@@ -1035,3 +1036,254 @@ def test_mongo_store_partition_permissions_update(
         assert res.is_ok()
         # the id of the object in the permission collection should not be changed
         assert permsissions.find_one(qk.as_dict_mongo)["_id"] == obj.id
+
+
+def test_mongo_store_partition_bulk(
+    root_verify_key: SyftVerifyKey,
+    guest_verify_key: SyftVerifyKey,
+    mongo_store_partition: MongoStorePartition,
+) -> None:
+    res = mongo_store_partition.init_store()
+    assert res.is_ok()
+
+    objs = [MockSyftObject(data=idx) for idx in range(5)]
+    assert mongo_store_partition.set(root_verify_key, objs[0]).is_ok()
+
+    guest_permissions = [
+        ActionObjectREAD(uid=obj.id, credentials=guest_verify_key) for obj in objs
+    ]
+    res = mongo_store_partition.set_many(
+        root_verify_key, objs, add_permissions=guest_permissions
+    )
+    assert res.is_ok()
+    assert [r.is_ok() for r in res.ok()] == [False, True, True, True, True]
+    assert len(mongo_store_partition.all(root_verify_key).ok()) == 5
+    assert len(mongo_store_partition.all(guest_verify_key).ok()) == 4
+    assert mongo_store_partition.has_storage_permission(
+        StoragePermission(uid=objs[1].id, node_uid=mongo_store_partition.node_uid)
+    )
+    res = mongo_store_partition.set_many(root_verify_key, objs, ignore_duplicates=True)
+    assert all(r.is_ok() for r in res.ok())
+
+    # the guest can read but not write
+    updated = [MockSyftObject(id=obj.id, data=10) for obj in objs[1:3]]
+    results = mongo_store_partition.update_many(guest_verify_key, updated).ok()
+    assert all(r.is_err() for r in results)
+    missing = MockSyftObject(data=10)
+    results = mongo_store_partition.update_many(
+        root_verify_key, updated + [missing]
+    ).ok()
+    assert [r.is_ok() for r in results] == [True, True, False]
+    stored = mongo_store_partition.all(root_verify_key).ok()
+    assert sorted(obj.data for obj in stored) == [0, 3, 4, 10, 10]
+
+    qks = [
+        mongo_store_partition.settings.store_key.with_obj(obj)
+        for obj in objs[:2] + [missing]
+    ]
+    results = mongo_store_partition.delete_many(guest_verify_key, qks).ok()
+    assert all(r.is_err() for r in results)
+    results = mongo_store_partition.delete_many(root_verify_key, qks).ok()
+    assert [r.is_ok() for r in results] == [True, True, False]
+    stored = mongo_store_partition.all(root_verify_key).ok()
+    assert {obj.id for obj in stored} == {obj.id for obj in objs[2:]}
+
+
+def test_mongo_store_partition_paged_all(
+    root_verify_key: SyftVerifyKey,
+    guest_verify_key: SyftVerifyKey,
+    mongo_store_partition: MongoStorePartition,
+) -> None:
+    res = mongo_store_partition.init_store()
+    assert res.is_ok()
+
+    objs = [MockSyftObject(data=idx) for idx in range(10)]
+    # the guest can read every other object
+    guest_permissions = [
+        ActionObjectREAD(uid=obj.id, credentials=guest_verify_key) for obj in objs[::2]
+    ]
+    mongo_store_partition.set_many(
+        root_verify_key, objs, add_permissions=guest_permissions
+    )
+
+    for credentials, has_permission in [
+        (root_verify_key, False),
+        (root_verify_key, True),
+        (guest_verify_key, False),
+    ]:
+        readable = mongo_store_partition.all(
+            credentials, has_permission=has_permission
+        ).ok()
+        pages = [
+            mongo_store_partition.all(
+                credentials, has_permission=has_permission, limit=3, offset=offset
+            ).ok()
+            for offset in range(0, 12, 3)
+        ]
+        assert sum(pages, []) == readable
+        assert all(len(page) <= 3 for page in pages)
+    assert len(readable) == 5
+
+
+def test_mongo_store_partition_iter(
+    root_verify_key: SyftVerifyKey,
+    guest_verify_key: SyftVerifyKey,
+    mongo_store_partition: MongoStorePartition,
+) -> None:
+    res = mongo_store_partition.init_store()
+    assert res.is_ok()
+
+    objs = [MockSyftObject(data=idx) for idx in range(10)]
+    guest_permissions = [
+        ActionObjectREAD(uid=obj.id, credentials=guest_verify_key) for obj in objs[::3]
+    ]
+    mongo_store_partition.set_many(
+        root_verify_key, objs, add_permissions=guest_permissions
+    )
+
+    for credentials, has_permission in [
+        (root_verify_key, False),
+        (root_verify_key, True),
+        (guest_verify_key, False),
+        (guest_verify_key, True),
+    ]:
+        readable = mongo_store_partition.all(
+            credentials, has_permission=has_permission
+        ).ok()
+        for batch_size in [1, 4, 100]:
+            res = mongo_store_partition.iter_all(
+                credentials, has_permission=has_permission, batch_size=batch_size
+            )
+            assert list(res.ok()) == readable
+    assert len(readable) == 10
+
+    index_qks = QueryKeys(qks=[UIDPartitionKey.with_obj(objs[3].id)])
+    for credentials, expected in [
+        (root_verify_key, [objs[3]]),
+        (guest_verify_key, [objs[3]]),
+        (SyftVerifyKey.from_string(TEST_VERIFY_KEY_STRING_HACKER), []),
+    ]:
+        res = mongo_store_partition.iter_query(
+            credentials, index_qks=index_qks, search_qks=QueryKeys(qks=[])
+        )
+        assert list(res.ok()) == expected
+
+
+def test_mongo_store_partition_count(
+    root_verify_key: SyftVerifyKey,
+    guest_verify_key: SyftVerifyKey,
+    mongo_store_partition: MongoStorePartition,
+) -> None:
+    res = mongo_store_partition.init_store()
+    assert res.is_ok()
+
+    objs = [MockSyftObject(data=idx) for idx in range(10)]
+    guest_permissions = [
+        ActionObjectREAD(uid=obj.id, credentials=guest_verify_key) for obj in objs[:4]
+    ]
+    mongo_store_partition.set_many(
+        root_verify_key, objs, add_permissions=guest_permissions
+    )
+
+    no_qks = QueryKeys(qks=[])
+    for credentials, has_permission, expected in [
+        (root_verify_key, False, 10),
+        (guest_verify_key, False, 4),
+        (guest_verify_key, True, 10),
+    ]:
+        res = mongo_store_partition.count(
+            credentials, no_qks, no_qks, has_permission=has_permission
+        )
+        assert res.ok() == expected
+
+    for obj, expected in [(objs[2], 1), (objs[7], 0)]:
+        index_qks = QueryKeys(qks=[UIDPartitionKey.with_obj(obj.id)])
+        res = mongo_store_partition.count(guest_verify_key, index_qks, no_qks)
+        assert res.ok() == expected
+
+
+def test_mongo_store_partition_get_all_round_trips(
+    root_verify_key: SyftVerifyKey,
+    guest_verify_key: SyftVerifyKey,
+    mongo_store_partition: MongoStorePartition,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    res = mongo_store_partition.init_store()
+    assert res.is_ok()
+
+    objs = [MockSyftObject(data=idx) for idx in range(100)]
+    add_permissions = [
+        ActionObjectREAD(uid=obj.id, credentials=guest_verify_key) for obj in objs[:30]
+    ] + [
+        ActionObjectPermission(uid=obj.id, permission=ActionPermission.ALL_READ)
+        for obj in objs[30:40]
+    ]
+    mongo_store_partition.set_many(
+        root_verify_key, objs, add_permissions=add_permissions
+    )
+
+    queries = []
+    # mongomock runs $lookup with its own queries, only the outermost query
+    # is a round trip to the server
+    depth = [0]
+
+    def count_queries(name: str) -> None:
+        method = getattr(MongoCollection, name)
+
+        def counted(*args, **kwargs):
+            if depth[0] == 0:
+                queries.append(name)
+            depth[0] += 1
+            try:
+                return method(*args, **kwargs)
+            finally:
+                depth[0] -= 1
+
+        monkeypatch.setattr(MongoCollection, name, counted)
+
+    for name in ["find", "find_one", "aggregate", "count_documents"]:
+        count_queries(name)
+
+    # one query for the objects and their permissions, no query per object
+    for credentials, expected in [(root_verify_key, 100), (guest_verify_key, 40)]:
+        queries.clear()
+        res = mongo_store_partition.all(credentials)
+        assert len(res.ok()) == expected
+        assert queries == ["aggregate"]
+
+    queries.clear()
+    res = mongo_store_partition.find_index_or_search_keys(
+        guest_verify_key,
+        index_qks=QueryKeys(qks=[UIDPartitionKey.with_obj(objs[50].id)]),
+        search_qks=QueryKeys(qks=[]),
+    )
+    assert res.ok() == []
+    assert queries == ["aggregate"]
+
+
+def test_mongo_store_partition_permission_sets_converted(
+    root_verify_key: SyftVerifyKey,
+    guest_verify_key: SyftVerifyKey,
+    mongo_store_partition: MongoStorePartition,
+) -> None:
+    res = mongo_store_partition.init_store()
+    assert res.is_ok()
+
+    obj = MockSyftObject(data=1)
+    mongo_store_partition.set(root_verify_key, obj)
+    # permissions written before they were stored as arrays
+    permission_strings = {
+        ActionObjectREAD(uid=obj.id, credentials=root_verify_key).permission_string,
+        ActionObjectREAD(uid=obj.id, credentials=guest_verify_key).permission_string,
+    }
+    mongo_store_partition._permissions.update_one(
+        {"_id": obj.id}, {"$set": {"permissions": permission_strings}}
+    )
+    assert mongo_store_partition.all(guest_verify_key).ok() == []
+
+    res = mongo_store_partition.init_store()
+    assert res.is_ok()
+    assert mongo_store_partition.all(guest_verify_key).ok() == [obj]
+    assert mongo_store_partition._get_permissions_for_uid(obj.id).ok() == (
+        permission_strings
+    )
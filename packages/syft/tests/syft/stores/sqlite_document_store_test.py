@@ -1,18 +1,36 @@
 # stdlib
+import sqlite3
 from threading import Thread
 
 # third party
 import pytest
+from result import Err
 
 # syft absolute
+from syft.node.credentials import SyftSigningKey
+from syft.service.action.action_permissions import ActionObjectPermission
+from syft.service.action.action_permissions import ActionObjectREAD
+from syft.service.action.action_permissions import ActionObjectWRITE
+from syft.service.action.action_permissions import ActionPermission
+from syft.store.document_store import PartitionKey
 from syft.store.document_store import QueryKeys
+from syft.store.sqlite_document_store import SQLiteBackingStore
+from syft.store.sqlite_document_store import SQLiteIndexStore
 from syft.store.sqlite_document_store import SQLiteStorePartition
+from syft.store.sqlite_document_store import _index_value
 
 # relative
 from .store_fixtures_test import sqlite_store_partition_fn
+from .store_mocks_test import MockUnionObject
 from .store_mocks_test import MockObjectType
+from .store_mocks_test import MockSearchableObject
 from .store_mocks_test import MockSyftObject
 
+NamePartitionKey = PartitionKey(key="name", type_=str)
+DescPartitionKey = PartitionKey(key="desc", type_=str)
+TagsPartitionKey = PartitionKey(key="tags", type_=list[str])
+DataPartitionKey = PartitionKey(key="data", type_=bool | int)
+
 
 def test_sqlite_store_partition_sanity(
     sqlite_store_partition: SQLiteStorePartition,
@@ -518,3 +536,451 @@ def test_sqlite_store_partition_set_delete_threading(
 #         ).ok()
 #     )
 #     assert stored_cnt == 0
+
+
+def test_sqlite_store_partition_index_tables(root_verify_key, sqlite_workspace) -> None:
+    store = sqlite_store_partition_fn(
+        root_verify_key, sqlite_workspace, object_type=MockSearchableObject
+    )
+    first = MockSearchableObject(name="first", desc="shared", tags=["a", "b"])
+    second = MockSearchableObject(name="second", desc="shared", tags=["c"])
+    for obj in [first, second]:
+        assert store.set(root_verify_key, obj).is_ok()
+
+    def find(index_qks: tuple = (), search_qks: tuple = ()) -> set:
+        res = store.find_index_or_search_keys(
+            root_verify_key, QueryKeys(qks=index_qks), QueryKeys(qks=search_qks)
+        )
+        return {obj.id for obj in res.ok()}
+
+    # one row per key and object instead of one serialized dict per key
+    assert len(store.unique_keys) == 4
+    assert len(store.searchable_keys) == 4
+    # and one row per item of a list key
+    assert len(store.searchable_items) == 3
+    assert find([NamePartitionKey.with_obj("first")]) == {first.id}
+    assert find(search_qks=[DescPartitionKey.with_obj("shared")]) == {
+        first.id,
+        second.id,
+    }
+    assert find(search_qks=[TagsPartitionKey.with_obj(["b", "c"])]) == {
+        first.id,
+        second.id,
+    }
+
+    # duplicate unique key
+    assert store.set(
+        root_verify_key, MockSearchableObject(name="first", desc="")
+    ).is_err()
+
+    # an update replaces the keys of the object
+    qk = store.settings.store_key.with_obj(first)
+    updated = MockSearchableObject(id=first.id, name="renamed", desc="other")
+    assert store.update(root_verify_key, qk, updated).is_ok()
+    assert find([NamePartitionKey.with_obj("first")]) == set()
+    assert find(search_qks=[DescPartitionKey.with_obj("shared")]) == {second.id}
+    assert store.set(
+        root_verify_key, MockSearchableObject(name="first", desc="")
+    ).is_ok()
+
+    # deleting an object keeps the keys of other objects with the same values
+    updated = MockSearchableObject(id=first.id, name="renamed", desc="shared")
+    assert store.update(root_verify_key, qk, updated).is_ok()
+    assert store.delete(root_verify_key, qk).is_ok()
+    assert find(search_qks=[DescPartitionKey.with_obj("shared")]) == {second.id}
+    assert find([NamePartitionKey.with_obj("renamed")]) == set()
+
+
+def test_sqlite_store_partition_legacy_index(root_verify_key, sqlite_workspace) -> None:
+    store = sqlite_store_partition_fn(
+        root_verify_key, sqlite_workspace, object_type=MockSearchableObject
+    )
+    obj = MockSearchableObject(name="legacy", desc="old")
+    assert store.set(root_verify_key, obj).is_ok()
+
+    # recreate the index as it was stored before, one serialized dict per key
+    unique_keys = SQLiteBackingStore("unique_keys", store.settings, store.store_config)
+    unique_keys["id"] = {obj.id: obj.id}
+    unique_keys["name"] = {"legacy": obj.id}
+    searchable_keys = SQLiteBackingStore(
+        "searchable_keys", store.settings, store.store_config
+    )
+    searchable_keys["desc"] = {"old": [obj.id]}
+    store.unique_keys._execute(f"drop table {store.unique_keys.table_name}")
+    store.searchable_keys._execute(f"drop table {store.searchable_keys.table_name}")
+
+    store = sqlite_store_partition_fn(
+        root_verify_key, sqlite_workspace, object_type=MockSearchableObject
+    )
+    res = store.find_index_or_search_keys(
+        root_verify_key,
+        QueryKeys(qks=[NamePartitionKey.with_obj("legacy")]),
+        QueryKeys(qks=[DescPartitionKey.with_obj("old")]),
+    )
+    assert res.ok() == [obj]
+    legacy_tables = store.data._execute(
+        "select name from sqlite_master where name = ?", [unique_keys.table_name]
+    )
+    assert legacy_tables.ok().fetchall() == []
+
+
+def test_sqlite_store_partition_legacy_search_items(
+    root_verify_key, sqlite_workspace
+) -> None:
+    store = sqlite_store_partition_fn(
+        root_verify_key, sqlite_workspace, object_type=MockSearchableObject
+    )
+    obj = MockSearchableObject(name="legacy", desc="old", tags=["ab", "c"])
+    assert store.set(root_verify_key, obj).is_ok()
+
+    # list keys used to be indexed as the joined string of their items
+    store.searchable_keys.add("tags", "ab c", obj.id)
+    store.searchable_items._execute(f"drop table {store.searchable_items.table_name}")
+
+    store = sqlite_store_partition_fn(
+        root_verify_key, sqlite_workspace, object_type=MockSearchableObject
+    )
+    assert len(store.searchable_keys) == 2
+    assert len(store.searchable_items) == 2
+    for items, expected in [(["c"], [obj]), (["a"], []), (["ab c"], [])]:
+        res = store.find_index_or_search_keys(
+            root_verify_key,
+            QueryKeys(qks=[]),
+            QueryKeys(qks=[TagsPartitionKey.with_obj(items)]),
+        )
+        assert res.ok() == expected
+
+
+def test_sqlite_store_partition_index_values(root_verify_key, sqlite_workspace) -> None:
+    # stable plain values instead of the serialized form
+    assert _index_value("name") == "name"
+    assert _index_value(ActionPermission.READ) == ActionPermission.READ.value
+    assert _index_value(root_verify_key) == root_verify_key.verify
+
+    store = sqlite_store_partition_fn(
+        root_verify_key, sqlite_workspace, object_type=MockSearchableObject
+    )
+    obj = MockSearchableObject(name="plain", desc="text")
+    assert store.set(root_verify_key, obj).is_ok()
+    rows = store.unique_keys._execute(
+        f"select key_name, key_value from {store.unique_keys.table_name}"  # nosec
+    )
+    assert set(rows.ok().fetchall()) == {("id", str(obj.id)), ("name", "plain")}
+
+    # an index of the older format is dropped and built again from the data
+    outdated = SQLiteIndexStore(
+        "unique_index", store.settings, store.store_config, unique=True
+    )
+    outdated._execute(
+        f"insert into {outdated.table_name} values (?, ?, ?)",  # nosec
+        ["name", b"stale", str(obj.id)],
+    )
+    store.unique_keys._execute(f"drop table {store.unique_keys.table_name}")
+
+    store = sqlite_store_partition_fn(
+        root_verify_key, sqlite_workspace, object_type=MockSearchableObject
+    )
+    assert len(store.unique_keys) == 2
+    res = store.find_index_or_search_keys(
+        root_verify_key,
+        QueryKeys(qks=[NamePartitionKey.with_obj("plain")]),
+        QueryKeys(qks=[]),
+    )
+    assert res.ok() == [obj]
+    outdated_tables = store.data._execute(
+        "select name from sqlite_master where name = ?", [outdated.table_name]
+    )
+    assert outdated_tables.ok().fetchall() == []
+
+
+def test_sqlite_store_partition_bool_index_values(
+    root_verify_key, sqlite_workspace
+) -> None:
+    # bools don't share the index entries of the equal ints
+    assert _index_value(1) == 1
+    assert _index_value(True) != _index_value(1)
+    assert _index_value(False) != _index_value(0)
+
+    store = sqlite_store_partition_fn(
+        root_verify_key, sqlite_workspace, object_type=MockUnionObject
+    )
+    objs = [MockUnionObject(data=data) for data in [True, 1, False, 0]]
+    for obj in objs:
+        assert store.set(root_verify_key, obj).is_ok()
+    for obj in objs:
+        res = store.find_index_or_search_keys(
+            root_verify_key,
+            QueryKeys(qks=[]),
+            QueryKeys(qks=[DataPartitionKey.with_obj(obj.data)]),
+        )
+        assert res.ok() == [obj]
+
+
+def test_sqlite_store_partition_bulk(root_verify_key, sqlite_workspace) -> None:
+    store = sqlite_store_partition_fn(
+        root_verify_key, sqlite_workspace, object_type=MockSearchableObject
+    )
+    objs = [MockSearchableObject(name=f"obj_{idx}", desc="bulk") for idx in range(5)]
+    assert store.set(root_verify_key, objs[0]).is_ok()
+
+    # one result per object, in order
+    duplicate = MockSearchableObject(name="obj_1", desc="")
+    res = store.set_many(root_verify_key, objs + [duplicate])
+    assert res.is_ok()
+    results = res.ok()
+    assert [r.is_ok() for r in results] == [False, True, True, True, True, False]
+    assert len(store.all(root_verify_key).ok()) == 5
+    res = store.set_many(root_verify_key, objs[:2], ignore_duplicates=True)
+    assert all(r.is_ok() for r in res.ok())
+
+    updated = [
+        MockSearchableObject(id=obj.id, name=obj.name, desc="updated")
+        for obj in objs[:3]
+    ]
+    missing = MockSearchableObject(name="missing", desc="")
+    results = store.update_many(root_verify_key, updated + [missing]).ok()
+    assert [r.is_ok() for r in results] == [True, True, True, False]
+    found = store.find_index_or_search_keys(
+        root_verify_key,
+        QueryKeys(qks=[]),
+        QueryKeys(qks=[DescPartitionKey.with_obj("updated")]),
+    )
+    assert {obj.id for obj in found.ok()} == {obj.id for obj in objs[:3]}
+
+    qks = [store.settings.store_key.with_obj(obj) for obj in objs[:2] + [missing]]
+    results = store.delete_many(root_verify_key, qks).ok()
+    assert [r.is_ok() for r in results] == [True, True, False]
+    assert {obj.id for obj in store.all(root_verify_key).ok()} == {
+        obj.id for obj in objs[2:]
+    }
+    # name and desc, the tags are empty
+    assert len(store.searchable_keys) == 3 * 2
+    assert len(store.searchable_items) == 0
+
+
+def test_sqlite_store_partition_bulk_rollback(
+    root_verify_key, sqlite_workspace, monkeypatch
+) -> None:
+    store = sqlite_store_partition_fn(root_verify_key, sqlite_workspace)
+    objs = [MockSyftObject(data=idx) for idx in range(3)]
+
+    set_obj = store._set
+
+    def failing_set(credentials, obj, **kwargs):
+        # fail after the first objects of the batch were written
+        if obj is objs[-1]:
+            raise RuntimeError("disk full")
+        return set_obj(credentials, obj, **kwargs)
+
+    monkeypatch.setattr(store, "_set", failing_set)
+    with pytest.raises(RuntimeError):
+        store._set_many(root_verify_key, objs)
+    monkeypatch.undo()
+
+    # nothing of the failed batch was committed
+    assert store.all(root_verify_key).ok() == []
+    assert all(r.is_ok() for r in store.set_many(root_verify_key, objs).ok())
+    assert len(store.all(root_verify_key).ok()) == 3
+
+
+def test_sqlite_store_partition_connection_pool(
+    root_verify_key, sqlite_workspace
+) -> None:
+    store = sqlite_store_partition_fn(root_verify_key, sqlite_workspace)
+    pool = store.data.pool
+    # all backing stores of a file share the pool
+    assert store.unique_keys.pool is pool
+
+    obj = MockSyftObject(data=1)
+    readers = {}
+    seen = {}
+
+    def read(name: str) -> None:
+        readers[name] = pool.reader
+        seen[name] = obj.id in store.data
+
+    with store.data.transaction():
+        store.data[obj.id] = obj
+        read("transaction")
+        # other threads read committed data through their own connection
+        thread = Thread(target=read, args=("thread",))
+        thread.start()
+        thread.join()
+    read("committed")
+
+    assert seen == {"transaction": True, "thread": False, "committed": True}
+    assert readers["transaction"] is pool.writer
+    assert readers["thread"] is not readers["committed"]
+    assert readers["committed"] is not pool.writer
+    # readers can't write
+    with pytest.raises(sqlite3.OperationalError):
+        pool.reader.execute(f"delete from {store.data.table_name}")
+
+
+def test_sqlite_store_partition_commit_per_write(
+    root_verify_key, sqlite_workspace
+) -> None:
+    store = sqlite_store_partition_fn(root_verify_key, sqlite_workspace)
+    statements = []
+    store.data.db.set_trace_callback(statements.append)
+
+    # the data, keys and permissions of a write are committed together
+    obj = MockSyftObject(data=1)
+    assert store.set(root_verify_key, obj).is_ok()
+    qk = store.settings.store_key.with_obj(obj)
+    assert store.update(root_verify_key, qk, MockSyftObject(id=obj.id, data=2)).is_ok()
+    assert store.delete(root_verify_key, qk).is_ok()
+    store.data.db.set_trace_callback(None)
+    assert statements.count("COMMIT") == 3
+
+    # reads don't go through the writer
+    statements.clear()
+    store.all(root_verify_key)
+    assert statements == []
+
+
+def test_sqlite_backing_store_iter_keys(root_verify_key, sqlite_workspace) -> None:
+    store = sqlite_store_partition_fn(root_verify_key, sqlite_workspace)
+    objs = [MockSyftObject(data=idx) for idx in range(5)]
+    for obj in objs:
+        store.data[obj.id] = obj
+
+    keys = store.data.iter_keys(batch_size=2)
+    assert [next(keys), next(keys)] == [obj.id for obj in objs[:2]]
+    # batches are read when they are reached, not from a snapshot of the
+    # first batch
+    del store.data[objs[4].id]
+    assert list(keys) == [obj.id for obj in objs[2:4]]
+
+
+def test_sqlite_backing_store_upsert(root_verify_key, sqlite_workspace) -> None:
+    store = sqlite_store_partition_fn(root_verify_key, sqlite_workspace)
+    obj = MockSyftObject(data=1)
+    store.data[obj.id] = obj
+    sqltime_sql = f"select sqltime from {store.data.table_name} where uid = ?"  # nosec
+    sqltime = store.data._query(sqltime_sql, [str(obj.id)]).ok().fetchone()
+
+    store.data[obj.id] = MockSyftObject(id=obj.id, data=2)
+    assert len(store.data) == 1
+    assert store.data[obj.id].data == 2
+    # the row is updated in place and keeps its position in the ordering
+    assert store.data._query(sqltime_sql, [str(obj.id)]).ok().fetchone() == sqltime
+
+
+def test_sqlite_store_partition_read_error(
+    root_verify_key, sqlite_workspace, monkeypatch
+) -> None:
+    store = sqlite_store_partition_fn(root_verify_key, sqlite_workspace)
+    obj = MockSyftObject(data=1)
+    assert store.set(root_verify_key, obj).is_ok()
+    batches = store.iter_all(root_verify_key).ok()
+
+    monkeypatch.setattr(store.data, "_query", lambda *args: Err("read failed"))
+
+    # a failed read is an error, not an empty result
+    res = store.all(root_verify_key)
+    assert res.is_err()
+    assert "read failed" in res.err()
+    with pytest.raises(ValueError, match="read failed"):
+        list(batches)
+
+
+def test_sqlite_store_partition_permission_rows(
+    root_verify_key, sqlite_workspace
+) -> None:
+    store = sqlite_store_partition_fn(root_verify_key, sqlite_workspace)
+    guest_key = SyftSigningKey.generate().verify_key
+    objs = [MockSyftObject(data=idx) for idx in range(4)]
+    for obj in objs:
+        assert store.set(root_verify_key, obj).is_ok()
+    store.add_permission(ActionObjectREAD(uid=objs[0].id, credentials=guest_key))
+    store.add_permission(ActionObjectWRITE(uid=objs[1].id, credentials=guest_key))
+    store.add_permission(ActionObjectPermission(objs[2].id, ActionPermission.ALL_READ))
+
+    # one row per permission, the owner gets four per object, and one row per
+    # object without a permission
+    count_sql = f"select count(*) from {store.permissions.table_name}"  # nosec
+    assert store.permissions._query(count_sql).ok().fetchone()[0] == 23
+    assert store.permissions[objs[0].id] == {
+        f"{root_verify_key.verify}_{permission.name}"
+        for permission in [
+            ActionPermission.OWNER,
+            ActionPermission.READ,
+            ActionPermission.WRITE,
+            ActionPermission.EXECUTE,
+        ]
+    } | {f"{guest_key.verify}_READ"}
+    assert store.has_permission(ActionObjectREAD(uid=objs[2].id, credentials=guest_key))
+
+    uids = [obj.id for obj in objs]
+    assert store.filter_permitted(guest_key, uids, ActionPermission.READ) == [
+        objs[0].id,
+        objs[2].id,
+    ]
+    assert store.filter_permitted(guest_key, uids, ActionPermission.WRITE) == [
+        objs[1].id
+    ]
+    assert store.filter_permitted(root_verify_key, uids, ActionPermission.OWNER) == uids
+    # without credentials only the objects everyone can read
+    assert store.filter_permitted(None, uids, ActionPermission.READ) == [objs[2].id]
+    assert store.all(None).ok() == [objs[2]]
+    assert {obj.id for obj in store.all(guest_key).ok()} == {objs[0].id, objs[2].id}
+    assert store.count(guest_key, QueryKeys(qks=[]), QueryKeys(qks=[])).ok() == 2
+
+    store.remove_permission(ActionObjectREAD(uid=objs[0].id, credentials=guest_key))
+    assert store.filter_permitted(guest_key, uids, ActionPermission.READ) == [
+        objs[2].id
+    ]
+    assert store.delete(root_verify_key, store.store_query_key(objs[2])).is_ok()
+    assert objs[2].id not in store.permissions
+    assert len(store.permissions) == 3
+
+
+def test_sqlite_store_partition_no_permissions(
+    root_verify_key, sqlite_workspace
+) -> None:
+    store = sqlite_store_partition_fn(root_verify_key, sqlite_workspace)
+    obj = MockSyftObject(data=1)
+    assert store.set(root_verify_key, obj).is_ok()
+
+    # an object whose permissions were all removed still has an empty set
+    for permission in list(store.permissions[obj.id]):
+        store.permissions.remove_items(obj.id, [permission])
+    assert obj.id in store.permissions
+    assert store._get_permissions_for_uid(obj.id).ok() == set()
+    assert store.permissions.get_many([obj.id]) == {obj.id: set()}
+
+    store.permissions[obj.id] = set()
+    assert store._get_permissions_for_uid(obj.id).ok() == set()
+    assert len(store.permissions) == 1
+    assert (
+        store.filter_permitted(
+            SyftSigningKey.generate().verify_key, [obj.id], ActionPermission.READ
+        )
+        == []
+    )
+
+    del store.permissions[obj.id]
+    assert obj.id not in store.permissions
+
+
+def test_sqlite_store_partition_legacy_permissions(
+    root_verify_key, sqlite_workspace
+) -> None:
+    store = sqlite_store_partition_fn(root_verify_key, sqlite_workspace)
+    guest_key = SyftSigningKey.generate().verify_key
+    obj = MockSyftObject(data=1)
+    assert store.set(root_verify_key, obj).is_ok()
+
+    # recreate the permissions as they were stored before, one set per uid
+    legacy = SQLiteBackingStore("permissions", store.settings, store.store_config)
+    legacy[obj.id] = {f"{guest_key.verify}_READ", "ALL_EXECUTE"}
+    store.permissions._execute(f"drop table {store.permissions.table_name}")
+
+    store = sqlite_store_partition_fn(root_verify_key, sqlite_workspace)
+    assert store.permissions[obj.id] == {f"{guest_key.verify}_READ", "ALL_EXECUTE"}
+    assert store.all(guest_key).ok() == [obj]
+    legacy_tables = store.data._execute(
+        "select name from sqlite_master where name = ?", [legacy.table_name]
+    )
+    assert legacy_tables.ok().fetchall() == []
@@ -78,6 +78,7 @@ def sqlite_store_partition_fn(
     root_verify_key,
     sqlite_workspace: tuple[Path, str],
     locking_config_name: str = "nop",
+    object_type: type = MockObjectType,
 ):
     workspace, db_name = sqlite_workspace
     sqlite_config = SQLiteStoreClientConfig(filename=db_name, path=workspace)
@@ -87,7 +88,7 @@ def sqlite_store_partition_fn(
         client_config=sqlite_config, locking_config=locking_config
     )
 
-    settings = PartitionSettings(name="test", object_type=MockObjectType)
+    settings = PartitionSettings(name="test", object_type=object_type)
 
     store = SQLiteStorePartition(
         UID(), root_verify_key, settings=settings, store_config=store_config
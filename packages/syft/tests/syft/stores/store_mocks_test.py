@@ -61,6 +61,25 @@ class MockSyftObject(SyftObject):
     data: Any
 
 
+@serializable()
+class MockSearchableObject(SyftObject):
+    __canonical_name__ = "MockSearchableObject"
+    name: str
+    desc: str
+    tags: list[str] = []
+
+    __attr_searchable__ = ["name", "desc", "tags"]
+    __attr_unique__ = ["name"]
+
+
+@serializable()
+class MockUnionObject(SyftObject):
+    __canonical_name__ = "MockUnionObject"
+    data: bool | int
+
+    __attr_searchable__ = ["data"]
+
+
 @serializable()
 class MockStoreConfig(StoreConfig):
     __canonical_name__ = "MockStoreConfig"
@@ -109,6 +109,28 @@ def test_read_returns_view(root_client):
         assert isinstance(root_client.api.services.user[0], UserView)
 
 
+def test_user_get_all_paged(worker, root_client) -> None:
+    for _ in range(4):
+        get_mock_client(worker.root_client, ServiceRole.DATA_SCIENTIST)
+    users = root_client.api.services.user.get_all()
+    assert len(users) >= 6
+
+    pages = [
+        root_client.api.services.user.get_all(page_size=4, page_index=page_index)
+        for page_index in range(len(users) // 4 + 1)
+    ]
+    assert all(page.total == len(users) for page in pages)
+    assert [user.id for page in pages for user in page.users] == [
+        user.id for user in users
+    ]
+
+    page = root_client.api.services.user.search(
+        name=users[2].name, page_size=4, page_index=0
+    )
+    assert page.total == 1
+    assert [user.id for user in page.users] == [users[2].id]
+
+
 def test_user_create(worker, do_client, guest_client, ds_client, root_client):
     for client in [ds_client, guest_client]:
         assert not manually_call_service(worker, client, "user.create")
@@ -6,6 +6,7 @@ from typing import Any
 from nacl.exceptions import BadSignatureError
 import numpy as np
 import pytest
+from result import Err
 from result import Ok
 
 # syft absolute
@@ -359,3 +360,26 @@ def test_worker_handle_api_response(
         assert isinstance(result, QueueItem)
     else:
         assert not isinstance(result, SyftError)
+
+
+def test_worker_migration_error(worker: Worker, monkeypatch: Any) -> None:
+    partitions = worker.document_store.partitions
+    failing = partitions[User.__canonical_name__]
+    other = next(p for p in partitions.values() if p is not failing)
+    pending = [failing.settings.object_type, other.settings.object_type]
+    monkeypatch.setattr(
+        worker,
+        "_find_klasses_pending_for_migration",
+        lambda object_types: [t for t in pending if t in object_types],
+    )
+
+    migrated = []
+    monkeypatch.setattr(failing, "migrate_data", lambda **kwargs: Err("broken row"))
+    monkeypatch.setattr(
+        other, "migrate_data", lambda **kwargs: migrated.append(kwargs) or Ok(True)
+    )
+
+    # the first failing partition fails the migration, with its name
+    with pytest.raises(Exception, match=f"{User.__canonical_name__}.*broken row"):
+        worker.find_and_migrate_data()
+    assert migrated == []